@@ -0,0 +1 @@
+"""Benchmarks for the algorithm engines, see benchmarks.engines"""
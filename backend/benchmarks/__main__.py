@@ -0,0 +1,5 @@
+import sys
+
+from benchmarks.engines import main
+
+sys.exit(main())
@@ -0,0 +1,402 @@
+"""
+Benchmarks for every function exported from core.algorithm_engine
+
+Each case runs one function on one input size and distribution and records:
+    seconds      best wall time over the repeats, consuming every step
+    peak_bytes   peak memory allocated while running (tracemalloc)
+    steps        number of steps yielded (traced functions only)
+    trace_bytes  compact JSON size of the steps per trace format (engines only;
+                 iter_algorithm_steps yields the same frames)
+
+Usage (from the backend directory):
+    python -m benchmarks run [--output FILE]          run and print or save results
+    python -m benchmarks compare BASELINE CURRENT     compare two result files
+    python -m benchmarks check [--baseline FILE]      run and compare against the stored baseline
+
+`compare` and `check` exit with status 1 if any metric grew by more than the
+threshold (default 25%), or if a case has no entry in the baseline. Timings
+depend on the machine, so refresh the baseline with `run --output` when moving
+to different hardware, and whenever cases are added.
+"""
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
+from collections import Counter
+from datetime import datetime
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from core.algorithm_engine import (
+    bubble_sort, quick_sort, merge_sort, selection_sort, insertion_sort,
+    heap_sort, shell_sort, counting_sort, radix_sort, intro_sort, tim_sort,
+    linear_search, binary_search, iter_algorithm_steps, run_algorithm_counts, algorithm_types
+)
+from core.algorithm_engine.trace import TRACE_FORMATS, encode_steps
+
+
+SIZES = (16, 64, 128)
+DISTRIBUTIONS = ("random", "sorted", "reversed", "few_unique")
+REPEATS = 3
+SEED = 0
+THRESHOLD = 0.25
+
+# Timings below this are dominated by noise and are never reported as regressions
+MIN_SECONDS = 0.001
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "engines.json")
+
+ALGORITHM_TYPES = algorithm_types()
+
+ENGINES: Dict[str, Callable[[List[int], Optional[int]], Iterable]] = {
+    "bubble_sort": lambda arr, target: bubble_sort(arr),
+    "bubble_sort[early_exit]": lambda arr, target: bubble_sort(arr, variant="early_exit"),
+    "bubble_sort[cocktail]": lambda arr, target: bubble_sort(arr, variant="cocktail"),
+    "quick_sort": lambda arr, target: quick_sort(arr),
+    "quick_sort[median3]": lambda arr, target: quick_sort(arr, pivot="median3"),
+    "quick_sort[ninther]": lambda arr, target: quick_sort(arr, pivot="ninther"),
+    "quick_sort[random]": lambda arr, target: quick_sort(arr, pivot="random"),
+    "quick_sort[three_way]": lambda arr, target: quick_sort(arr, variant="three_way"),
+    "merge_sort": lambda arr, target: merge_sort(arr),
+    "merge_sort[bottom_up]": lambda arr, target: merge_sort(arr, variant="bottom_up"),
+    "selection_sort": lambda arr, target: selection_sort(arr),
+    "insertion_sort": lambda arr, target: insertion_sort(arr),
+    "insertion_sort[binary]": lambda arr, target: insertion_sort(arr, variant="binary"),
+    "heap_sort": lambda arr, target: heap_sort(arr),
+    "shell_sort": lambda arr, target: shell_sort(arr),
+    "shell_sort[knuth]": lambda arr, target: shell_sort(arr, variant="knuth"),
+    "shell_sort[ciura]": lambda arr, target: shell_sort(arr, variant="ciura"),
+    "counting_sort": lambda arr, target: counting_sort(arr),
+    "radix_sort": lambda arr, target: radix_sort(arr),
+    "intro_sort": lambda arr, target: intro_sort(arr),
+    "tim_sort": lambda arr, target: tim_sort(arr),
+    "linear_search": linear_search,
+    "binary_search": binary_search,
+}
+
+
+def generate_input(distribution: str, n: int, rng: random.Random) -> List[int]:
+    """
+    Build a benchmark input array
+
+    Args:
+        distribution: One of DISTRIBUTIONS
+        n: Array size
+        rng: Random number generator
+
+    Returns:
+        List of integers
+    """
+    if distribution == "few_unique":
+        return [rng.randint(0, 3) for _ in range(n)]
+    values = [rng.randint(0, 10 * n) for _ in range(n)]
+    if distribution == "sorted":
+        values.sort()
+    elif distribution == "reversed":
+        values.sort(reverse=True)
+    return values
+
+
+def benchmark_cases() -> List[Tuple[str, Callable[[List[int], Optional[int]], Any], bool, bool]]:
+    """
+    List every benchmarked function
+
+    Returns:
+        Tuples of case name, function taking (array, target), whether it yields
+        steps, and whether to measure the serialized trace size
+    """
+    cases = [(name, engine, True, True) for name, engine in ENGINES.items()]
+    for algorithm_type in ALGORITHM_TYPES:
+        cases.append((
+            f"iter_algorithm_steps[{algorithm_type}]",
+            lambda arr, target, algorithm_type=algorithm_type: iter_algorithm_steps(algorithm_type, arr, target),
+            True,
+            False
+        ))
+    for algorithm_type in ALGORITHM_TYPES:
+        cases.append((
+            f"run_algorithm_counts[{algorithm_type}]",
+            lambda arr, target, algorithm_type=algorithm_type: run_algorithm_counts(algorithm_type, arr, target),
+            False,
+            False
+        ))
+    return cases
+
+
+def _consume(result: Any, traced: bool) -> Any:
+    return list(result) if traced else result
+
+
+def trace_size(frames: List[Any], trace_format: str) -> int:
+    """
+    Size of the compact JSON array of encoded steps, without building the whole string
+
+    Args:
+        frames: Frames as produced by an engine
+        trace_format: One of TRACE_FORMATS
+
+    Returns:
+        Size in bytes
+    """
+    size = 2 + max(len(frames) - 1, 0)
+    for step in encode_steps(frames, trace_format):
+        size += len(json.dumps(step, separators=(",", ":")))
+    return size
+
+
+def measure(
+    function: Callable,
+    array: List[int],
+    target: Optional[int],
+    traced: bool,
+    serialized: bool,
+    repeats: int
+) -> Dict[str, Any]:
+    """
+    Measure a single benchmark case
+
+    Args:
+        function: Function taking (array, target)
+        array: Input array
+        target: Search target
+        traced: Whether the function yields steps
+        serialized: Whether to measure the serialized trace size
+        repeats: Number of timed runs; the fastest is kept
+
+    Returns:
+        Dictionary of metrics
+    """
+    seconds = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        _consume(function(array, target), traced)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    # Memory is measured in a separate run since tracing allocations slows it down
+    tracemalloc.start()
+    try:
+        result = _consume(function(array, target), traced)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    metrics = {"seconds": seconds, "peak_bytes": peak_bytes}
+    if traced:
+        metrics["steps"] = len(result)
+    if serialized:
+        metrics["trace_bytes"] = {
+            trace_format: trace_size(result, trace_format) for trace_format in TRACE_FORMATS
+        }
+    return metrics
+
+
+def run_benchmarks(
+    sizes: Iterable[int] = SIZES,
+    distributions: Iterable[str] = DISTRIBUTIONS,
+    repeats: int = REPEATS,
+    only: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run the benchmark suite
+
+    Args:
+        sizes: Input sizes
+        distributions: Input distributions
+        repeats: Timed runs per case
+        only: If set, only run cases whose name contains this string
+
+    Returns:
+        Dictionary with run metadata and results keyed by "case/distribution/size"
+    """
+    results = {}
+    for name, function, traced, serialized in benchmark_cases():
+        if only and only not in name:
+            continue
+        for distribution in distributions:
+            for n in sizes:
+                # Every case sees the same input for a given distribution and size
+                rng = random.Random(f"{SEED}/{distribution}/{n}")
+                array = generate_input(distribution, n, rng)
+                target = rng.choice(array)
+                results[f"{name}/{distribution}/{n}"] = measure(function, array, target, traced, serialized, repeats)
+
+    return {
+        "meta": {
+            "created": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+            "distributions": list(distributions),
+            "repeats": repeats,
+        },
+        "results": results
+    }
+
+
+def _flatten(metrics: Dict[str, Any]) -> Dict[str, float]:
+    flat = {}
+    for key, value in metrics.items():
+        if isinstance(value, dict):
+            for inner_key, inner_value in value.items():
+                flat[f"{key}.{inner_key}"] = inner_value
+        else:
+            flat[key] = value
+    return flat
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = THRESHOLD,
+    min_seconds: float = MIN_SECONDS
+) -> List[Dict[str, Any]]:
+    """
+    Find metrics that grew by more than the threshold
+
+    Cases missing from either side are skipped; see missing_cases.
+
+    Args:
+        baseline: Results of run_benchmarks to compare against
+        current: Results of run_benchmarks to check
+        threshold: Allowed relative growth, e.g. 0.25 for 25%
+        min_seconds: Timings where both sides are below this are ignored
+
+    Returns:
+        One dictionary per regression with case, metric, baseline, current and ratio
+    """
+    regressions = []
+    for case, current_metrics in current["results"].items():
+        baseline_metrics = baseline["results"].get(case)
+        if baseline_metrics is None:
+            continue
+        before = _flatten(baseline_metrics)
+        for metric, value in _flatten(current_metrics).items():
+            previous = before.get(metric)
+            if previous is None:
+                continue
+            if metric == "seconds" and max(previous, value) < min_seconds:
+                continue
+            ratio = value / previous if previous else (float("inf") if value else 1.0)
+            if ratio > 1 + threshold:
+                regressions.append({
+                    "case": case,
+                    "metric": metric,
+                    "baseline": previous,
+                    "current": value,
+                    "ratio": ratio
+                })
+    return regressions
+
+
+def missing_cases(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """
+    Find cases that were run but have no baseline to compare against
+
+    Args:
+        baseline: Results of run_benchmarks to compare against
+        current: Results of run_benchmarks to check
+
+    Returns:
+        Case names in the order they were run
+    """
+    return [case for case in current["results"] if case not in baseline["results"]]
+
+
+def _print_results(report: Dict[str, Any]):
+    print(f"{'case':<52} {'seconds':>10} {'peak KiB':>10} {'steps':>8} {'columnar KiB':>13}")
+    for case, metrics in report["results"].items():
+        columnar = metrics.get("trace_bytes", {}).get("columnar")
+        print(
+            f"{case:<52} {metrics['seconds']:>10.5f} {metrics['peak_bytes'] / 1024:>10.1f} "
+            f"{metrics.get('steps', '-'):>8} {f'{columnar / 1024:.1f}' if columnar is not None else '-':>13}"
+        )
+
+
+def _print_regressions(regressions: List[Dict[str, Any]], threshold: float, missing: List[str]) -> int:
+    if missing:
+        # One line per benchmarked function rather than per distribution and size
+        names = Counter(case.split("/")[0] for case in missing)
+        print(f"{len(missing)} case(s) missing from the baseline, refresh it with `run --output`:")
+        for name, count in names.items():
+            print(f"  {name} ({count} case(s))")
+    if not regressions:
+        print(f"No regressions above {threshold:.0%}")
+        return 1 if missing else 0
+    print(f"{len(regressions)} regression(s) above {threshold:.0%}:")
+    for item in regressions:
+        print(f"  {item['case']} {item['metric']}: {item['baseline']:.6g} -> {item['current']:.6g} ({item['ratio']:.2f}x)")
+    return 1
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point
+
+    Args:
+        argv: Command line arguments, sys.argv[1:] if None
+
+    Returns:
+        Process exit status
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Algorithm engine benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_run_options(command: argparse.ArgumentParser):
+        command.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+        command.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+        command.add_argument("--repeats", type=int, default=REPEATS)
+        command.add_argument("--only", help="Only run cases whose name contains this string")
+
+    def add_compare_options(command: argparse.ArgumentParser):
+        command.add_argument("--threshold", type=float, default=THRESHOLD)
+        command.add_argument("--min-seconds", type=float, default=MIN_SECONDS)
+
+    run = commands.add_parser("run", help="Run the benchmarks")
+    add_run_options(run)
+    run.add_argument("--output", help="Write results to this JSON file")
+
+    compare = commands.add_parser("compare", help="Compare two result files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    add_compare_options(compare)
+
+    check = commands.add_parser("check", help="Run the benchmarks and compare against a baseline")
+    add_run_options(check)
+    add_compare_options(check)
+    check.add_argument("--baseline", default=DEFAULT_BASELINE)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        baseline, current = _load(args.baseline), _load(args.current)
+        regressions = compare_results(baseline, current, args.threshold, args.min_seconds)
+        return _print_regressions(regressions, args.threshold, missing_cases(baseline, current))
+
+    report = run_benchmarks(args.sizes, args.distributions, args.repeats, args.only)
+    if args.command == "run":
+        if args.output:
+            os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2)
+                f.write("\n")
+            print(f"Wrote {len(report['results'])} results to {args.output}")
+        else:
+            _print_results(report)
+        return 0
+
+    _print_results(report)
+    baseline = _load(args.baseline)
+    regressions = compare_results(baseline, report, args.threshold, args.min_seconds)
+    return _print_regressions(regressions, args.threshold, missing_cases(baseline, report))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
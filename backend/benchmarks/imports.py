@@ -0,0 +1,112 @@
+"""
+Import-time benchmark of the backend
+
+Imports a module (main by default) in a fresh interpreter with
+`python -X importtime` and reports, for every module imported along the way:
+    self_ms        time spent executing the module itself
+    cumulative_ms  time including the modules it imported
+
+Usage (from the backend directory):
+    python -m benchmarks.imports [--module MODULE] [--top N] [--repeats N] [--output FILE]
+
+The best of `repeats` runs is kept per module, since the first run after a
+change also pays for compiling bytecode.
+"""
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+REPEATS = 3
+TOP = 25
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def parse_importtime(output: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse the stderr of `python -X importtime`
+
+    Args:
+        output: Captured stderr
+
+    Returns:
+        Timings keyed by module name, with self_ms, cumulative_ms and depth
+    """
+    modules = {}
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules[name] = {
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+            "depth": (len(indent) - 1) // 2
+        }
+    return modules
+
+
+def measure_imports(module: str = "main", repeats: int = REPEATS) -> Dict[str, Dict[str, Any]]:
+    """
+    Import a module in fresh interpreters and time every import
+
+    Args:
+        module: Module to import, e.g. main or routers.ai
+        repeats: Number of interpreters; the fastest time per module is kept
+
+    Returns:
+        Timings keyed by module name, as returned by parse_importtime
+    """
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    best: Dict[str, Dict[str, Any]] = {}
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=backend, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+        for name, timing in parse_importtime(result.stderr).items():
+            if name not in best or timing["cumulative_ms"] < best[name]["cumulative_ms"]:
+                best[name] = timing
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point
+
+    Args:
+        argv: Command line arguments, sys.argv[1:] if None
+
+    Returns:
+        Process exit status
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.imports", description="Import-time benchmark")
+    parser.add_argument("--module", default="main", help="Module to import")
+    parser.add_argument("--top", type=int, default=TOP, help="Number of modules to print, by cumulative time")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--output", help="Write all timings to this JSON file")
+    args = parser.parse_args(argv)
+
+    timings = measure_imports(args.module, args.repeats)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"module": args.module, "timings": timings}, f, indent=2)
+            f.write("\n")
+
+    total = timings.get(args.module, {}).get("cumulative_ms", 0.0)
+    print(f"import {args.module}: {total:.1f} ms ({len(timings)} modules)")
+    print(f"{'module':<60} {'self ms':>9} {'cumulative ms':>14}")
+    ranked = sorted(timings.items(), key=lambda item: item[1]["cumulative_ms"], reverse=True)
+    for name, timing in ranked[:args.top]:
+        print(f"{name:<60} {timing['self_ms']:>9.1f} {timing['cumulative_ms']:>14.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
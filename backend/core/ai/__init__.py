@@ -0,0 +1,7 @@
+from .providers import AIProvider, GeminiProvider, FakeProvider, create_provider
+from .assistant import AIAssistant, AIUnavailable, AITimeout, build_prompt, assistant
+
+__all__ = [
+    'AIProvider', 'GeminiProvider', 'FakeProvider', 'create_provider',
+    'AIAssistant', 'AIUnavailable', 'AITimeout', 'build_prompt', 'assistant'
+]
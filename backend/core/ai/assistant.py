@@ -0,0 +1,145 @@
+from typing import AsyncIterator, Optional
+import asyncio
+import os
+
+from dotenv import load_dotenv
+
+from core.algorithm_engine.registry import algorithm_types, get_spec
+from .providers import AIProvider, create_provider
+
+load_dotenv()
+
+
+def _algorithm_names(category: str) -> str:
+    """Names of the registered algorithms of a category, in registration order"""
+    return ", ".join(get_spec(algorithm_type).name for algorithm_type in algorithm_types(category))
+
+
+# The algorithm list comes from the registry, so newly registered algorithms are always mentioned
+SYSTEM_PROMPT = f"""You are an expert Algorithm Learning Assistant. Answer questions about sorting algorithms, search algorithms, time complexity, space complexity, and algorithm design. Keep responses concise and educational.
+
+Available algorithms in the visualizer:
+- Sorting: {_algorithm_names("sorting")}
+- Searching: {_algorithm_names("searching")}
+
+Provide accurate technical explanations and help users understand algorithm concepts."""
+
+
+class AIUnavailable(Exception):
+    """Raised when no provider is configured or all model call slots stay busy"""
+
+
+class AITimeout(Exception):
+    """Raised when a model call does not finish in time"""
+
+
+def build_prompt(user_query: str, context: Optional[str] = None) -> str:
+    """
+    Build the full prompt sent to the model
+
+    Args:
+        user_query: User's question
+        context: Optional context, e.g. the algorithm being viewed
+
+    Returns:
+        System instructions followed by the question
+    """
+    user_prompt = user_query
+    if context:
+        user_prompt = f"Context: Currently viewing {context} algorithm.\n\nQuestion: {user_prompt}"
+    return f"{SYSTEM_PROMPT}\n\n{user_prompt}"
+
+
+class AIAssistant:
+    """
+    Non-blocking access to an AI provider with a timeout and a concurrency cap
+
+    At most `max_concurrency` model calls are outstanding at once; callers wait
+    up to `queue_timeout` seconds for a free slot before AIUnavailable is
+    raised. A call (the whole stream, for streaming) that takes longer than
+    `timeout` seconds raises AITimeout.
+    """
+
+    def __init__(
+        self,
+        provider: Optional[AIProvider],
+        max_concurrency: int = 8,
+        timeout: float = 60.0,
+        queue_timeout: float = 10.0
+    ):
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+    @property
+    def available(self) -> bool:
+        """Whether a provider is configured"""
+        return self.provider is not None
+
+    async def _acquire(self):
+        if self.provider is None:
+            raise AIUnavailable("GEMINI_API_KEY not configured. Please set it in the .env file.")
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise AIUnavailable("Too many AI queries in progress, please try again shortly")
+
+    async def answer(self, user_query: str, context: Optional[str] = None) -> str:
+        """
+        Get a complete answer
+
+        Args:
+            user_query: User's question
+            context: Optional context, e.g. the algorithm being viewed
+
+        Returns:
+            Answer text
+        """
+        await self._acquire()
+        try:
+            return await asyncio.wait_for(self.provider.generate(build_prompt(user_query, context)), self.timeout)
+        except asyncio.TimeoutError:
+            raise AITimeout(f"AI response did not finish within {self.timeout:g} seconds")
+        finally:
+            self._slots.release()
+
+    async def stream(self, user_query: str, context: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Get an answer chunk by chunk as the model produces it
+
+        The model call slot is held until the stream ends or is closed.
+
+        Args:
+            user_query: User's question
+            context: Optional context, e.g. the algorithm being viewed
+
+        Returns:
+            Async iterator over text chunks
+        """
+        await self._acquire()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        chunks = self.provider.stream(build_prompt(user_query, context)).__aiter__()
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), max(deadline - loop.time(), 0))
+                except StopAsyncIteration:
+                    return
+                except asyncio.TimeoutError:
+                    raise AITimeout(f"AI response did not finish within {self.timeout:g} seconds")
+                yield chunk
+        finally:
+            self._slots.release()
+            if hasattr(chunks, "aclose"):
+                await chunks.aclose()
+
+
+assistant = AIAssistant(
+    create_provider(),
+    max_concurrency=int(os.getenv("AI_MAX_CONCURRENCY", 8)),
+    timeout=float(os.getenv("AI_TIMEOUT", 60)),
+    queue_timeout=float(os.getenv("AI_QUEUE_TIMEOUT", 10))
+)
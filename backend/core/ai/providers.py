@@ -0,0 +1,117 @@
+from typing import AsyncIterator, Optional
+import asyncio
+import os
+
+
+DEFAULT_GEMINI_MODEL = "gemini-2.0-flash-exp"
+
+
+class AIProvider:
+    """
+    Source of AI assistant answers
+
+    Providers only implement `stream`, an async iterator over chunks of the
+    answer; `generate` collects the chunks into the full answer.
+    """
+
+    name = "provider"
+
+    def stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Generate an answer chunk by chunk
+
+        Args:
+            prompt: Full prompt including system instructions
+
+        Returns:
+            Async iterator over text chunks
+        """
+        raise NotImplementedError
+
+    async def generate(self, prompt: str) -> str:
+        """
+        Generate a complete answer
+
+        Args:
+            prompt: Full prompt including system instructions
+
+        Returns:
+            Answer text
+        """
+        return "".join([chunk async for chunk in self.stream(prompt)])
+
+
+class GeminiProvider(AIProvider):
+    """
+    Gemini through the async client of the google-genai SDK
+
+    The SDK takes about half a second to import, so it is imported and the
+    client created on the first request rather than at startup.
+    """
+
+    name = "gemini"
+
+    def __init__(self, api_key: str, model: str = DEFAULT_GEMINI_MODEL):
+        self.api_key = api_key
+        self.model = model
+        self._client = None
+
+    @property
+    def client(self):
+        """The genai client, created on first use"""
+        if self._client is None:
+            from google import genai
+            self._client = genai.Client(api_key=self.api_key)
+        return self._client
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        chunks = await self.client.aio.models.generate_content_stream(model=self.model, contents=prompt)
+        async for chunk in chunks:
+            if chunk.text:
+                yield chunk.text
+
+
+class FakeProvider(AIProvider):
+    """
+    Local provider for development and tests
+
+    Answers every prompt with a fixed text, emitted word by word with a
+    configurable delay, without any network access.
+    """
+
+    name = "fake"
+
+    def __init__(self, delay: float = 0.0, answer: Optional[str] = None):
+        self.delay = delay
+        self.answer = answer or (
+            "This is a placeholder answer from the local fake AI provider. "
+            "Set AI_PROVIDER=gemini and GEMINI_API_KEY to get real answers."
+        )
+
+    async def stream(self, prompt: str) -> AsyncIterator[str]:
+        words = self.answer.split(" ")
+        for index, word in enumerate(words):
+            await asyncio.sleep(self.delay)
+            yield word if index == len(words) - 1 else word + " "
+
+
+def create_provider() -> Optional[AIProvider]:
+    """
+    Create the provider selected by the environment
+
+    AI_PROVIDER is "gemini" (the default, requires GEMINI_API_KEY) or "fake"
+    (FAKE_AI_DELAY seconds between words).
+
+    Returns:
+        The provider, or None if Gemini is selected but no API key is set
+    """
+    provider = os.getenv("AI_PROVIDER", "gemini").lower()
+    if provider == "fake":
+        return FakeProvider(delay=float(os.getenv("FAKE_AI_DELAY", 0.05)))
+    if provider != "gemini":
+        raise ValueError(f"Unknown AI provider: {provider}")
+
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        return None
+    return GeminiProvider(api_key, model=os.getenv("GEMINI_MODEL", DEFAULT_GEMINI_MODEL))
@@ -1,5 +1,30 @@
-from .sorting import bubble_sort, quick_sort, merge_sort, selection_sort, insertion_sort
-from .searching import linear_search, binary_search
+from .runner import iter_algorithm_steps, run_algorithm_counts
+from .registry import AlgorithmSpec, register, get_spec, algorithm_types
+
+# Engines are imported on first access so importing the package stays cheap
+_LAZY_ENGINES = {
+    'bubble_sort': '.sorting',
+    'quick_sort': '.sorting',
+    'merge_sort': '.sorting',
+    'selection_sort': '.sorting',
+    'insertion_sort': '.sorting',
+    'heap_sort': '.sorting',
+    'shell_sort': '.sorting',
+    'counting_sort': '.sorting',
+    'radix_sort': '.sorting',
+    'intro_sort': '.sorting',
+    'tim_sort': '.sorting',
+    'linear_search': '.searching',
+    'binary_search': '.searching',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ENGINES:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_ENGINES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'bubble_sort',
@@ -7,6 +32,18 @@ __all__ = [
     'merge_sort',
     'selection_sort',
     'insertion_sort',
+    'heap_sort',
+    'shell_sort',
+    'counting_sort',
+    'radix_sort',
+    'intro_sort',
+    'tim_sort',
     'linear_search',
-    'binary_search'
+    'binary_search',
+    'iter_algorithm_steps',
+    'run_algorithm_counts',
+    'AlgorithmSpec',
+    'register',
+    'get_spec',
+    'algorithm_types'
 ]
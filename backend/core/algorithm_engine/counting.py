@@ -0,0 +1,599 @@
+"""
+Counts-only algorithm implementations
+
+Each function runs the same algorithm as its traced engine without recording
+any frames, and returns the final array together with the comparison and swap
+counters the traced engine would report.
+
+Every function takes an optional `check` callable that is called once per
+outer iteration (pass, partition, run or merge) and cancels the run by
+raising, as CancelToken.check does; the engine executor passes it so that a
+quadratic run stops soon after its request gives up on it.
+"""
+from typing import Callable, List, Dict, Any, Optional, Tuple
+from bisect import bisect_left, bisect_right
+
+from .registry import BUBBLE_VARIANTS, INSERTION_VARIANTS, MERGE_VARIANTS, QUICK_VARIANTS
+from .sorting.counting import MAX_VALUE_RANGE
+from .sorting.intro import INSERTION_THRESHOLD
+from .sorting.pivots import pivot_selector
+from .sorting.radix import RADIX_BASE
+from .sorting.shell import gap_sequence
+from .sorting.tim import min_run_length
+
+
+def _unchecked():
+    """Default `check`: the run is never cancelled"""
+
+
+def bubble_sort_counts(
+    arr: List[int],
+    variant: str = "standard",
+    check: Callable[[], None] = _unchecked
+) -> Dict[str, Any]:
+    """Counts-only Bubble Sort, see bubble_sort"""
+    if variant not in BUBBLE_VARIANTS:
+        raise ValueError(f"Unknown bubble sort variant: {variant}")
+    values = list(arr)
+    n = len(values)
+    comparisons = 0
+    swaps = 0
+
+    if variant == "cocktail":
+        low, high = 0, n - 1
+        while low < high:
+            for forward in (True, False):
+                check()
+                positions = range(low, high) if forward else range(high - 1, low - 1, -1)
+                comparisons += len(positions)
+                swapped = False
+                for j in positions:
+                    if values[j] > values[j + 1]:
+                        values[j], values[j + 1] = values[j + 1], values[j]
+                        swaps += 1
+                        swapped = True
+                if forward:
+                    high -= 1
+                else:
+                    low += 1
+                if not swapped:
+                    low = high
+                    break
+        return {"array": values, "comparisons": comparisons, "swaps": swaps}
+
+    for i in range(n - 1):
+        check()
+        comparisons += n - i - 1
+        swapped = False
+        for j in range(n - i - 1):
+            if values[j] > values[j + 1]:
+                values[j], values[j + 1] = values[j + 1], values[j]
+                swaps += 1
+                swapped = True
+        if variant == "early_exit" and not swapped:
+            break
+
+    return {"array": values, "comparisons": comparisons, "swaps": swaps}
+
+
+def selection_sort_counts(arr: List[int], check: Callable[[], None] = _unchecked) -> Dict[str, Any]:
+    """Counts-only Selection Sort, see selection_sort"""
+    values = list(arr)
+    n = len(values)
+    comparisons = 0
+    swaps = 0
+
+    for i in range(n - 1):
+        check()
+        min_index = i
+        min_value = values[i]
+        comparisons += n - i - 1
+        for j in range(i + 1, n):
+            if values[j] < min_value:
+                min_index = j
+                min_value = values[j]
+
+        if min_index != i:
+            values[i], values[min_index] = values[min_index], values[i]
+            swaps += 1
+
+    return {"array": values, "comparisons": comparisons, "swaps": swaps}
+
+
+def insertion_sort_counts(
+    arr: List[int],
+    variant: str = "linear",
+    check: Callable[[], None] = _unchecked
+) -> Dict[str, Any]:
+    """Counts-only Insertion Sort, see insertion_sort"""
+    if variant not in INSERTION_VARIANTS:
+        raise ValueError(f"Unknown insertion sort variant: {variant}")
+    values = list(arr)
+    n = len(values)
+    comparisons = 0
+    swaps = 0
+
+    if variant == "binary":
+        for i in range(1, n):
+            check()
+            key = values[i]
+            low, high = 0, i
+            while low < high:
+                mid = (low + high) // 2
+                comparisons += 1
+                if values[mid] > key:
+                    high = mid
+                else:
+                    low = mid + 1
+            values[low + 1:i + 1] = values[low:i]
+            values[low] = key
+            swaps += i - low + 1
+        return {"array": values, "comparisons": comparisons, "swaps": swaps}
+
+    for i in range(1, n):
+        check()
+        key = values[i]
+        j = i - 1
+        while j >= 0 and values[j] > key:
+            values[j + 1] = values[j]
+            j -= 1
+        shifts = i - 1 - j
+        values[j + 1] = key
+        # Every shift is counted as a comparison and a swap; the insertion is one more swap
+        comparisons += shifts
+        swaps += shifts + 1
+
+    return {"array": values, "comparisons": comparisons, "swaps": swaps}
+
+
+def quick_sort_counts(
+    arr: List[int],
+    pivot: str = "last",
+    seed: Optional[int] = None,
+    variant: str = "lomuto",
+    check: Callable[[], None] = _unchecked
+) -> Dict[str, Any]:
+    """
+    Counts-only Quick Sort, see quick_sort
+
+    Processes partitions from an explicit stack in the same order as the
+    traced engine, so a random pivot draws the same positions and the
+    counters are the same.
+    """
+    if variant not in QUICK_VARIANTS:
+        raise ValueError(f"Unknown quick sort variant: {variant}")
+
+    values = list(arr)
+    choose_pivot = pivot_selector(pivot, seed)
+    comparisons = 0
+    swaps = 0
+    stack = [(0, len(values) - 1)]
+
+    while stack:
+        low, high = stack.pop()
+        if low >= high:
+            continue
+        check()
+
+        pivot_index, used = choose_pivot(values, low, high)
+        comparisons += used
+
+        if variant == "three_way":
+            pivot_value = values[pivot_index]
+            lt, i, gt = low, low, high
+            while i <= gt:
+                value = values[i]
+                if value < pivot_value:
+                    comparisons += 1
+                    if lt != i:
+                        values[lt], values[i] = values[i], values[lt]
+                        swaps += 1
+                    lt += 1
+                    i += 1
+                else:
+                    comparisons += 2
+                    if value > pivot_value:
+                        if i != gt:
+                            values[i], values[gt] = values[gt], values[i]
+                            swaps += 1
+                        gt -= 1
+                    else:
+                        i += 1
+            stack.append((gt + 1, high))
+            stack.append((low, lt - 1))
+            continue
+
+        if pivot_index != high:
+            values[pivot_index], values[high] = values[high], values[pivot_index]
+            swaps += 1
+
+        pivot_value = values[high]
+        i = low - 1
+        comparisons += high - low
+        for j in range(low, high):
+            if values[j] < pivot_value:
+                i += 1
+                if i != j:
+                    values[i], values[j] = values[j], values[i]
+                    swaps += 1
+
+        values[i + 1], values[high] = values[high], values[i + 1]
+        swaps += 1
+
+        stack.append((i + 2, high))
+        stack.append((low, i))
+
+    return {"array": values, "comparisons": comparisons, "swaps": swaps}
+
+
+def _merge_comparisons(left_values: List[int], right_values: List[int]) -> int:
+    """
+    Comparisons of one merge of two sorted lists
+
+    The merge loop stops as soon as one half runs out, so a merge costs
+    len(half) comparisons plus the number of elements of the other half taken
+    before it; those are found by bisection. Ties are taken from the left half.
+    """
+    if left_values[-1] <= right_values[-1]:
+        return len(left_values) + bisect_left(right_values, left_values[-1])
+    return len(right_values) + bisect_right(left_values, right_values[-1])
+
+
+def merge_sort_counts(
+    arr: List[int],
+    variant: str = "top_down",
+    check: Callable[[], None] = _unchecked
+) -> Dict[str, Any]:
+    """
+    Counts-only Merge Sort, see merge_sort
+
+    Merges the same ranges as the traced engine, counting comparisons with
+    _merge_comparisons. Every element written back counts as a swap.
+    """
+    if variant not in MERGE_VARIANTS:
+        raise ValueError(f"Unknown merge sort variant: {variant}")
+
+    n = len(arr)
+    comparisons = 0
+    swaps = 0
+
+    if variant == "bottom_up":
+        runs = [[value] for value in arr]
+        while len(runs) > 1:
+            merged = []
+            for index in range(0, len(runs) - 1, 2):
+                check()
+                left_values, right_values = runs[index], runs[index + 1]
+                comparisons += _merge_comparisons(left_values, right_values)
+                swaps += len(left_values) + len(right_values)
+                merged.append(sorted(left_values + right_values))
+            if len(runs) % 2:
+                merged.append(runs[-1])
+            runs = merged
+        return {"array": runs[0] if runs else [], "comparisons": comparisons, "swaps": swaps}
+
+    def sort(left: int, right: int) -> List[int]:
+        nonlocal comparisons
+        if left == right:
+            return [arr[left]]
+
+        mid = (left + right) // 2
+        left_values = sort(left, mid)
+        right_values = sort(mid + 1, right)
+        check()
+        comparisons += _merge_comparisons(left_values, right_values)
+        return sorted(left_values + right_values)
+
+    values = sort(0, n - 1) if n else []
+
+    # Each merge of [left, right] writes right - left + 1 elements
+    sizes = [n] if n > 1 else []
+    while sizes:
+        size = sizes.pop()
+        swaps += size
+        for half in ((size + 1) // 2, size // 2):
+            if half > 1:
+                sizes.append(half)
+
+    return {"array": values, "comparisons": comparisons, "swaps": swaps}
+
+
+def _sift_down(values: List[int], low: int, root: int, end: int) -> Tuple[int, int]:
+    """
+    Sift values[low + root] down the max-heap stored in values[low:low + end]
+
+    Returns:
+        Comparisons and swaps used
+    """
+    comparisons = 0
+    swaps = 0
+    while True:
+        largest = root
+        for child in (2 * root + 1, 2 * root + 2):
+            if child < end:
+                comparisons += 1
+                if values[low + child] > values[low + largest]:
+                    largest = child
+        if largest == root:
+            return comparisons, swaps
+        values[low + root], values[low + largest] = values[low + largest], values[low + root]
+        swaps += 1
+        root = largest
+
+
+def _heap_sort_range(
+    values: List[int],
+    low: int,
+    high: int,
+    check: Callable[[], None] = _unchecked
+) -> Tuple[int, int]:
+    """Heap sort values[low:high + 1] in place and return the comparisons and swaps used"""
+    comparisons = 0
+    swaps = 0
+    size = high - low + 1
+    for root in range(size // 2 - 1, -1, -1):
+        used, moved = _sift_down(values, low, root, size)
+        comparisons += used
+        swaps += moved
+    for end in range(size - 1, 0, -1):
+        check()
+        values[low], values[low + end] = values[low + end], values[low]
+        used, moved = _sift_down(values, low, 0, end)
+        comparisons += used
+        swaps += moved + 1
+    return comparisons, swaps
+
+
+def heap_sort_counts(arr: List[int], check: Callable[[], None] = _unchecked) -> Dict[str, Any]:
+    """Counts-only Heap Sort, see heap_sort"""
+    values = list(arr)
+    comparisons, swaps = _heap_sort_range(values, 0, len(values) - 1, check)
+    return {"array": values, "comparisons": comparisons, "swaps": swaps}
+
+
+def _gapped_insertion_sort(
+    values: List[int],
+    low: int,
+    high: int,
+    gap: int,
+    check: Callable[[], None] = _unchecked
+) -> Tuple[int, int]:
+    """
+    Insertion sort values[low:high + 1] over elements gap positions apart, in place
+
+    Every comparison is counted, including the one that stops a key; every
+    shift and every insertion of a key that moved counts as a swap.
+
+    Returns:
+        Comparisons and swaps used
+    """
+    comparisons = 0
+    swaps = 0
+    for i in range(low + gap, high + 1):
+        check()
+        key = values[i]
+        j = i
+        while j - gap >= low:
+            comparisons += 1
+            if values[j - gap] <= key:
+                break
+            values[j] = values[j - gap]
+            swaps += 1
+            j -= gap
+        if j != i:
+            values[j] = key
+            swaps += 1
+    return comparisons, swaps
+
+
+def shell_sort_counts(
+    arr: List[int],
+    variant: str = "shell",
+    check: Callable[[], None] = _unchecked
+) -> Dict[str, Any]:
+    """Counts-only Shell Sort, see shell_sort"""
+    values = list(arr)
+    comparisons = 0
+    swaps = 0
+    for gap in gap_sequence(variant, len(values)):
+        used, moved = _gapped_insertion_sort(values, 0, len(values) - 1, gap, check)
+        comparisons += used
+        swaps += moved
+    return {"array": values, "comparisons": comparisons, "swaps": swaps}
+
+
+def counting_sort_counts(arr: List[int], check: Callable[[], None] = _unchecked) -> Dict[str, Any]:
+    """Counts-only Counting Sort, see counting_sort"""
+    if not arr:
+        return {"array": [], "comparisons": 0, "swaps": 0}
+
+    low, high = min(arr), max(arr)
+    if high - low + 1 > MAX_VALUE_RANGE:
+        raise ValueError(f"Counting sort supports a value range of at most {MAX_VALUE_RANGE}, got {high - low + 1}")
+
+    counts = [0] * (high - low + 1)
+    for value in arr:
+        counts[value - low] += 1
+    values = []
+    for offset, count in enumerate(counts):
+        values.extend([low + offset] * count)
+
+    return {"array": values, "comparisons": 0, "swaps": len(arr)}
+
+
+def radix_sort_counts(arr: List[int], check: Callable[[], None] = _unchecked) -> Dict[str, Any]:
+    """Counts-only Radix Sort, see radix_sort"""
+    values = list(arr)
+    n = len(values)
+    low = min(values) if n else 0
+    span = max(values) - low if n else 0
+    place = 1
+    swaps = 0
+
+    while n > 1 and span // place > 0:
+        check()
+        buckets = [[] for _ in range(RADIX_BASE)]
+        for value in values:
+            buckets[(value - low) // place % RADIX_BASE].append(value)
+        values = [value for bucket in buckets for value in bucket]
+        swaps += n
+        place *= RADIX_BASE
+
+    return {"array": values, "comparisons": 0, "swaps": swaps}
+
+
+def intro_sort_counts(arr: List[int], check: Callable[[], None] = _unchecked) -> Dict[str, Any]:
+    """Counts-only Introsort, see intro_sort"""
+    values = list(arr)
+    n = len(values)
+    choose_pivot = pivot_selector("median3")
+    comparisons = 0
+    swaps = 0
+    stack = [(0, n - 1, 2 * (n.bit_length() - 1) if n > 1 else 0)]
+
+    while stack:
+        low, high, depth = stack.pop()
+        size = high - low + 1
+        if size <= 1:
+            continue
+        check()
+
+        if size <= INSERTION_THRESHOLD:
+            used, moved = _gapped_insertion_sort(values, low, high, 1)
+        elif depth == 0:
+            used, moved = _heap_sort_range(values, low, high, check)
+        else:
+            pivot_index, used = choose_pivot(values, low, high)
+            moved = 0
+            if pivot_index != high:
+                values[pivot_index], values[high] = values[high], values[pivot_index]
+                moved += 1
+
+            pivot_value = values[high]
+            i = low - 1
+            used += high - low
+            for j in range(low, high):
+                if values[j] < pivot_value:
+                    i += 1
+                    if i != j:
+                        values[i], values[j] = values[j], values[i]
+                        moved += 1
+            values[i + 1], values[high] = values[high], values[i + 1]
+            moved += 1
+
+            stack.append((i + 2, high, depth - 1))
+            stack.append((low, i, depth - 1))
+        comparisons += used
+        swaps += moved
+
+    return {"array": values, "comparisons": comparisons, "swaps": swaps}
+
+
+def tim_sort_counts(arr: List[int], check: Callable[[], None] = _unchecked) -> Dict[str, Any]:
+    """
+    Counts-only Timsort, see tim_sort
+
+    Detects and extends the same runs and merges them in the same order as the
+    traced engine; merges are counted with _merge_comparisons.
+    """
+    values = list(arr)
+    n = len(values)
+    minrun = min_run_length(n)
+    comparisons = 0
+    swaps = 0
+    runs: List[List[int]] = []
+
+    def merge_at(index: int):
+        nonlocal comparisons, swaps
+        check()
+        left, left_length = runs[index]
+        mid, right_length = runs[index + 1]
+        right = mid + right_length
+        runs[index] = [left, left_length + right_length]
+        del runs[index + 1]
+
+        comparisons += _merge_comparisons(values[left:mid], values[mid:right])
+        swaps += right - left
+        # sorted() is stable, so equal values keep their order as in the merge
+        values[left:right] = sorted(values[left:right])
+
+    lo = 0
+    while lo < n:
+        check()
+        hi = lo + 1
+        if hi < n:
+            descending = values[hi] < values[lo]
+            hi += 1
+            while hi < n and (values[hi] < values[hi - 1]) == descending:
+                hi += 1
+            # The comparison that ends the run is counted too
+            comparisons += hi - lo - 1 + (hi < n)
+            if descending:
+                values[lo:hi] = values[lo:hi][::-1]
+                swaps += (hi - lo) // 2
+
+        end = min(lo + minrun, n)
+        for i in range(hi, end):
+            key = values[i]
+            low, high = lo, i
+            while low < high:
+                mid = (low + high) // 2
+                comparisons += 1
+                if values[mid] > key:
+                    high = mid
+                else:
+                    low = mid + 1
+            values[low + 1:i + 1] = values[low:i]
+            values[low] = key
+            swaps += i - low + 1
+        hi = max(hi, end)
+
+        runs.append([lo, hi - lo])
+        while len(runs) > 1:
+            k = len(runs) - 2
+            if (k > 0 and runs[k - 1][1] <= runs[k][1] + runs[k + 1][1]) or \
+                    (k > 1 and runs[k - 2][1] <= runs[k - 1][1] + runs[k][1]):
+                if runs[k - 1][1] < runs[k + 1][1]:
+                    k -= 1
+            elif runs[k][1] > runs[k + 1][1]:
+                break
+            merge_at(k)
+        lo = hi
+
+    while len(runs) > 1:
+        k = len(runs) - 2
+        if k > 0 and runs[k - 1][1] < runs[k + 1][1]:
+            k -= 1
+        merge_at(k)
+
+    return {"array": values, "comparisons": comparisons, "swaps": swaps}
+
+
+def linear_search_counts(arr: List[int], target: int, check: Callable[[], None] = _unchecked) -> Dict[str, Any]:
+    """Counts-only Linear Search, see linear_search"""
+    try:
+        comparisons = arr.index(target) + 1
+    except ValueError:
+        comparisons = len(arr)
+
+    return {"array": list(arr), "comparisons": comparisons, "swaps": 0}
+
+
+def binary_search_counts(arr: List[int], target: int, check: Callable[[], None] = _unchecked) -> Dict[str, Any]:
+    """Counts-only Binary Search, see binary_search"""
+    values = sorted(arr)
+    comparisons = 0
+    left = 0
+    right = len(values) - 1
+
+    while left <= right:
+        mid = (left + right) // 2
+        comparisons += 1
+        if values[mid] == target:
+            break
+        elif values[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+
+    return {"array": values, "comparisons": comparisons, "swaps": 0}
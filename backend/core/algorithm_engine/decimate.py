@@ -0,0 +1,113 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .frame import Frame, positions_to_ranges
+
+
+def _flag_ranges(frame: Frame) -> Dict[str, List[List[int]]]:
+    """Set flags of a frame as [start, stop) ranges; flags set nowhere are left out"""
+    ranges = {}
+    for name, positions in frame.flags.items():
+        spans = positions_to_ranges(positions)
+        if spans:
+            ranges[name] = spans
+    return ranges
+
+
+def same_state(frame: Frame, other: Frame) -> bool:
+    """
+    Whether two frames show the same state, ignoring their descriptions
+
+    Args:
+        frame: A frame
+        other: Another frame
+
+    Returns:
+        True if values, ids, set flags and counters are equal
+    """
+    return (
+        frame.comparisons == other.comparisons
+        and frame.swaps == other.swaps
+        and (frame.values is other.values or frame.values == other.values)
+        and (frame.ids is other.ids or frame.ids == other.ids)
+        and _flag_ranges(frame) == _flag_ranges(other)
+    )
+
+
+def decimate_frames(frames: Iterable[Frame], max_steps: int) -> Tuple[int, List[Frame]]:
+    """
+    Thin a trace down to at most max_steps frames while it is produced
+
+    The first frame and the final state are always kept. A frame showing the
+    same state as the frame before it is dropped (a key frame replaces its
+    kept twin instead). Key events (pivot placements, passes, merges, search
+    results) and the remaining frames are thinned separately, each keeping
+    every stride-th frame with a stride that doubles, discarding every other
+    kept frame, whenever both together outgrow the budget. Ordinary frames
+    are discarded first, so key frames are only thinned once they fill the
+    budget on their own. Memory therefore stays bounded by max_steps however
+    long the trace is.
+
+    Args:
+        frames: Frames of a trace, consumed lazily
+        max_steps: Largest number of frames to keep, at least 2
+
+    Returns:
+        Total number of frames in the trace and the kept frames in order
+    """
+    # Slots left after the first frame and the final state
+    budget = max(max_steps - 2, 0)
+    # (is_key, index within its kind, frame); index None marks the first frame
+    kept: List[Tuple[bool, Optional[int], Frame]] = []
+    counts = {True: 0, False: 0}
+    strides = {True: 1, False: 1}
+    indices = {True: 0, False: 0}
+    total = 0
+    previous = None
+    last = None
+
+    for frame in frames:
+        total += 1
+        last = frame
+        if previous is None:
+            kept.append((frame.key, None, frame))
+            previous = frame
+            continue
+        duplicate = same_state(frame, previous)
+        previous_kept = kept[-1][2] is previous
+        previous = frame
+        if duplicate and not frame.key:
+            continue
+
+        kind = frame.key
+        index = indices[kind]
+        indices[kind] += 1
+        # Index k survives stride s when (k + 1) % s == 0, so a doubled stride keeps a subset
+        if (index + 1) % strides[kind]:
+            continue
+
+        if duplicate and previous_kept:
+            twin_key, twin_index, _ = kept[-1]
+            if twin_index is None:
+                # The first frame keeps its slot and takes the key event's description
+                kept[-1] = (twin_key, None, frame)
+                continue
+            counts[twin_key] -= 1
+            kept.pop()
+        kept.append((kind, index, frame))
+        counts[kind] += 1
+
+        while counts[True] + counts[False] > budget:
+            kind = counts[False] == 0
+            strides[kind] *= 2
+            stride = strides[kind]
+            kept = [
+                item for item in kept
+                if item[0] != kind or item[1] is None or (item[1] + 1) % stride == 0
+            ]
+            counts[kind] = sum(1 for item in kept if item[0] == kind and item[1] is not None)
+
+    # The final state is kept, unless the last kept frame already shows it
+    if last is not None and not (kept[-1][2] is last or same_state(kept[-1][2], last)):
+        kept.append((last.key, None, last))
+
+    return total, [frame for _, _, frame in kept]
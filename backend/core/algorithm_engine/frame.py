@@ -0,0 +1,225 @@
+from typing import List, Dict, Any, Iterable, Optional, Union, Tuple
+from array import array
+
+
+# A flag's positions: a range, or a tuple of indices and/or ranges
+Positions = Union[range, Tuple[Union[int, range], ...]]
+
+
+def positions_to_ranges(positions: Positions) -> List[List[int]]:
+    """
+    Normalize flag positions into sorted, non-overlapping [start, stop) ranges
+
+    Args:
+        positions: A range, or a tuple of indices and/or ranges
+
+    Returns:
+        List of half-open [start, stop) ranges
+    """
+    if isinstance(positions, range):
+        return [[positions.start, positions.stop]] if len(positions) else []
+
+    spans = []
+    for item in positions:
+        if isinstance(item, range):
+            if len(item):
+                spans.append((item.start, item.stop))
+        else:
+            spans.append((item, item + 1))
+    spans.sort()
+
+    ranges = []
+    for start, stop in spans:
+        if ranges and start <= ranges[-1][1]:
+            ranges[-1][1] = max(ranges[-1][1], stop)
+        else:
+            ranges.append([start, stop])
+    return ranges
+
+
+def ranges_to_positions(ranges: Iterable[Iterable[int]]) -> Positions:
+    """
+    Inverse of positions_to_ranges
+
+    Args:
+        ranges: Half-open [start, stop) ranges
+
+    Returns:
+        Positions covering the same indices
+    """
+    spans = tuple(range(start, stop) for start, stop in ranges)
+    return spans[0] if len(spans) == 1 else spans
+
+
+class Frame:
+    """
+    Single step of an algorithm trace in columnar form
+
+    `values` and `ids` are typed arrays that are shared between consecutive
+    frames until the engine mutates its array, and `flags` maps each flag name
+    to the positions where it is set. A flag that is present with no positions
+    is false for every element. `key` marks the frames of key events (pivot
+    placements, starts of passes and merges, search results) that decimation
+    keeps in preference to other frames; it is not part of any trace format.
+    """
+
+    __slots__ = ("values", "ids", "flags", "comparisons", "swaps", "description", "key")
+
+    def __init__(self, values: array, ids: array, flags: Dict[str, Positions],
+                 comparisons: int, swaps: int, description: str, key: bool = False):
+        self.values = values
+        self.ids = ids
+        self.flags = flags
+        self.comparisons = comparisons
+        self.swaps = swaps
+        self.description = description
+        self.key = key
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @classmethod
+    def from_dict(cls, step: Dict[str, Any]) -> "Frame":
+        """
+        Build a frame from a snapshot step
+
+        Args:
+            step: Step dict with array, comparisons, swaps and description
+
+        Returns:
+            The equivalent frame
+        """
+        elements = step["array"]
+        names = []
+        for el in elements:
+            for key in el:
+                if key not in ("value", "id") and key not in names:
+                    names.append(key)
+        flags = {
+            name: ranges_to_positions(positions_to_ranges(
+                tuple(idx for idx, el in enumerate(elements) if el.get(name))
+            ))
+            for name in names
+        }
+        return cls(
+            array("q", (el["value"] for el in elements)),
+            array("q", (el["id"] for el in elements)),
+            flags,
+            step["comparisons"],
+            step["swaps"],
+            step["description"]
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Render the frame as a snapshot step with one dict per element
+
+        Returns:
+            Step dict with array, comparisons, swaps and description
+        """
+        flag_items = [
+            (name, positions if isinstance(positions, range) else _PositionSet(positions))
+            for name, positions in self.flags.items()
+        ]
+        elements = []
+        for idx, (value, el_id) in enumerate(zip(self.values, self.ids)):
+            el = {"value": value, "id": el_id}
+            for name, positions in flag_items:
+                el[name] = idx in positions
+            elements.append(el)
+
+        return {
+            "array": elements,
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "description": self.description
+        }
+
+    def to_columnar(self, previous: Optional["Frame"] = None) -> Dict[str, Any]:
+        """
+        Render the frame in the columnar trace format
+
+        `values` and `ids` are only included when they differ from `previous`.
+
+        Args:
+            previous: The frame sent before this one, if any
+
+        Returns:
+            Columnar step dict
+        """
+        step = {}
+        if previous is None or (self.values is not previous.values and self.values != previous.values):
+            step["values"] = self.values.tolist()
+        if previous is None or (self.ids is not previous.ids and self.ids != previous.ids):
+            step["ids"] = self.ids.tolist()
+        step["flags"] = {name: positions_to_ranges(positions) for name, positions in self.flags.items()}
+        step["comparisons"] = self.comparisons
+        step["swaps"] = self.swaps
+        step["description"] = self.description
+        return step
+
+
+class _PositionSet:
+    """Membership test over a tuple of indices and/or ranges"""
+
+    __slots__ = ("indices", "ranges")
+
+    def __init__(self, positions: Tuple[Union[int, range], ...]):
+        self.indices = {item for item in positions if not isinstance(item, range)}
+        self.ranges = [item for item in positions if isinstance(item, range)]
+
+    def __contains__(self, idx: int) -> bool:
+        return idx in self.indices or any(idx in r for r in self.ranges)
+
+
+class TraceArray:
+    """
+    Working array of an algorithm engine
+
+    Values and element ids live in typed arrays. Frames share one snapshot of
+    them until the next swap or write, so steps that only change flags cost no
+    array copies.
+    """
+
+    __slots__ = ("values", "ids", "_snapshot")
+
+    def __init__(self, values: Iterable[int], ids: Optional[Iterable[int]] = None):
+        self.values = array("q", values)
+        self.ids = array("q", ids if ids is not None else range(len(self.values)))
+        self._snapshot = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def swap(self, i: int, j: int):
+        """Exchange the elements at positions i and j"""
+        values, ids = self.values, self.ids
+        values[i], values[j] = values[j], values[i]
+        ids[i], ids[j] = ids[j], ids[i]
+        self._snapshot = None
+
+    def write(self, k: int, value: int, el_id: int):
+        """Store an element at position k"""
+        self.values[k] = value
+        self.ids[k] = el_id
+        self._snapshot = None
+
+    def frame(self, flags: Dict[str, Positions], comparisons: int, swaps: int, description: str,
+              key: bool = False) -> Frame:
+        """
+        Capture the current array state as a frame
+
+        Args:
+            flags: Positions of each flag in this step
+            comparisons: Total comparisons so far
+            swaps: Total swaps so far
+            description: Description of this step
+            key: Whether the step is a key event that decimation prefers to keep
+
+        Returns:
+            Frame sharing the current snapshot of the array
+        """
+        if self._snapshot is None:
+            self._snapshot = (self.values[:], self.ids[:])
+        values, ids = self._snapshot
+        return Frame(values, ids, flags, comparisons, swaps, description, key)
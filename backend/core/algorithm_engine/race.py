@@ -0,0 +1,76 @@
+from typing import List, Iterable, Sequence, Tuple
+from bisect import bisect_right
+
+from .frame import Frame
+
+
+def sample_frames(frames: Iterable[Frame], max_frames: int) -> Tuple[int, List[int], List[Frame]]:
+    """
+    Keep evenly spaced frames of a trace while it is produced
+
+    Frames are kept at a stride that doubles, discarding every other kept
+    frame, whenever more than max_frames are kept (as in decimate_frames), and
+    the last frame is kept as well. At most max_frames + 1 frames survive, the
+    final state is never lost, and memory stays bounded by max_frames however
+    long the trace is.
+
+    Args:
+        frames: Frames of a trace, consumed lazily
+        max_frames: Target number of frames
+
+    Returns:
+        Total number of frames, the indices of the kept frames and the kept frames
+    """
+    kept: List[Tuple[int, Frame]] = []
+    stride = 1
+    total = 0
+    last = None
+
+    for index, frame in enumerate(frames):
+        total += 1
+        last = frame
+        if index % stride:
+            continue
+        kept.append((index, frame))
+        while len(kept) > max_frames:
+            stride *= 2
+            kept = [item for item in kept if item[0] % stride == 0]
+
+    if last is not None and kept[-1][0] != total - 1:
+        kept.append((total - 1, last))
+    return total, [index for index, _ in kept], [frame for _, frame in kept]
+
+
+def race_timeline(total_steps: Sequence[int], frames: int) -> List[int]:
+    """
+    Common step positions at which competing traces are shown side by side
+
+    Args:
+        total_steps: Number of steps of every trace
+        frames: Number of positions
+
+    Returns:
+        `frames` evenly spaced step indices from 0 to the end of the longest trace
+    """
+    last = max(total_steps, default=1) - 1
+    if frames == 1 or last <= 0:
+        return [max(last, 0)] * frames
+    return [round(k * last / (frames - 1)) for k in range(frames)]
+
+
+def align_frames(indices: List[int], frames: List[Frame], timeline: List[int]) -> List[Frame]:
+    """
+    Pick the frame of a sampled trace to show at each timeline position
+
+    A trace shows its latest sampled frame at or before each position, and its
+    final frame once it has finished, so shorter traces end earlier in the race.
+
+    Args:
+        indices: Step indices of the sampled frames, as returned by sample_frames
+        frames: The sampled frames
+        timeline: Step positions, as returned by race_timeline
+
+    Returns:
+        One frame per timeline position
+    """
+    return [frames[max(bisect_right(indices, position) - 1, 0)] for position in timeline]
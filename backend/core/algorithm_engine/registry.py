@@ -0,0 +1,318 @@
+"""
+Registry of every supported algorithm
+
+Each algorithm is declared once as an AlgorithmSpec: its name, category and
+complexity, and the dotted paths of its traced engine, counts-only
+implementation and optional exact counter and operation estimator. The
+implementations are imported on first use, and lookups by algorithm type or
+category go through dictionaries built at registration time.
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+import importlib
+
+
+CATEGORIES = ("sorting", "searching")
+
+# Option values accepted by the engines; kept here so the registry can
+# validate requests without importing the engines
+PIVOT_STRATEGIES = ("last", "median3", "random", "ninther")
+QUICK_VARIANTS = ("lomuto", "three_way")
+MERGE_VARIANTS = ("top_down", "bottom_up")
+BUBBLE_VARIANTS = ("standard", "early_exit", "cocktail")
+INSERTION_VARIANTS = ("linear", "binary")
+SHELL_GAP_SEQUENCES = ("shell", "knuth", "ciura")
+
+
+def _resolve(path: str) -> Callable:
+    """Import "module:attribute"; modules starting with a dot are relative to this package"""
+    module_name, attribute = path.split(":")
+    module = importlib.import_module(module_name, package=__package__)
+    return getattr(module, attribute)
+
+
+class AlgorithmSpec:
+    """
+    Declaration of one algorithm
+
+    `engine` is the traced engine yielding frames, called as engine(array) for
+    sorting and engine(array, target) for searching; `counts` is the counts-only
+    implementation with the same arguments and an optional `check` callable
+    (see counting.py). `exact` (sorting only) computes the
+    exact counters of an input without simulating the engine, and `estimator`
+    maps an array size to best, average and worst operation counts; when they
+    are not given, callers fall back to `counts` and the empirical profile.
+    All four are given as "module:function" paths and imported on first access.
+    `options` maps each keyword argument the engine and counts-only
+    implementation accept to its allowed values (None for any value), and
+    `variants` maps values of the variant option to the complexity entries
+    that differ from `complexity`.
+    """
+
+    __slots__ = (
+        "algorithm_type", "name", "category", "complexity", "metadata", "complexity_info", "options",
+        "_variant_info", "_paths", "_loaded"
+    )
+
+    def __init__(
+        self,
+        algorithm_type: str,
+        name: str,
+        category: str,
+        complexity: Dict[str, Any],
+        engine: str,
+        counts: str,
+        exact: Optional[str] = None,
+        estimator: Optional[str] = None,
+        options: Optional[Dict[str, Optional[Tuple[Any, ...]]]] = None,
+        variants: Optional[Dict[str, Dict[str, Any]]] = None
+    ):
+        if category not in CATEGORIES:
+            raise ValueError(f"Unknown algorithm category: {category}")
+        self.algorithm_type = algorithm_type
+        self.name = name
+        self.category = category
+        self.complexity = complexity
+        self.metadata = {"name": name, "category": category}
+        self.complexity_info = {**self.metadata, **complexity}
+        self.options = options or {}
+        self._variant_info = {
+            variant: {**self.complexity_info, **overrides, "variant": variant}
+            for variant, overrides in (variants or {}).items()
+        }
+        self._paths = {"engine": engine, "counts": counts, "exact": exact, "estimator": estimator}
+        self._loaded: Dict[str, Callable] = {}
+
+    @property
+    def needs_target(self) -> bool:
+        """Whether the algorithm takes a search target"""
+        return self.category == "searching"
+
+    def check_options(self, options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Validate engine options
+
+        Args:
+            options: Keyword arguments for the engine; None values mean "default" and are dropped
+
+        Returns:
+            The options that are set
+
+        Raises:
+            ValueError: If an option is not supported or has an unknown value
+        """
+        options = {name: value for name, value in (options or {}).items() if value is not None}
+        for name, value in options.items():
+            if name not in self.options:
+                raise ValueError(f"{self.name} does not support the {name} option")
+            allowed = self.options[name]
+            if allowed is not None and value not in allowed:
+                raise ValueError(f"Unknown {name} for {self.name.lower()}: {value}")
+        return options
+
+    def variant_complexity_info(self, variant: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Complexity of one variant of the algorithm
+
+        Args:
+            variant: Value of the variant option; None for the default
+
+        Returns:
+            complexity_info with the variant's overrides applied
+
+        Raises:
+            ValueError: If the algorithm has no such variant
+        """
+        if variant is None:
+            return self.complexity_info
+        self.check_options({"variant": variant})
+        return self._variant_info.get(variant, {**self.complexity_info, "variant": variant})
+
+    def _load(self, role: str) -> Optional[Callable]:
+        function = self._loaded.get(role)
+        if function is None and self._paths[role] is not None:
+            function = self._loaded[role] = _resolve(self._paths[role])
+        return function
+
+    @property
+    def engine(self) -> Callable:
+        """Traced engine"""
+        return self._load("engine")
+
+    @property
+    def counts(self) -> Callable:
+        """Counts-only implementation"""
+        return self._load("counts")
+
+    @property
+    def exact(self) -> Optional[Callable]:
+        """Exact counter taking the array, if the algorithm has one"""
+        return self._load("exact")
+
+    @property
+    def estimator(self) -> Optional[Callable]:
+        """Operation estimator taking the array size, if the algorithm has one"""
+        return self._load("estimator")
+
+
+_SPECS: Dict[str, AlgorithmSpec] = {}
+_BY_CATEGORY: Dict[Optional[str], Tuple[str, ...]] = {None: ()}
+
+
+def register(spec: AlgorithmSpec):
+    """
+    Add an algorithm to the registry, replacing any spec of the same type
+
+    Args:
+        spec: Declaration of the algorithm
+    """
+    _SPECS[spec.algorithm_type] = spec
+    _BY_CATEGORY[None] = tuple(_SPECS)
+    for category in CATEGORIES:
+        _BY_CATEGORY[category] = tuple(
+            algorithm_type for algorithm_type, item in _SPECS.items() if item.category == category
+        )
+
+
+def get_spec(algorithm_type: str) -> AlgorithmSpec:
+    """
+    Look up an algorithm
+
+    Args:
+        algorithm_type: Type of algorithm (bubble, quick, merge, etc.)
+
+    Returns:
+        The algorithm's spec
+
+    Raises:
+        ValueError: If the algorithm is not registered
+    """
+    spec = _SPECS.get(algorithm_type)
+    if spec is None:
+        raise ValueError(f"Unknown algorithm type: {algorithm_type}")
+    return spec
+
+
+def algorithm_types(category: Optional[str] = None) -> Tuple[str, ...]:
+    """
+    List registered algorithms in registration order
+
+    Args:
+        category: Only list algorithms of this category (sorting or searching)
+
+    Returns:
+        Algorithm types
+    """
+    return _BY_CATEGORY.get(category, ())
+
+
+register(AlgorithmSpec(
+    "bubble", "Bubble Sort", "sorting",
+    {"time_best": "O(n²)", "time_average": "O(n²)", "time_worst": "O(n²)",
+     "space": "O(1)", "stable": True, "in_place": True},
+    engine=".sorting.bubble:bubble_sort",
+    counts=".counting:bubble_sort_counts",
+    exact="core.analyzer.exact:bubble_sort_exact",
+    estimator="core.analyzer.estimates:bubble_sort_estimate",
+    options={"variant": BUBBLE_VARIANTS},
+    variants={"early_exit": {"time_best": "O(n)"}, "cocktail": {"time_best": "O(n)"}}
+))
+register(AlgorithmSpec(
+    "quick", "Quick Sort", "sorting",
+    {"time_best": "O(n log n)", "time_average": "O(n log n)", "time_worst": "O(n²)",
+     "space": "O(log n)", "stable": False, "in_place": True},
+    engine=".sorting.quick:quick_sort",
+    counts=".counting:quick_sort_counts",
+    options={"pivot": PIVOT_STRATEGIES, "seed": None, "variant": QUICK_VARIANTS},
+    variants={"three_way": {"time_best": "O(n)"}}
+))
+register(AlgorithmSpec(
+    "merge", "Merge Sort", "sorting",
+    {"time_best": "O(n log n)", "time_average": "O(n log n)", "time_worst": "O(n log n)",
+     "space": "O(n)", "stable": True, "in_place": False},
+    engine=".sorting.merge:merge_sort",
+    counts=".counting:merge_sort_counts",
+    options={"variant": MERGE_VARIANTS}
+))
+register(AlgorithmSpec(
+    "selection", "Selection Sort", "sorting",
+    {"time_best": "O(n²)", "time_average": "O(n²)", "time_worst": "O(n²)",
+     "space": "O(1)", "stable": False, "in_place": True},
+    engine=".sorting.selection:selection_sort",
+    counts=".counting:selection_sort_counts",
+    exact="core.analyzer.exact:selection_sort_exact",
+    estimator="core.analyzer.estimates:selection_sort_estimate"
+))
+register(AlgorithmSpec(
+    "insertion", "Insertion Sort", "sorting",
+    {"time_best": "O(n)", "time_average": "O(n²)", "time_worst": "O(n²)",
+     "space": "O(1)", "stable": True, "in_place": True},
+    engine=".sorting.insertion:insertion_sort",
+    counts=".counting:insertion_sort_counts",
+    exact="core.analyzer.exact:insertion_sort_exact",
+    estimator="core.analyzer.estimates:insertion_sort_estimate",
+    options={"variant": INSERTION_VARIANTS},
+    variants={"binary": {"time_best": "O(n log n)"}}
+))
+register(AlgorithmSpec(
+    "heap", "Heap Sort", "sorting",
+    {"time_best": "O(n log n)", "time_average": "O(n log n)", "time_worst": "O(n log n)",
+     "space": "O(1)", "stable": False, "in_place": True},
+    engine=".sorting.heap:heap_sort",
+    counts=".counting:heap_sort_counts"
+))
+register(AlgorithmSpec(
+    "shell", "Shell Sort", "sorting",
+    {"time_best": "O(n log n)", "time_average": "O(n^1.5)", "time_worst": "O(n²)",
+     "space": "O(1)", "stable": False, "in_place": True},
+    engine=".sorting.shell:shell_sort",
+    counts=".counting:shell_sort_counts",
+    options={"variant": SHELL_GAP_SEQUENCES},
+    variants={
+        "knuth": {"time_average": "O(n^1.25)", "time_worst": "O(n^1.5)"},
+        "ciura": {"time_average": "O(n^1.25)", "time_worst": "O(n^1.5)"}
+    }
+))
+register(AlgorithmSpec(
+    "counting", "Counting Sort", "sorting",
+    {"time_best": "O(n + k)", "time_average": "O(n + k)", "time_worst": "O(n + k)",
+     "space": "O(n + k)", "stable": True, "in_place": False},
+    engine=".sorting.counting:counting_sort",
+    counts=".counting:counting_sort_counts"
+))
+register(AlgorithmSpec(
+    "radix", "Radix Sort", "sorting",
+    {"time_best": "O(d·(n + b))", "time_average": "O(d·(n + b))", "time_worst": "O(d·(n + b))",
+     "space": "O(n + b)", "stable": True, "in_place": False},
+    engine=".sorting.radix:radix_sort",
+    counts=".counting:radix_sort_counts"
+))
+register(AlgorithmSpec(
+    "intro", "Introsort", "sorting",
+    {"time_best": "O(n log n)", "time_average": "O(n log n)", "time_worst": "O(n log n)",
+     "space": "O(log n)", "stable": False, "in_place": True},
+    engine=".sorting.intro:intro_sort",
+    counts=".counting:intro_sort_counts"
+))
+register(AlgorithmSpec(
+    "tim", "Timsort", "sorting",
+    {"time_best": "O(n)", "time_average": "O(n log n)", "time_worst": "O(n log n)",
+     "space": "O(n)", "stable": True, "in_place": False},
+    engine=".sorting.tim:tim_sort",
+    counts=".counting:tim_sort_counts"
+))
+register(AlgorithmSpec(
+    "linear", "Linear Search", "searching",
+    {"time_best": "O(1)", "time_average": "O(n)", "time_worst": "O(n)",
+     "space": "O(1)", "stable": True, "in_place": True},
+    engine=".searching.linear:linear_search",
+    counts=".counting:linear_search_counts",
+    estimator="core.analyzer.estimates:linear_search_estimate"
+))
+register(AlgorithmSpec(
+    "binary", "Binary Search", "searching",
+    {"time_best": "O(1)", "time_average": "O(log n)", "time_worst": "O(log n)",
+     "space": "O(1)", "stable": True, "in_place": True},
+    engine=".searching.binary:binary_search",
+    counts=".counting:binary_search_counts",
+    estimator="core.analyzer.estimates:binary_search_estimate"
+))
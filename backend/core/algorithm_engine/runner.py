@@ -0,0 +1,74 @@
+from typing import Callable, List, Dict, Any, Iterator, Optional
+
+from .frame import Frame
+from .registry import get_spec
+
+# Engines keep values in signed 64-bit typed arrays
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def iter_algorithm_steps(
+    algorithm_type: str,
+    array: List[int],
+    search_target: Optional[int] = None,
+    options: Optional[Dict[str, Any]] = None
+) -> Iterator[Frame]:
+    """
+    Start an algorithm engine and return its frame generator
+
+    The engine is looked up in the registry (see registry.py). The arguments
+    are validated eagerly so callers can report bad requests before the first
+    step is produced.
+
+    Args:
+        algorithm_type: Type of algorithm (bubble, quick, merge, etc.)
+        array: Input array of integers
+        search_target: Target value for search algorithms
+        options: Engine options such as pivot or variant, see AlgorithmSpec.options
+
+    Returns:
+        Iterator over the frames produced by the engine
+    """
+    spec = get_spec(algorithm_type)
+    options = spec.check_options(options)
+    if any(value < INT64_MIN or value > INT64_MAX for value in array):
+        raise ValueError("Array values must fit in a signed 64-bit integer")
+
+    if spec.needs_target:
+        if search_target is None:
+            raise ValueError(f"search_target is required for {spec.name.lower()}")
+        return spec.engine(array, search_target, **options)
+    return spec.engine(array, **options)
+
+
+def run_algorithm_counts(
+    algorithm_type: str,
+    array: List[int],
+    search_target: Optional[int] = None,
+    options: Optional[Dict[str, Any]] = None,
+    check: Optional[Callable[[], None]] = None
+) -> Dict[str, Any]:
+    """
+    Run the counts-only implementation of an algorithm
+
+    Args:
+        algorithm_type: Type of algorithm (bubble, quick, merge, etc.)
+        array: Input array of integers
+        search_target: Target value for search algorithms
+        options: Engine options such as pivot or variant, see AlgorithmSpec.options
+        check: Called once per outer iteration of the algorithm; raises to cancel the run,
+            e.g. CancelToken.check
+
+    Returns:
+        Dictionary with the final array, comparisons and swaps
+    """
+    spec = get_spec(algorithm_type)
+    options = spec.check_options(options)
+    if check is not None:
+        options["check"] = check
+    if spec.needs_target:
+        if search_target is None:
+            raise ValueError(f"search_target is required for {spec.name.lower()}")
+        return spec.counts(array, search_target, **options)
+    return spec.counts(array, **options)
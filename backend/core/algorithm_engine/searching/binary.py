@@ -1,7 +1,9 @@
-from typing import List, Dict, Any
+from typing import List, Iterator
 
+from ..frame import Frame, TraceArray
 
-def binary_search(arr: List[int], target: int) -> List[Dict[str, Any]]:
+
+def binary_search(arr: List[int], target: int) -> Iterator[Frame]:
     """
     Binary Search Algorithm
     
@@ -14,23 +16,21 @@ def binary_search(arr: List[int], target: int) -> List[Dict[str, Any]]:
         arr: List of integers to search (will be sorted)
         target: Value to find
         
-    Returns:
-        List of steps showing the search process
+    Yields:
+        Frames showing the search process
     """
-    steps = []
-    
     # Sort the array first
     sorted_arr = sorted(enumerate(arr), key=lambda x: x[1])
-    working_array = [{"value": val, "id": idx} for idx, val in sorted_arr]
+    working_array = TraceArray((val for _, val in sorted_arr), (idx for idx, _ in sorted_arr))
+    values = working_array.values
     comparisons = 0
     
     # Show sorted array
-    steps.append({
-        "array": [{"value": el["value"], "id": el["id"], "isSorted": True} for el in working_array],
-        "comparisons": comparisons,
-        "swaps": 0,
-        "description": "Array sorted for binary search"
-    })
+    yield working_array.frame(
+        {"isSorted": range(len(working_array))},
+        comparisons, 0,
+        "Array sorted for binary search"
+    )
 
     left = 0
     right = len(working_array) - 1
@@ -39,61 +39,42 @@ def binary_search(arr: List[int], target: int) -> List[Dict[str, Any]]:
         mid = (left + right) // 2
         comparisons += 1
 
-        step_array = [
-            {
-                **el,
-                "isComparing": idx == mid,
-                "isPivot": idx >= left and idx <= right
-            }
-            for idx, el in enumerate(working_array)
-        ]
+        step_flags = {"isComparing": (mid,), "isPivot": range(left, right + 1)}
 
-        steps.append({
-            "array": step_array,
-            "comparisons": comparisons,
-            "swaps": 0,
-            "description": f"Checking middle element at position {mid}: {working_array[mid]['value']}"
-        })
+        yield working_array.frame(
+            step_flags,
+            comparisons, 0,
+            f"Checking middle element at position {mid}: {values[mid]}"
+        )
 
-        if working_array[mid]["value"] == target:
-            found_array = [
-                {
-                    **el,
-                    "isFound": idx == mid
-                }
-                for idx, el in enumerate(working_array)
-            ]
-            steps.append({
-                "array": found_array,
-                "comparisons": comparisons,
-                "swaps": 0,
-                "description": f"Found target {target} at position {mid}!"
-            })
+        if values[mid] == target:
+            yield working_array.frame(
+                {"isFound": (mid,)},
+                comparisons, 0,
+                f"Found target {target} at position {mid}!",
+                key=True
+            )
             break
-        elif working_array[mid]["value"] < target:
+        elif values[mid] < target:
             left = mid + 1
-            steps.append({
-                "array": step_array,
-                "comparisons": comparisons,
-                "swaps": 0,
-                "description": f"{working_array[mid]['value']} < {target}, searching right half"
-            })
+            yield working_array.frame(
+                step_flags,
+                comparisons, 0,
+                f"{values[mid]} < {target}, searching right half"
+            )
         else:
             right = mid - 1
-            steps.append({
-                "array": step_array,
-                "comparisons": comparisons,
-                "swaps": 0,
-                "description": f"{working_array[mid]['value']} > {target}, searching left half"
-            })
+            yield working_array.frame(
+                step_flags,
+                comparisons, 0,
+                f"{values[mid]} > {target}, searching left half"
+            )
 
     # If not found
     if left > right:
-        steps.append({
-            "array": working_array,
-            "comparisons": comparisons,
-            "swaps": 0,
-            "description": f"Target {target} not found in array"
-        })
-
-    return steps
+        yield working_array.frame(
+            {},
+            comparisons, 0,
+            f"Target {target} not found in array",
+            key=True
+        )
@@ -1,7 +1,9 @@
-from typing import List, Dict, Any
+from typing import List, Iterator
 
+from ..frame import Frame, TraceArray
 
-def linear_search(arr: List[int], target: int) -> List[Dict[str, Any]]:
+
+def linear_search(arr: List[int], target: int) -> Iterator[Frame]:
     """
     Linear Search Algorithm
     
@@ -12,47 +14,38 @@ def linear_search(arr: List[int], target: int) -> List[Dict[str, Any]]:
         arr: List of integers to search
         target: Value to find
         
-    Returns:
-        List of steps showing the search process
+    Yields:
+        Frames showing the search process
     """
-    steps = []
-    working_array = [{"value": val, "id": idx} for idx, val in enumerate(arr)]
+    working_array = TraceArray(arr)
+    values = working_array.values
     comparisons = 0
 
     for i in range(len(working_array)):
         comparisons += 1
-        step_array = [
-            {
-                **el,
-                "isComparing": idx == i,
-                "isFound": idx == i and el["value"] == target
-            }
-            for idx, el in enumerate(working_array)
-        ]
+        found = values[i] == target
 
         description = (
             f"Found target {target} at position {i}!"
-            if working_array[i]["value"] == target
-            else f"Checking position {i}: {working_array[i]['value']} ≠ {target}"
+            if found
+            else f"Checking position {i}: {values[i]} ≠ {target}"
         )
 
-        steps.append({
-            "array": step_array,
-            "comparisons": comparisons,
-            "swaps": 0,
-            "description": description
-        })
+        yield working_array.frame(
+            {"isComparing": (i,), "isFound": (i,) if found else ()},
+            comparisons, 0,
+            description,
+            key=found
+        )
 
-        if working_array[i]["value"] == target:
+        if found:
             break
 
     # If not found, add final step
-    if not any(el["value"] == target for el in working_array):
-        steps.append({
-            "array": working_array,
-            "comparisons": comparisons,
-            "swaps": 0,
-            "description": f"Target {target} not found in array"
-        })
-
-    return steps
+    if target not in values:
+        yield working_array.frame(
+            {},
+            comparisons, 0,
+            f"Target {target} not found in array",
+            key=True
+        )
@@ -3,5 +3,14 @@ from .quick import quick_sort
 from .merge import merge_sort
 from .selection import selection_sort
 from .insertion import insertion_sort
+from .heap import heap_sort
+from .shell import shell_sort
+from .counting import counting_sort
+from .radix import radix_sort
+from .intro import intro_sort
+from .tim import tim_sort
 
-__all__ = ['bubble_sort', 'quick_sort', 'merge_sort', 'selection_sort', 'insertion_sort']
+__all__ = [
+    'bubble_sort', 'quick_sort', 'merge_sort', 'selection_sort', 'insertion_sort',
+    'heap_sort', 'shell_sort', 'counting_sort', 'radix_sort', 'intro_sort', 'tim_sort'
+]
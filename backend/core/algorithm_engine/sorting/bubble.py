@@ -1,75 +1,142 @@
-from typing import List, Dict, Any
+from typing import List, Iterator
 
+from ..frame import Frame, TraceArray
+from ..registry import BUBBLE_VARIANTS
 
-def bubble_sort(arr: List[int]) -> List[Dict[str, Any]]:
+
+def bubble_sort(arr: List[int], variant: str = "standard") -> Iterator[Frame]:
     """
     Bubble Sort Algorithm
     
-    Time Complexity: O(n²)
+    Time Complexity: O(n²); O(n) best with early_exit or cocktail
     Space Complexity: O(1)
     Stable: Yes
     In-place: Yes
     
+    Variants:
+        standard    always runs all n - 1 passes
+        early_exit  stops after the first pass without swaps
+        cocktail    alternates forward and backward passes (cocktail shaker
+                    sort), stopping after the first pass without swaps
+    
     Args:
         arr: List of integers to sort
+        variant: standard, early_exit or cocktail
         
-    Returns:
-        List of steps showing the sorting process
+    Yields:
+        Frames showing the sorting process
     """
-    steps = []
-    working_array = [{"value": val, "id": idx} for idx, val in enumerate(arr)]
+    if variant not in BUBBLE_VARIANTS:
+        raise ValueError(f"Unknown bubble sort variant: {variant}")
+    if variant == "cocktail":
+        yield from _cocktail_sort(arr)
+        return
+
+    working_array = TraceArray(arr)
+    values = working_array.values
     comparisons = 0
     swaps = 0
     n = len(working_array)
 
     for i in range(n - 1):
+        sorted_range = range(n - i, n)
+        swapped = False
         for j in range(n - i - 1):
-            # Create comparison step
-            step_array = [
-                {
-                    **el,
-                    "isComparing": idx == j or idx == j + 1,
-                    "isSorted": idx >= n - i
-                }
-                for idx, el in enumerate(working_array)
-            ]
-            
+            # Create comparison step; the first one of a pass is a key event
             comparisons += 1
-            steps.append({
-                "array": step_array,
-                "comparisons": comparisons,
-                "swaps": swaps,
-                "description": f"Comparing elements at positions {j} and {j + 1}"
-            })
+            yield working_array.frame(
+                {"isComparing": (j, j + 1), "isSorted": sorted_range},
+                comparisons, swaps,
+                f"Comparing elements at positions {j} and {j + 1}",
+                key=j == 0
+            )
 
             # Swap if needed
-            if working_array[j]["value"] > working_array[j + 1]["value"]:
-                working_array[j], working_array[j + 1] = working_array[j + 1], working_array[j]
+            if values[j] > values[j + 1]:
+                working_array.swap(j, j + 1)
                 swaps += 1
+                swapped = True
+
+                yield working_array.frame(
+                    {"isSwapping": (j, j + 1), "isSorted": sorted_range},
+                    comparisons, swaps,
+                    f"Swapped elements at positions {j} and {j + 1}"
+                )
+
+        if variant == "early_exit" and not swapped:
+            yield working_array.frame(
+                {"isSorted": range(n)},
+                comparisons, swaps,
+                f"No swaps in pass {i + 1}, the array is sorted",
+                key=True
+            )
+            break
+
+    # Final sorted array
+    yield working_array.frame(
+        {"isSorted": range(n)},
+        comparisons, swaps,
+        "Sorting completed!"
+    )
+
+
+def _cocktail_sort(arr: List[int]) -> Iterator[Frame]:
+    """Cocktail shaker variant of bubble_sort"""
+    working_array = TraceArray(arr)
+    values = working_array.values
+    comparisons = 0
+    swaps = 0
+    n = len(working_array)
+    low, high = 0, n - 1
+
+    while low < high:
+        for direction in ("forward", "backward"):
+            if direction == "forward":
+                positions = range(low, high)
+            else:
+                positions = range(high - 1, low - 1, -1)
+            sorted_ranges = (range(low), range(high + 1, n))
+            swapped = False
+
+            for j in positions:
+                comparisons += 1
+                yield working_array.frame(
+                    {"isComparing": (j, j + 1), "isSorted": sorted_ranges},
+                    comparisons, swaps,
+                    f"Comparing elements at positions {j} and {j + 1} ({direction} pass)",
+                    key=j == positions[0]
+                )
+
+                if values[j] > values[j + 1]:
+                    working_array.swap(j, j + 1)
+                    swaps += 1
+                    swapped = True
+
+                    yield working_array.frame(
+                        {"isSwapping": (j, j + 1), "isSorted": sorted_ranges},
+                        comparisons, swaps,
+                        f"Swapped elements at positions {j} and {j + 1}"
+                    )
+
+            # A forward pass settles the largest element, a backward pass the smallest
+            if direction == "forward":
+                high -= 1
+            else:
+                low += 1
 
-                swap_array = [
-                    {
-                        **el,
-                        "isSwapping": idx == j or idx == j + 1,
-                        "isSorted": idx >= n - i
-                    }
-                    for idx, el in enumerate(working_array)
-                ]
-
-                steps.append({
-                    "array": swap_array,
-                    "comparisons": comparisons,
-                    "swaps": swaps,
-                    "description": f"Swapped elements at positions {j} and {j + 1}"
-                })
+            if not swapped:
+                yield working_array.frame(
+                    {"isSorted": range(n)},
+                    comparisons, swaps,
+                    f"No swaps in the {direction} pass, the array is sorted",
+                    key=True
+                )
+                low = high
+                break
 
     # Final sorted array
-    final_array = [{"value": el["value"], "id": el["id"], "isSorted": True} for el in working_array]
-    steps.append({
-        "array": final_array,
-        "comparisons": comparisons,
-        "swaps": swaps,
-        "description": "Sorting completed!"
-    })
-
-    return steps
+    yield working_array.frame(
+        {"isSorted": range(n)},
+        comparisons, swaps,
+        "Sorting completed!"
+    )
@@ -0,0 +1,81 @@
+from typing import List, Iterator
+
+from ..frame import Frame, TraceArray
+
+# Largest supported max - min + 1; the count table has one entry per value in the range
+MAX_VALUE_RANGE = 1_000_000
+
+
+def counting_sort(arr: List[int]) -> Iterator[Frame]:
+    """
+    Counting Sort Algorithm
+
+    Time Complexity: O(n + k), k = max - min + 1
+    Space Complexity: O(n + k)
+    Stable: Yes
+    In-place: No
+
+    Tallies how often each value occurs, turns the tallies into the first
+    output position of each value, then writes every element to its position
+    in input order. Values are offset by the minimum, so negative values are
+    supported. No elements are compared, so comparisons stay 0; every write
+    counts as a swap.
+
+    Args:
+        arr: List of integers to sort
+
+    Yields:
+        Frames showing the sorting process
+
+    Raises:
+        ValueError: If max - min + 1 exceeds MAX_VALUE_RANGE
+    """
+    working_array = TraceArray(arr)
+    source_values, source_ids = working_array.values[:], working_array.ids[:]
+    comparisons = 0
+    swaps = 0
+    n = len(working_array)
+
+    if n:
+        low, high = min(source_values), max(source_values)
+        if high - low + 1 > MAX_VALUE_RANGE:
+            raise ValueError(f"Counting sort supports a value range of at most {MAX_VALUE_RANGE}, got {high - low + 1}")
+
+        counts = [0] * (high - low + 1)
+        for i, value in enumerate(source_values):
+            counts[value - low] += 1
+            yield working_array.frame(
+                {"isComparing": (i,)},
+                comparisons, swaps,
+                f"Counted value {value} at position {i} ({counts[value - low]} so far)"
+            )
+
+        # Prefix sums: first output position of every value
+        position = 0
+        for offset, count in enumerate(counts):
+            counts[offset] = position
+            position += count
+        yield working_array.frame(
+            {"isComparing": ()},
+            comparisons, swaps,
+            f"Computed output positions for {high - low + 1} possible values",
+            key=True
+        )
+
+        for value, el_id in zip(source_values, source_ids):
+            k = counts[value - low]
+            counts[value - low] += 1
+            working_array.write(k, value, el_id)
+            swaps += 1
+            yield working_array.frame(
+                {"isSwapping": (k,)},
+                comparisons, swaps,
+                f"Wrote {value} to position {k}"
+            )
+
+    # Final sorted array
+    yield working_array.frame(
+        {"isSorted": range(n)},
+        comparisons, swaps,
+        "Counting sort completed!"
+    )
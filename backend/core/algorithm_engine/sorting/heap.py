@@ -0,0 +1,87 @@
+from typing import List, Iterator
+
+from ..frame import Frame, TraceArray
+
+
+def heap_sort(arr: List[int]) -> Iterator[Frame]:
+    """
+    Heap Sort Algorithm
+
+    Time Complexity: O(n log n)
+    Space Complexity: O(1)
+    Stable: No
+    In-place: Yes
+
+    Builds a max-heap in the array, then repeatedly moves the root (the
+    largest remaining element) behind the heap and sifts the new root down.
+
+    Args:
+        arr: List of integers to sort
+
+    Yields:
+        Frames showing the sorting process
+    """
+    working_array = TraceArray(arr)
+    values = working_array.values
+    comparisons = 0
+    swaps = 0
+    n = len(working_array)
+
+    def sift_down(root: int, end: int) -> Iterator[Frame]:
+        nonlocal comparisons, swaps
+        sorted_range = range(end, n)
+
+        while True:
+            largest = root
+            for child in (2 * root + 1, 2 * root + 2):
+                if child < end:
+                    comparisons += 1
+                    yield working_array.frame(
+                        {"isComparing": (largest, child), "isPivot": (root,), "isSorted": sorted_range},
+                        comparisons, swaps,
+                        f"Comparing {values[child]} at position {child} with {values[largest]} at position {largest}"
+                    )
+                    if values[child] > values[largest]:
+                        largest = child
+
+            if largest == root:
+                return
+
+            working_array.swap(root, largest)
+            swaps += 1
+            yield working_array.frame(
+                {"isSwapping": (root, largest), "isSorted": sorted_range},
+                comparisons, swaps,
+                f"Sifted {values[largest]} down from position {root} to position {largest}"
+            )
+            root = largest
+
+    # Build the max-heap bottom-up
+    for root in range(n // 2 - 1, -1, -1):
+        yield from sift_down(root, n)
+
+    if n > 1:
+        yield working_array.frame(
+            {"isPivot": (0,)},
+            comparisons, swaps,
+            f"Built max-heap, largest element is {values[0]}",
+            key=True
+        )
+
+    for end in range(n - 1, 0, -1):
+        working_array.swap(0, end)
+        swaps += 1
+        yield working_array.frame(
+            {"isSwapping": (0, end), "isSorted": range(end, n)},
+            comparisons, swaps,
+            f"Moved largest element {values[end]} to position {end}",
+            key=True
+        )
+        yield from sift_down(0, end)
+
+    # Final sorted array
+    yield working_array.frame(
+        {"isSorted": range(n)},
+        comparisons, swaps,
+        "Heap sort completed!"
+    )
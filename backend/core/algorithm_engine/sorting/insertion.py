@@ -1,108 +1,145 @@
-from typing import List, Dict, Any
+from typing import List, Iterator
 
+from ..frame import Frame, TraceArray
+from ..registry import INSERTION_VARIANTS
 
-def insertion_sort(arr: List[int]) -> List[Dict[str, Any]]:
+
+def insertion_sort(arr: List[int], variant: str = "linear") -> Iterator[Frame]:
     """
     Insertion Sort Algorithm
     
-    Time Complexity: O(n²) worst, O(n) best
+    Time Complexity: O(n²) worst, O(n) best (O(n log n) best with binary)
     Space Complexity: O(1)
     Stable: Yes
     In-place: Yes
     
+    Variants:
+        linear  scans left from the key, comparing and shifting one element at a time
+        binary  finds the insertion point by binary search, so each key takes
+                O(log i) comparisons, then shifts the larger elements right
+    
     Args:
         arr: List of integers to sort
+        variant: linear or binary
         
-    Returns:
-        List of steps showing the sorting process
+    Yields:
+        Frames showing the sorting process
     """
-    steps = []
-    working_array = [{"value": val, "id": idx} for idx, val in enumerate(arr)]
+    if variant not in INSERTION_VARIANTS:
+        raise ValueError(f"Unknown insertion sort variant: {variant}")
+    if variant == "binary":
+        yield from _binary_insertion_sort(arr)
+        return
+
+    working_array = TraceArray(arr)
+    values, ids = working_array.values, working_array.ids
     comparisons = 0
     swaps = 0
     n = len(working_array)
 
     for i in range(1, n):
-        key = working_array[i].copy()
+        key_value, key_id = values[i], ids[i]
         
         # Show key selection
-        key_array = [
-            {
-                **el,
-                "isComparing": idx == i,
-                "isSorted": idx < i
-            }
-            for idx, el in enumerate(working_array)
-        ]
-        steps.append({
-            "array": key_array,
-            "comparisons": comparisons,
-            "swaps": swaps,
-            "description": f"Picking key element {key['value']} at position {i}"
-        })
+        yield working_array.frame(
+            {"isComparing": (i,), "isSorted": range(i)},
+            comparisons, swaps,
+            f"Picking key element {key_value} at position {i}"
+        )
 
         j = i - 1
-        while j >= 0 and working_array[j]["value"] > key["value"]:
+        while j >= 0 and values[j] > key_value:
             comparisons += 1
-            compare_array = [
-                {
-                    **el,
-                    "isComparing": idx == j or idx == i,
-                    "isSorted": idx >= i
-                }
-                for idx, el in enumerate(working_array)
-            ]
-            steps.append({
-                "array": compare_array,
-                "comparisons": comparisons,
-                "swaps": swaps,
-                "description": f"Comparing key {key['value']} with {working_array[j]['value']}"
-            })
-
-            working_array[j + 1] = working_array[j]
+            yield working_array.frame(
+                {"isComparing": (j, i), "isSorted": range(i, n)},
+                comparisons, swaps,
+                f"Comparing key {key_value} with {values[j]}"
+            )
+
+            working_array.write(j + 1, values[j], ids[j])
             swaps += 1
             j -= 1
 
-            shift_array = [
-                {
-                    **el,
-                    "isSwapping": idx == j + 1 or idx == j + 2,
-                    "isSorted": idx >= i
-                }
-                for idx, el in enumerate(working_array)
-            ]
-            steps.append({
-                "array": shift_array,
-                "comparisons": comparisons,
-                "swaps": swaps,
-                "description": f"Shifted element right to make space"
-            })
-
-        working_array[j + 1] = key
+            yield working_array.frame(
+                {"isSwapping": (j + 1, j + 2), "isSorted": range(i, n)},
+                comparisons, swaps,
+                f"Shifted element right to make space"
+            )
+
+        working_array.write(j + 1, key_value, key_id)
+        swaps += 1
+
+        yield working_array.frame(
+            {"isSwapping": (j + 1,), "isSorted": range(i + 1)},
+            comparisons, swaps,
+            f"Inserted key {key_value} at position {j + 1}",
+            key=True
+        )
+
+    # Final sorted array
+    yield working_array.frame(
+        {"isSorted": range(n)},
+        comparisons, swaps,
+        "Insertion sort completed!"
+    )
+
+
+def _binary_insertion_sort(arr: List[int]) -> Iterator[Frame]:
+    """Binary insertion variant of insertion_sort"""
+    working_array = TraceArray(arr)
+    values, ids = working_array.values, working_array.ids
+    comparisons = 0
+    swaps = 0
+    n = len(working_array)
+
+    for i in range(1, n):
+        key_value, key_id = values[i], ids[i]
+        
+        # Show key selection
+        yield working_array.frame(
+            {"isComparing": (i,), "isSorted": range(i)},
+            comparisons, swaps,
+            f"Picking key element {key_value} at position {i}"
+        )
+
+        # Insert after equal elements to stay stable
+        low, high = 0, i
+        while low < high:
+            mid = (low + high) // 2
+            comparisons += 1
+            yield working_array.frame(
+                {"isComparing": (mid, i), "isSorted": range(i, n)},
+                comparisons, swaps,
+                f"Comparing key {key_value} with {values[mid]} at position {mid}"
+            )
+            if values[mid] > key_value:
+                high = mid
+            else:
+                low = mid + 1
+
+        for j in range(i - 1, low - 1, -1):
+            working_array.write(j + 1, values[j], ids[j])
+            swaps += 1
+
+            yield working_array.frame(
+                {"isSwapping": (j, j + 1), "isSorted": range(i, n)},
+                comparisons, swaps,
+                f"Shifted element right to make space"
+            )
+
+        working_array.write(low, key_value, key_id)
         swaps += 1
 
-        insert_array = [
-            {
-                **el,
-                "isSwapping": idx == j + 1,
-                "isSorted": idx <= i
-            }
-            for idx, el in enumerate(working_array)
-        ]
-        steps.append({
-            "array": insert_array,
-            "comparisons": comparisons,
-            "swaps": swaps,
-            "description": f"Inserted key {key['value']} at position {j + 1}"
-        })
+        yield working_array.frame(
+            {"isSwapping": (low,), "isSorted": range(i + 1)},
+            comparisons, swaps,
+            f"Inserted key {key_value} at position {low}",
+            key=True
+        )
 
     # Final sorted array
-    final_array = [{"value": el["value"], "id": el["id"], "isSorted": True} for el in working_array]
-    steps.append({
-        "array": final_array,
-        "comparisons": comparisons,
-        "swaps": swaps,
-        "description": "Insertion sort completed!"
-    })
-
-    return steps
+    yield working_array.frame(
+        {"isSorted": range(n)},
+        comparisons, swaps,
+        "Insertion sort completed!"
+    )
@@ -0,0 +1,198 @@
+from typing import List, Iterator, Generator
+
+from ..frame import Frame, TraceArray
+from .pivots import pivot_selector
+
+# Ranges up to this size are finished with insertion sort
+INSERTION_THRESHOLD = 16
+
+
+def intro_sort(arr: List[int]) -> Iterator[Frame]:
+    """
+    Introsort Algorithm
+
+    Time Complexity: O(n log n)
+    Space Complexity: O(log n)
+    Stable: No
+    In-place: Yes
+
+    Quick sort with median-of-three pivots that switches to heap sort for any
+    range whose partitioning depth exceeds 2·log2(n), so adversarial inputs
+    cannot make it quadratic, and to insertion sort for ranges of at most
+    INSERTION_THRESHOLD elements.
+
+    Args:
+        arr: List of integers to sort
+
+    Yields:
+        Frames showing the sorting process
+    """
+    working_array = TraceArray(arr)
+    values, ids = working_array.values, working_array.ids
+    choose_pivot = pivot_selector("median3")
+    comparisons = 0
+    swaps = 0
+    n = len(working_array)
+
+    def partition(low: int, high: int) -> Generator[Frame, None, int]:
+        nonlocal comparisons, swaps
+
+        pivot_index, used = choose_pivot(values, low, high)
+        comparisons += used
+        if pivot_index != high:
+            working_array.swap(pivot_index, high)
+            swaps += 1
+            yield working_array.frame(
+                {"isPivot": (high,), "isSwapping": (pivot_index, high)},
+                comparisons, swaps,
+                f"Moved median-of-three pivot {values[high]} from position {pivot_index} to position {high}"
+            )
+
+        pivot = values[high]
+        i = low - 1
+        for j in range(low, high):
+            comparisons += 1
+            yield working_array.frame(
+                {"isPivot": (high,), "isComparing": (j,)},
+                comparisons, swaps,
+                f"Comparing {values[j]} with pivot {pivot}"
+            )
+            if values[j] < pivot:
+                i += 1
+                if i != j:
+                    working_array.swap(i, j)
+                    swaps += 1
+                    yield working_array.frame(
+                        {"isPivot": (high,), "isSwapping": (i, j)},
+                        comparisons, swaps,
+                        f"Swapped elements at positions {i} and {j}"
+                    )
+
+        working_array.swap(i + 1, high)
+        swaps += 1
+        yield working_array.frame(
+            {"isSwapping": (i + 1, high), "isSorted": (i + 1,)},
+            comparisons, swaps,
+            f"Placed pivot in correct position: {i + 1}",
+            key=True
+        )
+        return i + 1
+
+    def insertion_sort(low: int, high: int) -> Iterator[Frame]:
+        nonlocal comparisons, swaps
+
+        for i in range(low + 1, high + 1):
+            key_value, key_id = values[i], ids[i]
+            j = i
+            while j > low:
+                comparisons += 1
+                yield working_array.frame(
+                    {"isComparing": (j - 1, j)},
+                    comparisons, swaps,
+                    f"Comparing {values[j - 1]} with key {key_value}"
+                )
+                if values[j - 1] <= key_value:
+                    break
+                working_array.write(j, values[j - 1], ids[j - 1])
+                swaps += 1
+                j -= 1
+
+            if j != i:
+                working_array.write(j, key_value, key_id)
+                swaps += 1
+                yield working_array.frame(
+                    {"isSwapping": (j,)},
+                    comparisons, swaps,
+                    f"Inserted key {key_value} at position {j}"
+                )
+
+    def heap_sort(low: int, high: int) -> Iterator[Frame]:
+        nonlocal comparisons, swaps
+
+        def sift_down(root: int, end: int) -> Iterator[Frame]:
+            # root and end are relative to low
+            nonlocal comparisons, swaps
+            while True:
+                largest = root
+                for child in (2 * root + 1, 2 * root + 2):
+                    if child < end:
+                        comparisons += 1
+                        yield working_array.frame(
+                            {"isComparing": (low + largest, low + child), "isPivot": (low + root,)},
+                            comparisons, swaps,
+                            f"Heap: comparing {values[low + child]} with {values[low + largest]}"
+                        )
+                        if values[low + child] > values[low + largest]:
+                            largest = child
+                if largest == root:
+                    return
+                working_array.swap(low + root, low + largest)
+                swaps += 1
+                yield working_array.frame(
+                    {"isSwapping": (low + root, low + largest)},
+                    comparisons, swaps,
+                    f"Heap: sifted {values[low + largest]} down to position {low + largest}"
+                )
+                root = largest
+
+        size = high - low + 1
+        for root in range(size // 2 - 1, -1, -1):
+            yield from sift_down(root, size)
+        for end in range(size - 1, 0, -1):
+            working_array.swap(low, low + end)
+            swaps += 1
+            yield working_array.frame(
+                {"isSwapping": (low, low + end)},
+                comparisons, swaps,
+                f"Heap: moved largest element {values[low + end]} to position {low + end}"
+            )
+            yield from sift_down(0, end)
+
+    depth_limit = 2 * (n.bit_length() - 1) if n > 1 else 0
+    stack = [(0, n - 1, depth_limit)]
+    while stack:
+        low, high, depth = stack.pop()
+        size = high - low + 1
+        if size <= 1:
+            continue
+
+        if size <= INSERTION_THRESHOLD:
+            yield working_array.frame(
+                {"isComparing": range(low, high + 1)},
+                comparisons, swaps,
+                f"Range {low}-{high} has {size} elements, finishing it with insertion sort",
+                key=True
+            )
+            yield from insertion_sort(low, high)
+            yield working_array.frame(
+                {"isSorted": range(low, high + 1)},
+                comparisons, swaps,
+                f"Insertion sorted range {low}-{high}",
+                key=True
+            )
+        elif depth == 0:
+            yield working_array.frame(
+                {"isComparing": range(low, high + 1)},
+                comparisons, swaps,
+                f"Depth limit reached for range {low}-{high}, switching to heap sort",
+                key=True
+            )
+            yield from heap_sort(low, high)
+            yield working_array.frame(
+                {"isSorted": range(low, high + 1)},
+                comparisons, swaps,
+                f"Heap sorted range {low}-{high}",
+                key=True
+            )
+        else:
+            pi = yield from partition(low, high)
+            # The left part is popped first, as in quick_sort
+            stack.append((pi + 1, high, depth - 1))
+            stack.append((low, pi - 1, depth - 1))
+
+    # Final sorted array
+    yield working_array.frame(
+        {"isSorted": range(n), "isPivot": ()},
+        comparisons, swaps,
+        "Introsort completed!"
+    )
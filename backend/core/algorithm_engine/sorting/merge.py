@@ -1,7 +1,10 @@
-from typing import List, Dict, Any
+from typing import List, Iterator
 
+from ..frame import Frame, TraceArray
+from ..registry import MERGE_VARIANTS
 
-def merge_sort(arr: List[int]) -> List[Dict[str, Any]]:
+
+def merge_sort(arr: List[int], variant: str = "top_down") -> Iterator[Frame]:
     """
     Merge Sort Algorithm
     
@@ -10,79 +13,91 @@ def merge_sort(arr: List[int]) -> List[Dict[str, Any]]:
     Stable: Yes
     In-place: No
     
+    The top_down variant splits ranges in half, using an explicit stack that
+    merges in the same order as the recursive formulation. The bottom_up
+    variant merges runs of width 1, 2, 4, ... from left to right without any
+    splitting.
+    
     Args:
         arr: List of integers to sort
+        variant: top_down or bottom_up
         
-    Returns:
-        List of steps showing the sorting process
+    Yields:
+        Frames showing the sorting process
     """
-    steps = []
-    working_array = [{"value": val, "id": idx} for idx, val in enumerate(arr)]
+    if variant not in MERGE_VARIANTS:
+        raise ValueError(f"Unknown merge sort variant: {variant}")
+
+    working_array = TraceArray(arr)
+    values, ids = working_array.values, working_array.ids
+    n = len(working_array)
     comparisons = 0
     swaps = 0
 
-    def merge(left: int, mid: int, right: int):
+    def merge(left: int, mid: int, right: int) -> Iterator[Frame]:
         nonlocal comparisons, swaps
         
-        left_arr = working_array[left:mid + 1]
-        right_arr = working_array[mid + 1:right + 1]
+        left_values, left_ids = values[left:mid + 1], ids[left:mid + 1]
+        right_values, right_ids = values[mid + 1:right + 1], ids[mid + 1:right + 1]
+        merge_flags = {"isComparing": range(left, right + 1), "isSorted": (range(left), range(right + 1, n))}
         i = j = 0
         k = left
 
-        while i < len(left_arr) and j < len(right_arr):
+        while i < len(left_values) and j < len(right_values):
+            # The first comparison of a merge is a key event
             comparisons += 1
-            step_array = [
-                {
-                    **el,
-                    "isComparing": idx >= left and idx <= right,
-                    "isSorted": idx < left or idx > right
-                }
-                for idx, el in enumerate(working_array)
-            ]
-            steps.append({
-                "array": step_array,
-                "comparisons": comparisons,
-                "swaps": swaps,
-                "description": f"Merging: comparing {left_arr[i]['value']} and {right_arr[j]['value']}"
-            })
+            yield working_array.frame(
+                merge_flags,
+                comparisons, swaps,
+                f"Merging: comparing {left_values[i]} and {right_values[j]}",
+                key=k == left
+            )
 
-            if left_arr[i]["value"] <= right_arr[j]["value"]:
-                working_array[k] = left_arr[i]
+            if left_values[i] <= right_values[j]:
+                working_array.write(k, left_values[i], left_ids[i])
                 i += 1
             else:
-                working_array[k] = right_arr[j]
+                working_array.write(k, right_values[j], right_ids[j])
                 j += 1
             swaps += 1
             k += 1
 
-        while i < len(left_arr):
-            working_array[k] = left_arr[i]
+        while i < len(left_values):
+            working_array.write(k, left_values[i], left_ids[i])
             i += 1
             k += 1
             swaps += 1
 
-        while j < len(right_arr):
-            working_array[k] = right_arr[j]
+        while j < len(right_values):
+            working_array.write(k, right_values[j], right_ids[j])
             j += 1
             k += 1
             swaps += 1
 
-    def merge_sort_helper(left: int, right: int):
-        if left < right:
+    if variant == "bottom_up":
+        width = 1
+        while width < n:
+            for left in range(0, n - width, 2 * width):
+                yield from merge(left, left + width - 1, min(left + 2 * width - 1, n - 1))
+            width *= 2
+    else:
+        # (left, right, halves_sorted); a range is merged once both halves are done
+        stack = [(0, n - 1, False)]
+        while stack:
+            left, right, halves_sorted = stack.pop()
+            if left >= right:
+                continue
             mid = (left + right) // 2
-            merge_sort_helper(left, mid)
-            merge_sort_helper(mid + 1, right)
-            merge(left, mid, right)
-
-    merge_sort_helper(0, len(working_array) - 1)
+            if halves_sorted:
+                yield from merge(left, mid, right)
+            else:
+                stack.append((left, right, True))
+                stack.append((mid + 1, right, False))
+                stack.append((left, mid, False))
 
     # Final sorted array
-    final_array = [{"value": el["value"], "id": el["id"], "isSorted": True} for el in working_array]
-    steps.append({
-        "array": final_array,
-        "comparisons": comparisons,
-        "swaps": swaps,
-        "description": "Merge sort completed!"
-    })
-
-    return steps
+    yield working_array.frame(
+        {"isSorted": range(n)},
+        comparisons, swaps,
+        "Merge sort completed!"
+    )
@@ -0,0 +1,63 @@
+from typing import Callable, Optional, Sequence, Tuple
+import random
+
+
+# Below this many elements ninther falls back to median-of-three
+NINTHER_MIN_SIZE = 9
+
+
+def _median3(values: Sequence[int], a: int, b: int, c: int) -> Tuple[int, int]:
+    """Index of the median of values[a], values[b], values[c] and the comparisons used"""
+    if values[a] < values[b]:
+        if values[b] < values[c]:
+            return b, 2
+        return (c, 3) if values[a] < values[c] else (a, 3)
+    if values[a] < values[c]:
+        return a, 2
+    return (c, 3) if values[b] < values[c] else (b, 3)
+
+
+def pivot_selector(strategy: str = "last", seed: Optional[int] = None) -> Callable[[Sequence[int], int, int], Tuple[int, int]]:
+    """
+    Build the pivot selection function of a quick sort run
+
+    Strategies:
+        last     the last element of the range
+        median3  median of the first, middle and last elements
+        random   a uniformly random element, from a generator seeded with `seed` (0 if None)
+        ninther  median of the medians of three evenly spaced triples (Tukey's ninther)
+
+    Args:
+        strategy: One of registry.PIVOT_STRATEGIES
+        seed: Seed of the random strategy
+
+    Returns:
+        Function taking (values, low, high) and returning the pivot index and
+        the number of comparisons spent choosing it
+    """
+    if strategy == "last":
+        return lambda values, low, high: (high, 0)
+
+    if strategy == "median3":
+        return lambda values, low, high: _median3(values, low, (low + high) // 2, high)
+
+    if strategy == "random":
+        rng = random.Random(0 if seed is None else seed)
+        return lambda values, low, high: (rng.randint(low, high), 0)
+
+    if strategy == "ninther":
+        def ninther(values: Sequence[int], low: int, high: int) -> Tuple[int, int]:
+            if high - low + 1 < NINTHER_MIN_SIZE:
+                return _median3(values, low, (low + high) // 2, high)
+            step = (high - low) // 8
+            medians = []
+            comparisons = 0
+            for start in (low, low + 3 * step, low + 6 * step):
+                index, used = _median3(values, start, start + step, start + 2 * step)
+                medians.append(index)
+                comparisons += used
+            index, used = _median3(values, *medians)
+            return index, comparisons + used
+        return ninther
+
+    raise ValueError(f"Unknown pivot strategy: {strategy}")
@@ -1,7 +1,16 @@
-from typing import List, Dict, Any
+from typing import List, Iterator, Generator, Optional, Tuple
 
+from ..frame import Frame, TraceArray
+from ..registry import QUICK_VARIANTS
+from .pivots import pivot_selector
 
-def quick_sort(arr: List[int]) -> List[Dict[str, Any]]:
+
+def quick_sort(
+    arr: List[int],
+    pivot: str = "last",
+    seed: Optional[int] = None,
+    variant: str = "lomuto"
+) -> Iterator[Frame]:
     """
     Quick Sort Algorithm
     
@@ -10,112 +19,168 @@ def quick_sort(arr: List[int]) -> List[Dict[str, Any]]:
     Stable: No
     In-place: Yes
     
+    Partitions are processed from an explicit stack in the same order as the
+    recursive formulation, so deep partitions (e.g. sorted input with the last
+    element as pivot) cannot exceed the recursion limit.
+    
+    Variants:
+        lomuto     splits each range into elements below the pivot and the
+                   rest; elements equal to the pivot all land on one side,
+                   so duplicate-heavy input is O(n²) whatever the pivot
+                   strategy (e.g. [1] * n)
+        three_way  splits each range into elements below, equal to and above
+                   the pivot (Dijkstra's Dutch national flag partition) and
+                   only recurses into the outer parts, so [1] * n is O(n)
+    
     Args:
         arr: List of integers to sort
+        pivot: Pivot strategy: last, median3, random or ninther (see pivots.py)
+        seed: Seed of the random pivot strategy
+        variant: lomuto or three_way
         
-    Returns:
-        List of steps showing the sorting process
+    Yields:
+        Frames showing the sorting process
     """
-    steps = []
-    working_array = [{"value": val, "id": idx} for idx, val in enumerate(arr)]
+    if variant not in QUICK_VARIANTS:
+        raise ValueError(f"Unknown quick sort variant: {variant}")
+
+    working_array = TraceArray(arr)
+    values = working_array.values
+    choose_pivot = pivot_selector(pivot, seed)
     comparisons = 0
     swaps = 0
 
-    def partition(low: int, high: int) -> int:
+    def partition(low: int, high: int) -> Generator[Frame, None, int]:
         nonlocal comparisons, swaps
         
-        pivot = working_array[high]
+        # Move the chosen pivot to the end of the range
+        pivot_index, used = choose_pivot(values, low, high)
+        comparisons += used
+        if pivot_index != high:
+            working_array.swap(pivot_index, high)
+            swaps += 1
+            yield working_array.frame(
+                {"isPivot": (high,), "isSwapping": (pivot_index, high)},
+                comparisons, swaps,
+                f"Moved pivot {values[high]} from position {pivot_index} to position {high}"
+            )
+        
+        pivot = values[high]
         i = low - 1
 
         # Show pivot selection
-        pivot_array = [
-            {**el, "isPivot": idx == high}
-            for idx, el in enumerate(working_array)
-        ]
-        steps.append({
-            "array": pivot_array,
-            "comparisons": comparisons,
-            "swaps": swaps,
-            "description": f"Selected pivot: {pivot['value']} at position {high}"
-        })
+        yield working_array.frame(
+            {"isPivot": (high,)},
+            comparisons, swaps,
+            f"Selected pivot: {pivot} at position {high}"
+        )
 
         for j in range(low, high):
             comparisons += 1
-            compare_array = [
-                {
-                    **el,
-                    "isPivot": idx == high,
-                    "isComparing": idx == j
-                }
-                for idx, el in enumerate(working_array)
-            ]
-            steps.append({
-                "array": compare_array,
-                "comparisons": comparisons,
-                "swaps": swaps,
-                "description": f"Comparing {working_array[j]['value']} with pivot {pivot['value']}"
-            })
-
-            if working_array[j]["value"] < pivot["value"]:
+            yield working_array.frame(
+                {"isPivot": (high,), "isComparing": (j,)},
+                comparisons, swaps,
+                f"Comparing {values[j]} with pivot {pivot}"
+            )
+
+            if values[j] < pivot:
                 i += 1
                 if i != j:
-                    working_array[i], working_array[j] = working_array[j], working_array[i]
+                    working_array.swap(i, j)
                     swaps += 1
 
-                    swap_array = [
-                        {
-                            **el,
-                            "isPivot": idx == high,
-                            "isSwapping": idx == i or idx == j
-                        }
-                        for idx, el in enumerate(working_array)
-                    ]
-                    steps.append({
-                        "array": swap_array,
-                        "comparisons": comparisons,
-                        "swaps": swaps,
-                        "description": f"Swapped elements at positions {i} and {j}"
-                    })
+                    yield working_array.frame(
+                        {"isPivot": (high,), "isSwapping": (i, j)},
+                        comparisons, swaps,
+                        f"Swapped elements at positions {i} and {j}"
+                    )
 
         # Place pivot in correct position
-        working_array[i + 1], working_array[high] = working_array[high], working_array[i + 1]
+        working_array.swap(i + 1, high)
         swaps += 1
 
-        final_swap_array = [
-            {
-                **el,
-                "isSwapping": idx == i + 1 or idx == high,
-                "isSorted": idx == i + 1
-            }
-            for idx, el in enumerate(working_array)
-        ]
-        steps.append({
-            "array": final_swap_array,
-            "comparisons": comparisons,
-            "swaps": swaps,
-            "description": f"Placed pivot in correct position: {i + 1}"
-        })
+        yield working_array.frame(
+            {"isSwapping": (i + 1, high), "isSorted": (i + 1,)},
+            comparisons, swaps,
+            f"Placed pivot in correct position: {i + 1}",
+            key=True
+        )
 
         return i + 1
 
-    def quick_sort_helper(low: int, high: int):
-        if low < high:
-            pi = partition(low, high)
-            quick_sort_helper(low, pi - 1)
-            quick_sort_helper(pi + 1, high)
+    def partition_three_way(low: int, high: int) -> Generator[Frame, None, Tuple[int, int]]:
+        nonlocal comparisons, swaps
+
+        pivot_index, used = choose_pivot(values, low, high)
+        comparisons += used
+        pivot = values[pivot_index]
+
+        yield working_array.frame(
+            {"isPivot": (pivot_index,)},
+            comparisons, swaps,
+            f"Selected pivot: {pivot} at position {pivot_index}"
+        )
 
-    quick_sort_helper(0, len(working_array) - 1)
+        # values[low:lt] < pivot, values[lt:i] == pivot, values[gt + 1:high + 1] > pivot
+        lt, i, gt = low, low, high
+        while i <= gt:
+            value = values[i]
+            # Telling "equal" from "greater" takes a second comparison
+            comparisons += 1 if value < pivot else 2
+            yield working_array.frame(
+                {"isPivot": range(lt, i), "isComparing": (i,)},
+                comparisons, swaps,
+                f"Comparing {value} with pivot {pivot}"
+            )
+
+            if value < pivot:
+                if lt != i:
+                    working_array.swap(lt, i)
+                    swaps += 1
+                    yield working_array.frame(
+                        {"isPivot": range(lt + 1, i + 1), "isSwapping": (lt, i)},
+                        comparisons, swaps,
+                        f"Swapped elements at positions {lt} and {i}"
+                    )
+                lt += 1
+                i += 1
+            elif value > pivot:
+                if i != gt:
+                    working_array.swap(i, gt)
+                    swaps += 1
+                    yield working_array.frame(
+                        {"isPivot": range(lt, i), "isSwapping": (i, gt)},
+                        comparisons, swaps,
+                        f"Swapped elements at positions {i} and {gt}"
+                    )
+                gt -= 1
+            else:
+                i += 1
+
+        yield working_array.frame(
+            {"isSorted": range(lt, gt + 1)},
+            comparisons, swaps,
+            f"Placed {gt - lt + 1} element(s) equal to pivot {pivot} in positions {lt}-{gt}",
+            key=True
+        )
+
+        return lt, gt
+
+    stack = [(0, len(working_array) - 1)]
+    while stack:
+        low, high = stack.pop()
+        if low < high:
+            if variant == "three_way":
+                lt, gt = yield from partition_three_way(low, high)
+            else:
+                lt = gt = yield from partition(low, high)
+            # The left part is popped first, as in the recursive version
+            stack.append((gt + 1, high))
+            stack.append((low, lt - 1))
 
     # Final sorted array
-    final_array = [
-        {"value": el["value"], "id": el["id"], "isSorted": True, "isPivot": False}
-        for el in working_array
-    ]
-    steps.append({
-        "array": final_array,
-        "comparisons": comparisons,
-        "swaps": swaps,
-        "description": "Quick sort completed!"
-    })
-
-    return steps
+    yield working_array.frame(
+        {"isSorted": range(len(working_array)), "isPivot": ()},
+        comparisons, swaps,
+        "Quick sort completed!"
+    )
@@ -0,0 +1,84 @@
+from typing import List, Iterator
+
+from ..frame import Frame, TraceArray
+
+RADIX_BASE = 10
+
+
+def radix_sort(arr: List[int]) -> Iterator[Frame]:
+    """
+    LSD Radix Sort Algorithm
+
+    Time Complexity: O(d · (n + b)), d digits in base b = 10
+    Space Complexity: O(n + b)
+    Stable: Yes
+    In-place: No
+
+    Sorts by the least significant decimal digit first, with one stable
+    counting pass per digit. Digits are taken from value - min, so negative
+    values sort correctly and the number of passes depends on the value
+    range rather than on the magnitudes. No elements are compared, so
+    comparisons stay 0; every write counts as a swap.
+
+    Args:
+        arr: List of integers to sort
+
+    Yields:
+        Frames showing the sorting process
+    """
+    working_array = TraceArray(arr)
+    values, ids = working_array.values, working_array.ids
+    comparisons = 0
+    swaps = 0
+    n = len(working_array)
+
+    low = min(values) if n else 0
+    span = max(values) - low if n else 0
+    place = 1
+    digit_pass = 0
+
+    while n > 1 and span // place > 0:
+        digit_pass += 1
+        source_values, source_ids = values[:], ids[:]
+        digits = [(value - low) // place % RADIX_BASE for value in source_values]
+
+        counts = [0] * RADIX_BASE
+        for i, digit in enumerate(digits):
+            counts[digit] += 1
+            yield working_array.frame(
+                {"isComparing": (i,)},
+                comparisons, swaps,
+                f"Pass {digit_pass}: digit of {source_values[i]} at place {place} is {digit}"
+            )
+
+        # Prefix sums: first output position of every digit
+        position = 0
+        for digit, count in enumerate(counts):
+            counts[digit] = position
+            position += count
+
+        for value, el_id, digit in zip(source_values, source_ids, digits):
+            k = counts[digit]
+            counts[digit] += 1
+            working_array.write(k, value, el_id)
+            swaps += 1
+            yield working_array.frame(
+                {"isSwapping": (k,)},
+                comparisons, swaps,
+                f"Pass {digit_pass}: wrote {value} to position {k} (digit {digit})"
+            )
+
+        yield working_array.frame(
+            {"isSwapping": ()},
+            comparisons, swaps,
+            f"Finished pass {digit_pass}, elements are sorted by their last {digit_pass} digit(s)",
+            key=True
+        )
+        place *= RADIX_BASE
+
+    # Final sorted array
+    yield working_array.frame(
+        {"isSorted": range(n)},
+        comparisons, swaps,
+        "Radix sort completed!"
+    )
@@ -1,7 +1,9 @@
-from typing import List, Dict, Any
+from typing import List, Iterator
 
+from ..frame import Frame, TraceArray
 
-def selection_sort(arr: List[int]) -> List[Dict[str, Any]]:
+
+def selection_sort(arr: List[int]) -> Iterator[Frame]:
     """
     Selection Sort Algorithm
     
@@ -13,82 +15,52 @@ def selection_sort(arr: List[int]) -> List[Dict[str, Any]]:
     Args:
         arr: List of integers to sort
         
-    Returns:
-        List of steps showing the sorting process
+    Yields:
+        Frames showing the sorting process
     """
-    steps = []
-    working_array = [{"value": val, "id": idx} for idx, val in enumerate(arr)]
+    working_array = TraceArray(arr)
+    values = working_array.values
     comparisons = 0
     swaps = 0
     n = len(working_array)
 
     for i in range(n - 1):
         min_index = i
+        sorted_range = range(i)
         
         # Show selection of current position
-        selecting_array = [
-            {
-                **el,
-                "isComparing": idx == i,
-                "isSorted": idx < i
-            }
-            for idx, el in enumerate(working_array)
-        ]
-        steps.append({
-            "array": selecting_array,
-            "comparisons": comparisons,
-            "swaps": swaps,
-            "description": f"Finding minimum element from position {i} onwards"
-        })
+        yield working_array.frame(
+            {"isComparing": (i,), "isSorted": sorted_range},
+            comparisons, swaps,
+            f"Finding minimum element from position {i} onwards",
+            key=True
+        )
 
         for j in range(i + 1, n):
             comparisons += 1
-            search_array = [
-                {
-                    **el,
-                    "isComparing": idx == j,
-                    "isPivot": idx == min_index,
-                    "isSorted": idx < i
-                }
-                for idx, el in enumerate(working_array)
-            ]
-            steps.append({
-                "array": search_array,
-                "comparisons": comparisons,
-                "swaps": swaps,
-                "description": f"Comparing {working_array[j]['value']} with current minimum {working_array[min_index]['value']}"
-            })
+            yield working_array.frame(
+                {"isComparing": (j,), "isPivot": (min_index,), "isSorted": sorted_range},
+                comparisons, swaps,
+                f"Comparing {values[j]} with current minimum {values[min_index]}"
+            )
 
-            if working_array[j]["value"] < working_array[min_index]["value"]:
+            if values[j] < values[min_index]:
                 min_index = j
 
         # Swap if needed
         if min_index != i:
-            working_array[i], working_array[min_index] = working_array[min_index], working_array[i]
+            working_array.swap(i, min_index)
             swaps += 1
 
-            swap_array = [
-                {
-                    **el,
-                    "isSwapping": idx == i or idx == min_index,
-                    "isSorted": idx <= i
-                }
-                for idx, el in enumerate(working_array)
-            ]
-            steps.append({
-                "array": swap_array,
-                "comparisons": comparisons,
-                "swaps": swaps,
-                "description": f"Swapped elements at positions {i} and {min_index}"
-            })
+            yield working_array.frame(
+                {"isSwapping": (i, min_index), "isSorted": range(i + 1)},
+                comparisons, swaps,
+                f"Swapped elements at positions {i} and {min_index}"
+            )
 
     # Final sorted array
-    final_array = [{"value": el["value"], "id": el["id"], "isSorted": True} for el in working_array]
-    steps.append({
-        "array": final_array,
-        "comparisons": comparisons,
-        "swaps": swaps,
-        "description": "Selection sort completed!"
-    })
-
-    return steps
+    yield working_array.frame(
+        {"isSorted": range(n)},
+        comparisons, swaps,
+        "Selection sort completed!"
+    )
@@ -0,0 +1,128 @@
+from typing import List, Iterator
+
+from ..frame import Frame, TraceArray
+from ..registry import SHELL_GAP_SEQUENCES
+
+# Ciura's experimentally determined gaps, extended by a factor of 2.25
+CIURA_GAPS = (1, 4, 10, 23, 57, 132, 301, 701, 1750)
+
+
+def gap_sequence(variant: str, n: int) -> List[int]:
+    """
+    Gaps of a shell sort run, largest first and always ending with 1
+
+    Sequences:
+        shell  n/2, n/4, ..., 1 (Shell, 1959)
+        knuth  1, 4, 13, 40, ... below n/3 (Knuth, 1973)
+        ciura  1, 4, 10, 23, 57, 132, 301, 701, 1750, then x2.25, below n (Ciura, 2001)
+
+    Args:
+        variant: One of registry.SHELL_GAP_SEQUENCES
+        n: Array size
+
+    Returns:
+        The gaps in the order they are used
+    """
+    if variant not in SHELL_GAP_SEQUENCES:
+        raise ValueError(f"Unknown shell sort variant: {variant}")
+    if n < 2:
+        return []
+
+    if variant == "shell":
+        gaps = []
+        gap = n // 2
+        while gap > 0:
+            gaps.append(gap)
+            gap //= 2
+        return gaps
+
+    if variant == "knuth":
+        gaps = [1]
+        while 3 * gaps[-1] + 1 < n // 3:
+            gaps.append(3 * gaps[-1] + 1)
+        return gaps[::-1]
+
+    gaps = [gap for gap in CIURA_GAPS if gap < n]
+    if len(gaps) == len(CIURA_GAPS):
+        next_gap = int(gaps[-1] * 2.25)
+        while next_gap < n:
+            gaps.append(next_gap)
+            next_gap = int(next_gap * 2.25)
+    return gaps[::-1]
+
+
+def shell_sort(arr: List[int], variant: str = "shell") -> Iterator[Frame]:
+    """
+    Shell Sort Algorithm
+
+    Time Complexity: O(n²) worst with Shell's gaps, O(n^1.5) with Knuth's
+    Space Complexity: O(1)
+    Stable: No
+    In-place: Yes
+
+    Runs a gapped insertion sort for every gap of the sequence; the final gap
+    of 1 is a plain insertion sort over an almost sorted array.
+
+    Args:
+        arr: List of integers to sort
+        variant: Gap sequence: shell, knuth or ciura (see gap_sequence)
+
+    Yields:
+        Frames showing the sorting process
+    """
+    working_array = TraceArray(arr)
+    values, ids = working_array.values, working_array.ids
+    comparisons = 0
+    swaps = 0
+    n = len(working_array)
+
+    for gap in gap_sequence(variant, n):
+        yield working_array.frame(
+            {"isSorted": ()},
+            comparisons, swaps,
+            f"Sorting elements {gap} positions apart"
+        )
+
+        for i in range(gap, n):
+            key_value, key_id = values[i], ids[i]
+            j = i
+            while j >= gap:
+                comparisons += 1
+                yield working_array.frame(
+                    {"isComparing": (j - gap, j)},
+                    comparisons, swaps,
+                    f"Comparing {values[j - gap]} at position {j - gap} with key {key_value}"
+                )
+                if values[j - gap] <= key_value:
+                    break
+                working_array.write(j, values[j - gap], ids[j - gap])
+                swaps += 1
+                yield working_array.frame(
+                    {"isSwapping": (j - gap, j)},
+                    comparisons, swaps,
+                    f"Shifted {values[j]} from position {j - gap} to position {j}"
+                )
+                j -= gap
+
+            if j != i:
+                working_array.write(j, key_value, key_id)
+                swaps += 1
+                yield working_array.frame(
+                    {"isSwapping": (j,)},
+                    comparisons, swaps,
+                    f"Inserted key {key_value} at position {j}"
+                )
+
+        yield working_array.frame(
+            {"isSorted": range(n) if gap == 1 else ()},
+            comparisons, swaps,
+            f"Finished pass with gap {gap}",
+            key=True
+        )
+
+    # Final sorted array
+    yield working_array.frame(
+        {"isSorted": range(n)},
+        comparisons, swaps,
+        "Shell sort completed!"
+    )
@@ -0,0 +1,235 @@
+from typing import List, Iterator, Generator
+
+from ..frame import Frame, TraceArray
+
+# Arrays shorter than this are a single run extended by binary insertion
+MIN_MERGE = 64
+
+
+def min_run_length(n: int) -> int:
+    """
+    Minimum run length of a Timsort run, as in CPython's listsort
+
+    Takes the six most significant bits of n, plus one if any of the
+    remaining bits is set, so n / minrun is a power of two or slightly less.
+
+    Args:
+        n: Array size
+
+    Returns:
+        The minimum run length, between MIN_MERGE / 2 and MIN_MERGE (n itself below MIN_MERGE)
+    """
+    remainder = 0
+    while n >= MIN_MERGE:
+        remainder |= n & 1
+        n >>= 1
+    return n + remainder
+
+
+def tim_sort(arr: List[int]) -> Iterator[Frame]:
+    """
+    Timsort Algorithm
+
+    Time Complexity: O(n) best (already sorted or reversed), O(n log n) worst
+    Space Complexity: O(n)
+    Stable: Yes
+    In-place: No
+
+    Scans the array for natural runs (non-descending, or strictly descending
+    and then reversed), extends runs shorter than min_run_length(n) with
+    binary insertion, and merges runs from a stack whose lengths are kept
+    balanced by CPython's merge_collapse invariants. Merges do not gallop.
+
+    Args:
+        arr: List of integers to sort
+
+    Yields:
+        Frames showing the sorting process
+    """
+    working_array = TraceArray(arr)
+    values, ids = working_array.values, working_array.ids
+    comparisons = 0
+    swaps = 0
+    n = len(working_array)
+    minrun = min_run_length(n)
+    runs: List[List[int]] = []  # [start, length] of the pending runs
+
+    def detect_run(lo: int) -> Generator[Frame, None, int]:
+        nonlocal comparisons, swaps
+
+        hi = lo + 1
+        descending = False
+        if hi < n:
+            comparisons += 1
+            yield working_array.frame(
+                {"isComparing": (lo, hi)},
+                comparisons, swaps,
+                f"Looking for a run: comparing {values[lo]} and {values[hi]}"
+            )
+            descending = values[hi] < values[lo]
+            hi += 1
+            while hi < n:
+                comparisons += 1
+                yield working_array.frame(
+                    {"isComparing": range(lo, hi + 1)},
+                    comparisons, swaps,
+                    f"Extending the run: comparing {values[hi - 1]} and {values[hi]}"
+                )
+                if (values[hi] < values[hi - 1]) != descending:
+                    break
+                hi += 1
+
+        if descending:
+            i, j = lo, hi - 1
+            while i < j:
+                working_array.swap(i, j)
+                swaps += 1
+                i += 1
+                j -= 1
+            yield working_array.frame(
+                {"isSwapping": range(lo, hi)},
+                comparisons, swaps,
+                f"Found descending run at positions {lo}-{hi - 1} and reversed it",
+                key=True
+            )
+        else:
+            yield working_array.frame(
+                {"isComparing": range(lo, hi)},
+                comparisons, swaps,
+                f"Found ascending run at positions {lo}-{hi - 1}",
+                key=True
+            )
+        return hi
+
+    def extend_run(lo: int, start: int, end: int) -> Iterator[Frame]:
+        # Binary insertion of values[start:end] into the sorted run values[lo:start]
+        nonlocal comparisons, swaps
+
+        for i in range(start, end):
+            key_value, key_id = values[i], ids[i]
+            low, high = lo, i
+            while low < high:
+                mid = (low + high) // 2
+                comparisons += 1
+                yield working_array.frame(
+                    {"isComparing": (mid, i)},
+                    comparisons, swaps,
+                    f"Binary insertion: comparing key {key_value} with {values[mid]}"
+                )
+                if values[mid] > key_value:
+                    high = mid
+                else:
+                    low = mid + 1
+
+            for j in range(i - 1, low - 1, -1):
+                working_array.write(j + 1, values[j], ids[j])
+                swaps += 1
+            working_array.write(low, key_value, key_id)
+            swaps += 1
+            yield working_array.frame(
+                {"isSwapping": (low,)},
+                comparisons, swaps,
+                f"Inserted {key_value} at position {low}"
+            )
+
+        yield working_array.frame(
+            {"isComparing": range(lo, end)},
+            comparisons, swaps,
+            f"Extended run to minimum length {end - lo} at positions {lo}-{end - 1}",
+            key=True
+        )
+
+    def merge_at(index: int) -> Iterator[Frame]:
+        # Merge the pending runs at index and index + 1
+        nonlocal comparisons, swaps
+
+        left, left_length = runs[index]
+        mid, right_length = runs[index + 1]
+        right = mid + right_length
+        runs[index] = [left, left_length + right_length]
+        del runs[index + 1]
+
+        left_values, left_ids = values[left:mid], ids[left:mid]
+        right_values, right_ids = values[mid:right], ids[mid:right]
+        merge_flags = {"isComparing": range(left, right)}
+        i = j = 0
+        k = left
+
+        while i < len(left_values) and j < len(right_values):
+            comparisons += 1
+            yield working_array.frame(
+                merge_flags,
+                comparisons, swaps,
+                f"Merging runs: comparing {left_values[i]} and {right_values[j]}"
+            )
+            if left_values[i] <= right_values[j]:
+                working_array.write(k, left_values[i], left_ids[i])
+                i += 1
+            else:
+                working_array.write(k, right_values[j], right_ids[j])
+                j += 1
+            swaps += 1
+            k += 1
+
+        while i < len(left_values):
+            working_array.write(k, left_values[i], left_ids[i])
+            i += 1
+            k += 1
+            swaps += 1
+
+        while j < len(right_values):
+            working_array.write(k, right_values[j], right_ids[j])
+            j += 1
+            k += 1
+            swaps += 1
+
+        yield working_array.frame(
+            {"isSorted": range(left, right)},
+            comparisons, swaps,
+            f"Merged runs into positions {left}-{right - 1}",
+            key=True
+        )
+
+    def merge_collapse() -> Iterator[Frame]:
+        # Keep run lengths decreasing faster than the Fibonacci numbers
+        while len(runs) > 1:
+            k = len(runs) - 2
+            if (k > 0 and runs[k - 1][1] <= runs[k][1] + runs[k + 1][1]) or \
+                    (k > 1 and runs[k - 2][1] <= runs[k - 1][1] + runs[k][1]):
+                if runs[k - 1][1] < runs[k + 1][1]:
+                    k -= 1
+            elif runs[k][1] > runs[k + 1][1]:
+                return
+            yield from merge_at(k)
+
+    if n > 1:
+        yield working_array.frame(
+            {"isSorted": ()},
+            comparisons, swaps,
+            f"Minimum run length for {n} elements is {minrun}",
+            key=True
+        )
+
+    lo = 0
+    while lo < n:
+        hi = yield from detect_run(lo)
+        end = min(lo + minrun, n)
+        if hi < end:
+            yield from extend_run(lo, hi, end)
+            hi = end
+        runs.append([lo, hi - lo])
+        yield from merge_collapse()
+        lo = hi
+
+    while len(runs) > 1:
+        k = len(runs) - 2
+        if k > 0 and runs[k - 1][1] < runs[k + 1][1]:
+            k -= 1
+        yield from merge_at(k)
+
+    # Final sorted array
+    yield working_array.frame(
+        {"isSorted": range(n)},
+        comparisons, swaps,
+        "Timsort completed!"
+    )
@@ -0,0 +1,172 @@
+from typing import List, Dict, Any, Iterable, Iterator
+
+from .frame import Frame, positions_to_ranges, ranges_to_positions
+
+
+TRACE_FORMATS = ("snapshot", "delta", "columnar")
+
+
+def _array_ops(previous: Frame, frame: Frame) -> List[List[Any]]:
+    """
+    Describe how the array of `frame` differs from `previous` as a list of operations
+
+    Exchanged pairs become ["swap", i, j]; any other changed position becomes
+    ["write", k, value, id].
+    """
+    if previous.values is frame.values and previous.ids is frame.ids:
+        return []
+
+    prev_values, prev_ids = previous.values, previous.ids
+    values, ids = frame.values, frame.ids
+    changed = [
+        idx for idx in range(len(values))
+        if prev_ids[idx] != ids[idx] or prev_values[idx] != values[idx]
+    ]
+    previous_position = {prev_ids[idx]: idx for idx in changed}
+
+    ops = []
+    handled = set()
+    for k in changed:
+        if k in handled:
+            continue
+        p = previous_position.get(ids[k])
+        if (
+            p is not None and p not in handled and p != k
+            and ids[p] == prev_ids[k]
+            and values[p] == prev_values[k]
+            and values[k] == prev_values[p]
+        ):
+            ops.append(["swap", min(k, p), max(k, p)])
+            handled.update((k, p))
+        else:
+            ops.append(["write", k, values[k], ids[k]])
+            handled.add(k)
+    return ops
+
+
+def delta_step(previous: Frame, frame: Frame) -> Dict[str, Any]:
+    """
+    Encode a single frame relative to the frame before it
+
+    Args:
+        previous: The preceding frame
+        frame: Frame to encode
+
+    Returns:
+        Delta step with ops, marks and counters
+    """
+    return {
+        "ops": _array_ops(previous, frame),
+        "marks": {name: positions_to_ranges(positions) for name, positions in frame.flags.items()},
+        "comparisons": frame.comparisons,
+        "swaps": frame.swaps,
+        "description": frame.description
+    }
+
+
+def apply_delta(previous: Frame, step: Dict[str, Any]) -> Frame:
+    """
+    Rebuild a frame from its predecessor and its delta step
+
+    Args:
+        previous: The preceding frame
+        step: Delta step produced by delta_step
+
+    Returns:
+        The reconstructed frame
+    """
+    values, ids = previous.values, previous.ids
+    if step["ops"]:
+        values, ids = values[:], ids[:]
+        for op in step["ops"]:
+            if op[0] == "swap":
+                i, j = op[1], op[2]
+                values[i], values[j] = values[j], values[i]
+                ids[i], ids[j] = ids[j], ids[i]
+            else:
+                values[op[1]] = op[2]
+                ids[op[1]] = op[3]
+
+    flags = {name: ranges_to_positions(ranges) for name, ranges in step["marks"].items()}
+    return Frame(values, ids, flags, step["comparisons"], step["swaps"], step["description"])
+
+
+def encode_delta_steps(frames: Iterable[Frame]) -> Iterator[Dict[str, Any]]:
+    """
+    Convert frames into the delta trace format
+
+    The first frame is a regular snapshot step. Every later frame carries only:
+        ops:   ["swap", i, j] / ["write", k, value, id] applied to the previous array
+        marks: {flag: [[start, stop), ...]} - the positions where each flag is set
+               in this frame; a flag with no ranges is present but false everywhere
+    plus the comparisons, swaps and description counters. Flags are not carried
+    over between frames, so a replay clears them before applying `marks`.
+
+    Args:
+        frames: Frames as produced by the algorithm engines
+
+    Returns:
+        Iterator over delta-encoded steps
+    """
+    previous = None
+    for frame in frames:
+        yield frame.to_dict() if previous is None else delta_step(previous, frame)
+        previous = frame
+
+
+def decode_delta_steps(steps: Iterable[Dict[str, Any]]) -> Iterator[Frame]:
+    """
+    Replay a delta trace back into frames
+
+    Args:
+        steps: Steps produced by encode_delta_steps
+
+    Returns:
+        Iterator over frames
+    """
+    previous = None
+    for step in steps:
+        if step.get("array") is not None:
+            previous = Frame.from_dict(step)
+        else:
+            previous = apply_delta(previous, step)
+        yield previous
+
+
+def encode_columnar_steps(frames: Iterable[Frame]) -> Iterator[Dict[str, Any]]:
+    """
+    Convert frames into the columnar trace format
+
+    Each step carries `values` and `ids` only when they changed since the
+    previous step, and `flags` as [start, stop) ranges per flag.
+
+    Args:
+        frames: Frames as produced by the algorithm engines
+
+    Returns:
+        Iterator over columnar steps
+    """
+    previous = None
+    for frame in frames:
+        yield frame.to_columnar(previous)
+        previous = frame
+
+
+def encode_steps(frames: Iterable[Frame], trace_format: str) -> Iterator[Dict[str, Any]]:
+    """
+    Encode frames in the requested trace format
+
+    Args:
+        frames: Frames as produced by the algorithm engines
+        trace_format: One of TRACE_FORMATS
+
+    Returns:
+        Iterator over encoded steps
+    """
+    if trace_format == "snapshot":
+        return (frame.to_dict() for frame in frames)
+    if trace_format == "delta":
+        return encode_delta_steps(frames)
+    if trace_format == "columnar":
+        return encode_columnar_steps(frames)
+    raise ValueError(f"Unknown trace format: {trace_format}")
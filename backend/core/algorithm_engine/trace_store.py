@@ -0,0 +1,169 @@
+from typing import List, Dict, Any, Iterable, Optional, Tuple, Union
+from collections import OrderedDict
+import os
+import threading
+import uuid
+
+from .frame import Frame
+from .trace import delta_step, apply_delta
+
+# Rough sizes used to estimate the memory a trace holds: a Python container
+# (frame, delta step, array operation, flag entry) and one item of a list
+OBJECT_BYTES = 200
+ITEM_BYTES = 80
+
+
+def _frame_bytes(frame: Frame) -> int:
+    """Estimated size of a keyframe, counting its arrays as if not shared"""
+    return (
+        OBJECT_BYTES * (1 + len(frame.flags))
+        + frame.values.itemsize * len(frame.values) + frame.ids.itemsize * len(frame.ids)
+        + len(frame.description)
+    )
+
+
+def _delta_bytes(step: Dict[str, Any]) -> int:
+    """Estimated size of a delta step"""
+    marks = step["marks"]
+    return (
+        OBJECT_BYTES * (1 + len(step["ops"]) + len(marks))
+        + ITEM_BYTES * sum(len(ranges) for ranges in marks.values())
+        + len(step["description"])
+    )
+
+
+class StoredTrace:
+    """
+    Execution trace kept as periodic keyframes plus deltas
+
+    Every `keyframe_interval`-th frame is stored as is; the frames in between
+    are stored as delta steps relative to their predecessor. Any frame can
+    therefore be rebuilt by replaying at most `keyframe_interval - 1` deltas
+    from the nearest keyframe. `nbytes` estimates the memory the trace holds.
+    """
+
+    def __init__(self, frames: Iterable[Frame], keyframe_interval: int):
+        self.keyframe_interval = keyframe_interval
+        self.frames: List[Union[Frame, Dict[str, Any]]] = []
+        self.total_comparisons = 0
+        self.total_swaps = 0
+        self.nbytes = 0
+
+        previous = None
+        for index, frame in enumerate(frames):
+            if index % keyframe_interval == 0:
+                self.frames.append(frame)
+                self.nbytes += _frame_bytes(frame)
+            else:
+                step = delta_step(previous, frame)
+                self.frames.append(step)
+                self.nbytes += _delta_bytes(step)
+            previous = frame
+            self.total_comparisons = frame.comparisons
+            self.total_swaps = frame.swaps
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def get_steps(self, start: int, stop: int) -> List[Frame]:
+        """
+        Rebuild frames [start, stop)
+
+        Args:
+            start: Index of the first frame to return
+            stop: Index one past the last frame to return
+
+        Returns:
+            List of frames
+        """
+        start = max(0, start)
+        stop = min(len(self.frames), stop)
+        if start >= stop:
+            return []
+
+        keyframe = start - start % self.keyframe_interval
+        frame = self.frames[keyframe]
+        replayed = [frame]
+        for step in self.frames[keyframe + 1:stop]:
+            frame = step if isinstance(step, Frame) else apply_delta(frame, step)
+            replayed.append(frame)
+        return replayed[start - keyframe:]
+
+
+class TraceStore:
+    """
+    In-memory store of recent execution traces with least-recently-used eviction
+
+    Traces are evicted once more than `max_traces` are stored or their
+    estimated sizes (StoredTrace.nbytes) add up to more than `max_bytes`.
+    """
+
+    def __init__(self, max_traces: int = 64, keyframe_interval: int = 32, max_bytes: int = 256 * 1024 * 1024):
+        self.max_traces = max_traces
+        self.max_bytes = max_bytes
+        self.keyframe_interval = keyframe_interval
+        self._bytes = 0
+        self._traces: "OrderedDict[str, StoredTrace]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, steps: Iterable[Frame]) -> Tuple[str, StoredTrace]:
+        """
+        Consume a frame iterator and store it as a trace
+
+        Args:
+            steps: Frames as produced by the algorithm engines
+
+        Returns:
+            Identifier of the stored trace and the trace itself
+        """
+        trace = StoredTrace(steps, self.keyframe_interval)
+        return self.add(trace), trace
+
+    def add(self, trace: StoredTrace) -> str:
+        """
+        Store an already built trace, e.g. one built in a worker process
+
+        Args:
+            trace: Trace to store
+
+        Returns:
+            Identifier of the stored trace
+
+        Raises:
+            ValueError: If the trace alone is larger than max_bytes
+        """
+        if trace.nbytes > self.max_bytes:
+            raise ValueError(
+                f"Trace of {len(trace)} steps is too large to store for paging; use max_steps to shorten it"
+            )
+        trace_id = uuid.uuid4().hex
+        with self._lock:
+            self._traces[trace_id] = trace
+            self._bytes += trace.nbytes
+            while len(self._traces) > self.max_traces or self._bytes > self.max_bytes:
+                _, evicted = self._traces.popitem(last=False)
+                self._bytes -= evicted.nbytes
+        return trace_id
+
+    def get(self, trace_id: str) -> Optional[StoredTrace]:
+        """
+        Look up a stored trace
+
+        Args:
+            trace_id: Identifier returned by put
+
+        Returns:
+            The stored trace, or None if it is unknown or was evicted
+        """
+        with self._lock:
+            trace = self._traces.get(trace_id)
+            if trace is not None:
+                self._traces.move_to_end(trace_id)
+            return trace
+
+
+trace_store = TraceStore(
+    max_traces=int(os.getenv("TRACE_STORE_MAX_TRACES", 64)),
+    keyframe_interval=int(os.getenv("TRACE_KEYFRAME_INTERVAL", 32)),
+    max_bytes=int(os.getenv("TRACE_STORE_MAX_BYTES", 256 * 1024 * 1024))
+)
@@ -1,3 +1,8 @@
 from .complexity import get_complexity_info, estimate_operations
+from .exact import exact_operation_counts, exact_counts_are_fast, count_inversions
+from .profiler import ComplexityProfiler, profiler
 
-__all__ = ['get_complexity_info', 'estimate_operations']
+__all__ = [
+    'get_complexity_info', 'estimate_operations', 'exact_operation_counts', 'exact_counts_are_fast', 'count_inversions',
+    'ComplexityProfiler', 'profiler'
+]
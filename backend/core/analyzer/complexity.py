@@ -1,150 +1,55 @@
-from typing import Dict
-import math
+from typing import Any, Dict, Optional
 
-
-COMPLEXITY_DATABASE = {
-    "bubble": {
-        "name": "Bubble Sort",
-        "category": "sorting",
-        "time_best": "O(n)",
-        "time_average": "O(n²)",
-        "time_worst": "O(n²)",
-        "space": "O(1)",
-        "stable": True,
-        "in_place": True
-    },
-    "quick": {
-        "name": "Quick Sort",
-        "category": "sorting",
-        "time_best": "O(n log n)",
-        "time_average": "O(n log n)",
-        "time_worst": "O(n²)",
-        "space": "O(log n)",
-        "stable": False,
-        "in_place": True
-    },
-    "merge": {
-        "name": "Merge Sort",
-        "category": "sorting",
-        "time_best": "O(n log n)",
-        "time_average": "O(n log n)",
-        "time_worst": "O(n log n)",
-        "space": "O(n)",
-        "stable": True,
-        "in_place": False
-    },
-    "selection": {
-        "name": "Selection Sort",
-        "category": "sorting",
-        "time_best": "O(n²)",
-        "time_average": "O(n²)",
-        "time_worst": "O(n²)",
-        "space": "O(1)",
-        "stable": False,
-        "in_place": True
-    },
-    "insertion": {
-        "name": "Insertion Sort",
-        "category": "sorting",
-        "time_best": "O(n)",
-        "time_average": "O(n²)",
-        "time_worst": "O(n²)",
-        "space": "O(1)",
-        "stable": True,
-        "in_place": True
-    },
-    "linear": {
-        "name": "Linear Search",
-        "category": "searching",
-        "time_best": "O(1)",
-        "time_average": "O(n)",
-        "time_worst": "O(n)",
-        "space": "O(1)",
-        "stable": True,
-        "in_place": True
-    },
-    "binary": {
-        "name": "Binary Search",
-        "category": "searching",
-        "time_best": "O(1)",
-        "time_average": "O(log n)",
-        "time_worst": "O(log n)",
-        "space": "O(1)",
-        "stable": True,
-        "in_place": True
-    }
-}
+from core.algorithm_engine.registry import get_spec
+from core.analyzer.profiler import profiler
 
 
-def get_complexity_info(algorithm_type: str) -> Dict:
+def get_complexity_info(algorithm_type: str, variant: Optional[str] = None) -> Dict:
     """
     Get complexity information for an algorithm
     
     Args:
         algorithm_type: Type of algorithm (bubble, quick, merge, etc.)
+        variant: Engine variant, e.g. early_exit for bubble sort; None for the default
         
     Returns:
         Dictionary containing complexity information
     """
-    if algorithm_type not in COMPLEXITY_DATABASE:
-        raise ValueError(f"Unknown algorithm type: {algorithm_type}")
-    
-    return COMPLEXITY_DATABASE[algorithm_type]
+    return get_spec(algorithm_type).variant_complexity_info(variant)
 
 
-def estimate_operations(algorithm_type: str, array_size: int) -> Dict[str, int]:
+def estimate_operations(
+    algorithm_type: str,
+    array_size: int,
+    options: Optional[Dict[str, Any]] = None
+) -> Dict[str, int]:
     """
     Estimate the number of operations for different cases
     
+    Operations are comparisons plus swaps. Unless the algorithm's registry spec
+    has its own estimator, they are predicted from curves fitted to measured
+    runs of the algorithm (see core.analyzer.profiler): the best and worst
+    cases are the lowest and highest prediction over the profiled input cases,
+    the average case is the prediction for random input. Engine options
+    such as a variant are profiled separately.
+    
     Args:
         algorithm_type: Type of algorithm
         array_size: Size of the input array
+        options: Engine options such as pivot or variant
         
     Returns:
         Dictionary with estimated operations for best, average, and worst cases
     """
-    n = array_size
+    spec = get_spec(algorithm_type)
+    options = spec.check_options(options)
+    if spec.estimator is not None and not options:
+        return spec.estimator(array_size)
+
+    predictions = profiler.predict(algorithm_type, spec.category, array_size, options=options)
     
-    # Estimation formulas based on complexity
-    estimates = {
-        "bubble": {
-            "best": n,  # O(n) when already sorted
-            "average": (n * n) // 2,  # O(n²)
-            "worst": n * n  # O(n²)
-        },
-        "quick": {
-            "best": int(n * math.log2(n)) if n > 1 else n,  # O(n log n)
-            "average": int(n * math.log2(n)) if n > 1 else n,  # O(n log n)
-            "worst": n * n  # O(n²)
-        },
-        "merge": {
-            "best": int(n * math.log2(n)) if n > 1 else n,  # O(n log n)
-            "average": int(n * math.log2(n)) if n > 1 else n,  # O(n log n)
-            "worst": int(n * math.log2(n)) if n > 1 else n  # O(n log n)
-        },
-        "selection": {
-            "best": n * n,  # O(n²)
-            "average": n * n,  # O(n²)
-            "worst": n * n  # O(n²)
-        },
-        "insertion": {
-            "best": n,  # O(n)
-            "average": (n * n) // 2,  # O(n²)
-            "worst": n * n  # O(n²)
-        },
-        "linear": {
-            "best": 1,  # O(1) - found at first position
-            "average": n // 2,  # O(n)
-            "worst": n  # O(n)
-        },
-        "binary": {
-            "best": 1,  # O(1) - found at middle
-            "average": int(math.log2(n)) if n > 1 else 1,  # O(log n)
-            "worst": int(math.log2(n)) if n > 1 else 1  # O(log n)
-        }
+    return {
+        "best": round(min(predictions.values())),
+        "average": round(predictions["random"]),
+        "worst": round(max(predictions.values()))
     }
-    
-    if algorithm_type not in estimates:
-        raise ValueError(f"Unknown algorithm type: {algorithm_type}")
-    
-    return estimates[algorithm_type]
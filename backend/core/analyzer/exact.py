@@ -0,0 +1,149 @@
+from typing import Any, Callable, List, Dict, Optional
+import heapq
+
+from core.algorithm_engine import get_spec, run_algorithm_counts
+
+# Worst cases the counts-only fallback can afford on inputs of any accepted size
+FAST_WORST_CASES = ("O(1)", "O(log n)", "O(n)", "O(n log n)", "O(n + k)", "O(d·(n + b))")
+
+
+def count_inversions(arr: List[int]) -> int:
+    """
+    Count pairs i < j with arr[i] > arr[j] in O(n log n)
+
+    Args:
+        arr: List of integers
+
+    Returns:
+        Number of inversions
+    """
+    values = list(arr)
+    n = len(values)
+    inversions = 0
+    width = 1
+    buffer = [0] * n
+
+    # Bottom-up merge sort; every element taken from the right half jumps the
+    # remaining elements of the left half
+    while width < n:
+        for left in range(0, n, 2 * width):
+            mid = min(left + width, n)
+            right = min(left + 2 * width, n)
+            i, j, k = left, mid, left
+            while i < mid and j < right:
+                if values[j] < values[i]:
+                    buffer[k] = values[j]
+                    inversions += mid - i
+                    j += 1
+                else:
+                    buffer[k] = values[i]
+                    i += 1
+                k += 1
+            buffer[k:k + mid - i] = values[i:mid]
+            k += mid - i
+            buffer[k:k + right - j] = values[j:right]
+        values, buffer = buffer, values
+        width *= 2
+
+    return inversions
+
+
+def _selection_sort_swaps(arr: List[int]) -> int:
+    """
+    Count the swaps selection_sort makes in O(n log n)
+
+    A heap of (value, position) replaces the linear minimum scan; it yields the
+    first occurrence of the minimum, exactly like the engine's strict comparison.
+    """
+    values = list(arr)
+    heap = [(value, idx) for idx, value in enumerate(values)]
+    heapq.heapify(heap)
+    swaps = 0
+
+    for i in range(len(values) - 1):
+        # Drop entries for positions already sorted or whose element has moved
+        while heap[0][1] < i or values[heap[0][1]] != heap[0][0]:
+            heapq.heappop(heap)
+
+        min_value, min_index = heap[0]
+        if min_index != i:
+            values[i], values[min_index] = min_value, values[i]
+            heapq.heappush(heap, (values[min_index], min_index))
+            swaps += 1
+
+    return swaps
+
+
+def bubble_sort_exact(arr: List[int]) -> Dict[str, int]:
+    """Exact Bubble Sort counters: comparisons = n(n-1)/2, swaps = inversions"""
+    n = len(arr)
+    return {"comparisons": n * (n - 1) // 2, "swaps": count_inversions(arr)}
+
+
+def insertion_sort_exact(arr: List[int]) -> Dict[str, int]:
+    """Exact Insertion Sort counters: comparisons = inversions, swaps = inversions + (n-1)"""
+    inversions = count_inversions(arr)
+    return {"comparisons": inversions, "swaps": inversions + max(len(arr) - 1, 0)}
+
+
+def selection_sort_exact(arr: List[int]) -> Dict[str, int]:
+    """Exact Selection Sort counters: comparisons = n(n-1)/2, swaps from a heap-based minimum search"""
+    n = len(arr)
+    return {"comparisons": n * (n - 1) // 2, "swaps": _selection_sort_swaps(arr)}
+
+
+def exact_counts_are_fast(algorithm_type: str, options: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Whether exact counts take O(n log n) or less in the worst case
+
+    True when a closed form applies, or when the counts-only implementation of
+    the algorithm (or its variant) is O(n log n) or less in the worst case;
+    otherwise counting can take quadratic time, e.g. quick sort on sorted input.
+
+    Args:
+        algorithm_type: Type of algorithm
+        options: Engine options such as pivot or variant
+
+    Returns:
+        True if the counts are cheap for large inputs
+    """
+    spec = get_spec(algorithm_type)
+    options = spec.check_options(options)
+    if spec.exact is not None and not options:
+        return True
+    return spec.variant_complexity_info(options.get("variant"))["time_worst"] in FAST_WORST_CASES
+
+
+def exact_operation_counts(
+    algorithm_type: str,
+    array: List[int],
+    search_target: Optional[int] = None,
+    options: Optional[Dict[str, Any]] = None,
+    check: Optional[Callable[[], None]] = None
+) -> Dict[str, int]:
+    """
+    Compute the exact comparisons and swaps an engine would report for an input
+
+    Algorithms whose registry spec has an exact counter use its closed form
+    instead of simulating the engine (bubble, insertion, selection). The
+    others, and runs with engine options such as a variant (the closed forms
+    describe the default engines), run their counts-only implementation, which
+    is quadratic in the worst case for some of them; see exact_counts_are_fast.
+
+    Args:
+        algorithm_type: Type of algorithm
+        array: Input array of integers
+        search_target: Target value for search algorithms
+        options: Engine options such as pivot or variant
+        check: Passed to the counts-only implementation to cancel it, e.g. CancelToken.check
+
+    Returns:
+        Dictionary with comparisons and swaps
+    """
+    spec = get_spec(algorithm_type)
+    options = spec.check_options(options)
+    if spec.exact is not None and not options:
+        return spec.exact(array)
+
+    result = run_algorithm_counts(algorithm_type, array, search_target, options, check=check)
+    return {"comparisons": result["comparisons"], "swaps": result["swaps"]}
@@ -0,0 +1,249 @@
+from typing import List, Dict, Any, Callable, Optional, Tuple
+import json
+import math
+import os
+import random
+import threading
+import time
+
+from core.algorithm_engine import run_algorithm_counts
+
+
+SIZE_LADDER = (16, 32, 64, 128, 256, 512)
+
+# Input cases per category; for searches the case decides where the target is
+SORTING_CASES = ("random", "sorted", "reversed")
+SEARCHING_CASES = ("first", "middle", "random", "absent")
+
+RANDOM_TARGETS = 64
+
+METRICS = ("comparisons", "swaps", "operations", "seconds")
+
+CANDIDATE_CURVES: Dict[str, Callable[[int], float]] = {
+    "1": lambda n: 0.0,
+    "log n": lambda n: math.log2(n),
+    "n": lambda n: float(n),
+    "n log n": lambda n: n * math.log2(n),
+    "n²": lambda n: float(n * n),
+}
+
+
+def generate_case(category: str, case: str, n: int, rng: random.Random) -> Tuple[List[int], List[Optional[int]]]:
+    """
+    Build an input array and its search targets for a profiling case
+
+    Args:
+        category: sorting or searching
+        case: One of SORTING_CASES or SEARCHING_CASES
+        n: Array size
+        rng: Random number generator
+
+    Returns:
+        Tuple of the input array and the targets to run it with ([None] for sorting)
+    """
+    if category == "sorting":
+        values = [rng.randint(0, 10 * n) for _ in range(n)]
+        if case == "sorted":
+            values.sort()
+        elif case == "reversed":
+            values.sort(reverse=True)
+        return values, [None]
+
+    values = sorted(rng.sample(range(10 * n), n))
+    if case == "first":
+        return values, [values[0]]
+    if case == "middle":
+        return values, [values[(n - 1) // 2]]
+    if case == "absent":
+        return values, [-1]
+    # A single random target is too noisy to fit, so average over many
+    return values, rng.sample(values, min(n, RANDOM_TARGETS))
+
+
+def fit_curve(sizes: List[int], measurements: List[float]) -> Dict[str, Any]:
+    """
+    Fit measurements to the best candidate curve y = coefficient * f(n) + intercept
+
+    Each candidate is fitted by least squares and scored by its relative
+    squared error. Candidates are tried from slowest to fastest growth and a
+    faster-growing curve only wins if it at least halves the error, so noise
+    in randomized measurements does not pick an overly steep curve.
+
+    Args:
+        sizes: Input sizes
+        measurements: Measured values, one per size
+
+    Returns:
+        Dictionary with curve, coefficient, intercept and error
+    """
+    best = None
+    count = len(sizes)
+    for name, curve in CANDIDATE_CURVES.items():
+        xs = [curve(n) for n in sizes]
+        mean_x = sum(xs) / count
+        mean_y = sum(measurements) / count
+        variance = sum((x - mean_x) ** 2 for x in xs)
+        if variance == 0:
+            coefficient = 0.0
+        else:
+            coefficient = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, measurements)) / variance
+        intercept = mean_y - coefficient * mean_x
+        error = sum(
+            ((coefficient * x + intercept - y) / max(abs(y), 1.0)) ** 2
+            for x, y in zip(xs, measurements)
+        ) / count
+
+        # Negative growth is never a valid complexity curve
+        if coefficient < 0:
+            continue
+        if best is None or error < best["error"] * 0.5:
+            best = {"curve": name, "coefficient": coefficient, "intercept": intercept, "error": error}
+
+    return best
+
+
+def profile_key(algorithm_type: str, options: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Key of an algorithm's fits, e.g. "bubble" or "bubble[variant=cocktail]"
+
+    Args:
+        algorithm_type: Type of algorithm
+        options: Engine options such as pivot or variant; None values are left out
+
+    Returns:
+        The cache key
+    """
+    settings = "".join(
+        f"[{name}={value}]" for name, value in sorted((options or {}).items()) if value is not None
+    )
+    return algorithm_type + settings
+
+
+def evaluate_fit(fit: Dict[str, Any], n: int) -> float:
+    """
+    Predict a value from a fitted curve
+
+    Args:
+        fit: Result of fit_curve
+        n: Input size
+
+    Returns:
+        Predicted value, never negative
+    """
+    if n <= 0:
+        return 0.0
+    x = CANDIDATE_CURVES[fit["curve"]](n)
+    return max(fit["coefficient"] * x + fit["intercept"], 0.0)
+
+
+class ComplexityProfiler:
+    """
+    Empirical complexity model for every registered algorithm
+
+    Runs the counts-only implementation of an algorithm over a ladder of input
+    sizes and cases (averaging `repeats` runs per size), fits comparisons,
+    swaps, operations (comparisons + swaps) and wall time to candidate curves,
+    and caches the fitted coefficients. Each combination of engine options is
+    profiled on its own, see profile_key. When `cache_path` is set, fits are
+    also loaded from and saved to that file.
+    """
+
+    def __init__(
+        self,
+        sizes: Tuple[int, ...] = SIZE_LADDER,
+        repeats: int = 3,
+        seed: int = 0,
+        cache_path: Optional[str] = None
+    ):
+        self.sizes = sizes
+        self.repeats = repeats
+        self.seed = seed
+        self.cache_path = cache_path
+        self._fits: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path) as f:
+                self._fits = json.load(f)
+
+    def profile(
+        self,
+        algorithm_type: str,
+        category: str,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get the fitted curves of an algorithm, profiling it on first use
+
+        Args:
+            algorithm_type: Type of algorithm
+            category: sorting or searching
+            options: Engine options such as pivot or variant
+
+        Returns:
+            Fits keyed by case and then by metric
+        """
+        key = profile_key(algorithm_type, options)
+        with self._lock:
+            if key not in self._fits:
+                self._fits[key] = self._measure(algorithm_type, category, options)
+                if self.cache_path:
+                    with open(self.cache_path, "w") as f:
+                        json.dump(self._fits, f, indent=2)
+            return self._fits[key]
+
+    def _measure(
+        self,
+        algorithm_type: str,
+        category: str,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        rng = random.Random(self.seed)
+        cases = SORTING_CASES if category == "sorting" else SEARCHING_CASES
+        fits = {}
+        for case in cases:
+            samples = {metric: [] for metric in METRICS}
+            for n in self.sizes:
+                totals = dict.fromkeys(METRICS, 0.0)
+                runs = 0
+                for _ in range(self.repeats):
+                    array, targets = generate_case(category, case, n, rng)
+                    for target in targets:
+                        start = time.perf_counter()
+                        result = run_algorithm_counts(algorithm_type, array, target, options)
+                        totals["seconds"] += time.perf_counter() - start
+                        totals["comparisons"] += result["comparisons"]
+                        totals["swaps"] += result["swaps"]
+                        totals["operations"] += result["comparisons"] + result["swaps"]
+                        runs += 1
+                for metric, total in totals.items():
+                    samples[metric].append(total / runs)
+            fits[case] = {metric: fit_curve(list(self.sizes), values) for metric, values in samples.items()}
+        return fits
+
+    def predict(
+        self,
+        algorithm_type: str,
+        category: str,
+        n: int,
+        metric: str = "operations",
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, float]:
+        """
+        Predict a metric for every profiled case
+
+        Args:
+            algorithm_type: Type of algorithm
+            category: sorting or searching
+            n: Input size
+            metric: One of METRICS
+            options: Engine options such as pivot or variant
+
+        Returns:
+            Predicted value keyed by case
+        """
+        fits = self.profile(algorithm_type, category, options)
+        return {case: evaluate_fit(case_fits[metric], n) for case, case_fits in fits.items()}
+
+
+profiler = ComplexityProfiler(cache_path=os.getenv("COMPLEXITY_PROFILE_CACHE") or None)
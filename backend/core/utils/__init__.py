@@ -1,3 +1,11 @@
 from .helpers import get_algorithm_metadata
+from .cache import LRUCache, content_key
+from .ai_cache import AIResponseCache, normalize_query, query_key
+from .executor import EngineExecutor, CancelToken, JobCancelled, JobTimeout, engine_executor
+from .singleflight import SingleFlight
 
-__all__ = ['get_algorithm_metadata']
+__all__ = [
+    'get_algorithm_metadata', 'LRUCache', 'content_key', 'AIResponseCache', 'normalize_query', 'query_key',
+    'EngineExecutor', 'CancelToken', 'JobCancelled', 'JobTimeout', 'engine_executor',
+    'SingleFlight'
+]
@@ -0,0 +1,125 @@
+from typing import Callable, Dict, Optional
+from datetime import datetime, timedelta
+import re
+import threading
+import unicodedata
+
+from .cache import LRUCache, content_key
+
+
+# Words that change the spelling of a question but not what is asked
+FILLER_WORDS = frozenset({
+    "a", "an", "the", "please", "pls", "plz", "can", "could", "would", "you", "tell", "me", "i",
+    "want", "to", "know", "explain", "what", "whats", "is", "are", "of", "for", "in", "about", "does",
+    "do", "hey", "hi", "hello", "thanks", "thank",
+})
+
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+_WHITESPACE = re.compile(r"\s+")
+# "bubblesort" and "bubble-sort" become "bubble sort" (the hyphen is already a space by then)
+_COMPOUND = re.compile(
+    r"\b(bubble|quick|merge|selection|insertion|heap|shell|counting|radix|intro|tim|linear|binary)(sort|search)\b"
+)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a question so differently spelled versions of it compare equal
+
+    Applies Unicode NFKC, case folding, punctuation removal, splitting of
+    compound names such as "quicksort", removal of filler words, and
+    whitespace collapsing.
+
+    Args:
+        query: Question as typed by the user
+
+    Returns:
+        Normalized question
+    """
+    text = unicodedata.normalize("NFKC", query).casefold()
+    text = text.replace("'", "").replace("’", "")
+    text = _PUNCTUATION.sub(" ", text)
+    text = _COMPOUND.sub(lambda match: f"{match.group(1)} {match.group(2)}", text)
+    words = [word for word in _WHITESPACE.split(text) if word and word not in FILLER_WORDS]
+    return " ".join(words)
+
+
+def query_key(query: str, context: Optional[str]) -> str:
+    """
+    Build the cache key of a question and its context
+
+    Args:
+        query: Question as typed by the user
+        context: Optional context, e.g. the algorithm being viewed
+
+    Returns:
+        SHA-256 hex digest of the normalized query and context
+    """
+    return content_key(normalize_query(query), normalize_query(context or ""))
+
+
+class AIResponseCache:
+    """
+    Two-tier cache of AI assistant responses
+
+    The first tier is an in-memory LRUCache; on a miss the optional `load`
+    callback is asked for a response stored no earlier than `ttl` seconds ago
+    (the persistent tier, e.g. the ai_queries table), which is then kept in
+    memory as well. Responses are keyed by query_key, so questions that only
+    differ in spelling share an entry.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl: float,
+        load: Optional[Callable[[str, datetime], Optional[str]]] = None
+    ):
+        self.ttl = ttl
+        self.load = load
+        self.persistent_hits = 0
+        self._memory = LRUCache(max_bytes=max_bytes, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a response
+
+        Performs blocking I/O on a memory miss if `load` is set.
+
+        Args:
+            key: Result of query_key
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        response = self._memory.get(key)
+        if response is not None or self.load is None:
+            return response
+
+        response = self.load(key, datetime.utcnow() - timedelta(seconds=self.ttl))
+        if response is not None:
+            with self._lock:
+                self.persistent_hits += 1
+            self.put(key, response)
+        return response
+
+    def put(self, key: str, response: str):
+        """
+        Keep a response in memory; persisting it is up to the caller
+
+        Args:
+            key: Result of query_key
+            response: AI response text
+        """
+        self._memory.put(key, response, len(response.encode("utf-8")))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters
+
+        Returns:
+            LRUCache counters of the memory tier plus persistent_hits, the
+            memory misses served by the persistent tier
+        """
+        return {**self._memory.stats(), "persistent_hits": self.persistent_hits}
@@ -0,0 +1,222 @@
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Optional, TypeVar
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+
+
+EXECUTOR_KINDS = ("process", "thread")
+
+# How often a running job checks whether it was cancelled, in yielded items
+CHECK_INTERVAL = 256
+
+# Least time between two reads of a cancel flag; reading one backed by a
+# multiprocessing manager is a round trip to the manager process
+CHECK_SECONDS = 0.01
+
+# How often a waiting request checks for timeouts and client disconnects, in seconds
+POLL_INTERVAL = 0.05
+
+T = TypeVar("T")
+
+
+class JobCancelled(Exception):
+    """Raised inside a job that was cancelled"""
+
+
+class JobTimeout(Exception):
+    """Raised when a job does not finish within its timeout"""
+
+
+class CancelToken:
+    """
+    Cancellation flag shared between a waiting request and its running job
+
+    Jobs receive the token as their last argument and call `check` (or iterate
+    through `guard`) at convenient points; `check` reads the shared flag at most
+    every CHECK_SECONDS, so it is cheap enough to call in a loop. In a thread
+    pool cancellation is cooperative, so a job that never checks runs to
+    completion and its result is discarded; a process pool also terminates the
+    worker of a job that is abandoned while running (see EngineExecutor).
+    """
+
+    def __init__(self, event: Any):
+        self._event = event
+        self._next_read = 0.0
+
+    def cancel(self):
+        """Ask the job to stop"""
+        self._event.set()
+        self._next_read = 0.0
+
+    def check(self):
+        """
+        Stop the job if it was cancelled
+
+        Raises:
+            JobCancelled: If cancel was called
+        """
+        now = time.monotonic()
+        if now < self._next_read:
+            return
+        self._next_read = now + CHECK_SECONDS
+        if self._event.is_set():
+            raise JobCancelled()
+
+    def guard(self, items: Iterable[T], every: int = CHECK_INTERVAL) -> Iterator[T]:
+        """
+        Pass items through, checking for cancellation every `every` items
+
+        Args:
+            items: Items produced by the job, e.g. engine frames
+            every: Number of items between checks
+
+        Returns:
+            Iterator over the same items
+        """
+        for index, item in enumerate(items):
+            if index % every == 0:
+                self.check()
+            yield item
+
+
+class EngineExecutor:
+    """
+    Runs CPU-bound jobs off the event loop with timeouts and cancellation
+
+    With kind "process" jobs run in a ProcessPoolExecutor, so they must be
+    top-level functions with picklable arguments and results; their cancel
+    tokens are backed by a multiprocessing manager. A job abandoned while it
+    runs would hold its worker until it finishes, so the pool is retired: new
+    jobs go to a fresh pool and the old workers are terminated. Jobs of other
+    requests that were still in the retired pool are submitted again, which is
+    safe because jobs are pure functions of their arguments. With kind
+    "thread" they run in a ThreadPoolExecutor, which keeps the event loop
+    responsive but shares the GIL and relies on the jobs checking their token.
+    Pools are created on first use.
+    """
+
+    def __init__(self, kind: str = "process", max_workers: Optional[int] = None, timeout: Optional[float] = None):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool: Optional[Executor] = None
+        self._manager = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                if self.kind == "process":
+                    if self._manager is None:
+                        self._manager = multiprocessing.Manager()
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="engine")
+            return self._pool
+
+    def _new_token(self) -> CancelToken:
+        if self.kind == "process":
+            return CancelToken(self._manager.Event())
+        return CancelToken(threading.Event())
+
+    async def run(
+        self,
+        job: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> T:
+        """
+        Run a job in the pool and wait for its result without blocking the event loop
+
+        The job is called as job(*args, token) with a CancelToken.
+
+        Args:
+            job: Function to run
+            args: Positional arguments of the job
+            timeout: Seconds to wait before cancelling the job, defaults to the executor timeout
+            is_disconnected: Coroutine function that reports whether the client went away,
+                e.g. Request.is_disconnected; the job is cancelled if it returns True
+
+        Returns:
+            The job's result
+
+        Raises:
+            JobTimeout: If the job did not finish in time
+            JobCancelled: If the client disconnected
+        """
+        pool = self._get_pool()
+        token = self._new_token()
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        future = pool.submit(job, *args, token)
+        waiter = asyncio.wrap_future(future)
+
+        while True:
+            done, _ = await asyncio.wait({waiter}, timeout=POLL_INTERVAL)
+            if done:
+                if self._lost_with_retired_pool(waiter, pool):
+                    pool = self._get_pool()
+                    future = pool.submit(job, *args, token)
+                    waiter = asyncio.wrap_future(future)
+                    continue
+                if isinstance(waiter.exception(), BrokenProcessPool):
+                    # A worker died; later jobs get a working pool
+                    self._retire(pool)
+                return waiter.result()
+            if deadline is not None and loop.time() >= deadline:
+                self._abandon(future, waiter, token, pool)
+                raise JobTimeout(f"Job did not finish within {timeout:g} seconds")
+            if is_disconnected is not None and await is_disconnected():
+                self._abandon(future, waiter, token, pool)
+                raise JobCancelled("Client disconnected")
+
+    def _lost_with_retired_pool(self, waiter: asyncio.Future, pool: Executor) -> bool:
+        """Whether a job failed only because its pool was retired while it was queued or running"""
+        if pool is self._pool:
+            return False
+        return waiter.cancelled() or isinstance(waiter.exception(), BrokenProcessPool)
+
+    def _abandon(self, future: Future, waiter: asyncio.Future, token: CancelToken, pool: Executor):
+        """Cancel a job whose result is no longer wanted"""
+        token.cancel()
+        # Drops the job if it is still queued; a running job stops at its next check,
+        # and a process worker is terminated in case it never checks
+        if not future.cancel() and not future.done() and self.kind == "process":
+            self._retire(pool)
+        waiter.cancel()
+
+    def _retire(self, pool: Executor):
+        """Replace a process pool and terminate its workers"""
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+        processes = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+
+    def shutdown(self):
+        """Stop the pool and the manager, cancelling queued jobs"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
+
+
+engine_executor = EngineExecutor(
+    kind=os.getenv("ENGINE_EXECUTOR", "process"),
+    max_workers=int(os.getenv("ENGINE_WORKERS", 0)) or None,
+    timeout=float(os.getenv("ENGINE_TIMEOUT", 30)) or None
+)
@@ -1,5 +1,7 @@
 from typing import Dict
 
+from core.algorithm_engine.registry import get_spec
+
 
 def get_algorithm_metadata(algorithm_type: str) -> Dict[str, str]:
     """
@@ -11,17 +13,4 @@ def get_algorithm_metadata(algorithm_type: str) -> Dict[str, str]:
     Returns:
         Dictionary with algorithm name and category
     """
-    metadata = {
-        "bubble": {"name": "Bubble Sort", "category": "sorting"},
-        "quick": {"name": "Quick Sort", "category": "sorting"},
-        "merge": {"name": "Merge Sort", "category": "sorting"},
-        "selection": {"name": "Selection Sort", "category": "sorting"},
-        "insertion": {"name": "Insertion Sort", "category": "sorting"},
-        "linear": {"name": "Linear Search", "category": "searching"},
-        "binary": {"name": "Binary Search", "category": "searching"}
-    }
-    
-    if algorithm_type not in metadata:
-        raise ValueError(f"Unknown algorithm type: {algorithm_type}")
-    
-    return metadata[algorithm_type]
+    return get_spec(algorithm_type).metadata
@@ -0,0 +1,115 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+import asyncio
+
+
+T = TypeVar("T")
+
+DisconnectCheck = Callable[[], Awaitable[bool]]
+
+
+async def _gone() -> bool:
+    return True
+
+
+class _Flight:
+    """One in-flight computation and the callers waiting for it"""
+
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+        self.waiters: Dict[int, Optional[DisconnectCheck]] = {}
+
+    async def is_disconnected(self) -> bool:
+        """Whether every waiting caller went away; callers without a check count as connected"""
+        for check in list(self.waiters.values()):
+            if check is None or not await check():
+                return False
+        return True
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical async computations
+
+    The first caller for a key starts the computation; callers arriving with
+    the same key while it runs wait for the same result (or exception) instead
+    of starting their own. Once it finishes the key is forgotten, so later
+    callers start a new computation (or, typically, hit a cache the
+    computation filled).
+
+    The computation runs in its own task, so it is not cancelled when the
+    caller that started it goes away; it receives an `is_disconnected`
+    coroutine function that reports True only once every waiting caller has
+    disconnected.
+    """
+
+    def __init__(self):
+        self.leaders = 0
+        self.collapsed = 0
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._next_waiter = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[DisconnectCheck], Awaitable[T]],
+        is_disconnected: Optional[DisconnectCheck] = None
+    ) -> Tuple[T, bool]:
+        """
+        Run `fn` for a key, or join the run already in flight for it
+
+        Args:
+            key: Identifies identical computations, e.g. a content_key of the request
+            fn: Coroutine function starting the computation; called with the
+                flight's is_disconnected check
+            is_disconnected: Coroutine function reporting whether this caller went away,
+                e.g. Request.is_disconnected
+
+        Returns:
+            The result and whether it was shared with an earlier caller
+        """
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if flight is None:
+            flight = _Flight()
+            flight.task = asyncio.ensure_future(fn(flight.is_disconnected))
+            flight.task.add_done_callback(lambda task: self._land(key, flight))
+            self._flights[key] = flight
+            self.leaders += 1
+        else:
+            self.collapsed += 1
+
+        waiter = self._next_waiter
+        self._next_waiter += 1
+        flight.waiters[waiter] = is_disconnected
+        try:
+            return await asyncio.shield(flight.task), shared
+        except asyncio.CancelledError:
+            if not flight.task.done():
+                # A cancelled caller no longer keeps the computation alive
+                flight.waiters[waiter] = _gone
+            raise
+
+    def _land(self, key: Hashable, flight: _Flight):
+        """Forget a finished flight"""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.task.cancelled():
+            # Mark the exception as retrieved even if every caller was cancelled
+            flight.task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing counters
+
+        Returns:
+            Dictionary with leaders (computations started), collapsed (callers
+            that joined a computation in flight), in_flight and collapse_ratio
+            (share of callers that did not start their own computation)
+        """
+        callers = self.leaders + self.collapsed
+        return {
+            "leaders": self.leaders,
+            "collapsed": self.collapsed,
+            "in_flight": len(self._flights),
+            "collapse_ratio": self.collapsed / callers if callers else 0.0
+        }
@@ -1,2 +1,4 @@
 from .models import *
 from .connection import get_db, engine, Base
+from .writer import HistoryWriter, history_writer
+from .schema import ensure_schema
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from datetime import datetime
 from .connection import Base
 
@@ -16,10 +16,46 @@ class AlgorithmExecution(Base):
     category = Column(String(20), nullable=False)  # sorting or searching
     timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
+    # Serves filtered history pages; SQLite appends the id (rowid) to every index entry
+    __table_args__ = (
+        Index("ix_algorithm_executions_type_timestamp", "algorithm_type", "timestamp"),
+    )
+
     def __repr__(self):
         return f"<AlgorithmExecution(id={self.id}, algorithm={self.algorithm_name}, size={self.array_size})>"
 
 
+class ExecutionCounter(Base):
+    """Number of stored executions per algorithm, maintained by the history writer"""
+    __tablename__ = "execution_counters"
+
+    algorithm_type = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<ExecutionCounter(algorithm={self.algorithm_type}, count={self.count})>"
+
+
+class ExecutionRollup(Base):
+    """Aggregated executions per algorithm and hour or day, maintained by the history writer"""
+    __tablename__ = "execution_rollups"
+
+    granularity = Column(String(10), primary_key=True)  # hour or day
+    bucket_start = Column(DateTime, primary_key=True)
+    algorithm_type = Column(String(50), primary_key=True)
+    runs = Column(Integer, nullable=False, default=0)
+    sum_comparisons = Column(Integer, nullable=False, default=0)
+    sum_swaps = Column(Integer, nullable=False, default=0)
+    sum_array_size = Column(Integer, nullable=False, default=0)
+    # JSON objects mapping log2 bin index to count, see database.rollups
+    comparisons_histogram = Column(Text, nullable=False, default="{}")
+    swaps_histogram = Column(Text, nullable=False, default="{}")
+    array_size_histogram = Column(Text, nullable=False, default="{}")
+
+    def __repr__(self):
+        return f"<ExecutionRollup({self.granularity} {self.bucket_start}, algorithm={self.algorithm_type}, runs={self.runs})>"
+
+
 class AIQuery(Base):
     """Model for storing AI assistant queries"""
     __tablename__ = "ai_queries"
@@ -28,6 +64,7 @@ class AIQuery(Base):
     user_query = Column(Text, nullable=False)
     ai_response = Column(Text, nullable=False)
     context = Column(String(100), nullable=True)
+    query_key = Column(String(64), nullable=True, index=True)  # hash of the normalized query and context
     timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
     def __repr__(self):
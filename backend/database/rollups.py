@@ -0,0 +1,174 @@
+"""
+Hourly and daily rollups of algorithm executions
+
+Each rollup row aggregates the executions of one algorithm in one hour or day:
+the run count, the sums of comparisons, swaps and array sizes, and log2
+histograms of the same three values. Bin 0 holds zeros and bin i >= 1 holds
+values in [2^(i-1), 2^i - 1], so a histogram never has more than 64 bins and
+percentiles can be estimated from it to within a factor of two.
+"""
+from typing import Any, Dict, Iterable, List, Tuple
+from collections import defaultdict
+from datetime import datetime
+import json
+
+from sqlalchemy.orm import Session
+
+from .models import AlgorithmExecution, ExecutionRollup
+
+
+GRANULARITIES = ("hour", "day")
+
+HISTOGRAM_FIELDS = {
+    "comparisons": "comparisons_histogram",
+    "swaps": "swaps_histogram",
+    "array_size": "array_size_histogram",
+}
+
+
+def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    """
+    Get the start of the hour or day containing a timestamp
+
+    Args:
+        timestamp: Time of an execution
+        granularity: hour or day
+
+    Returns:
+        Start of the bucket
+    """
+    if granularity == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unknown granularity: {granularity}")
+
+
+def histogram_bin(value: int) -> int:
+    """Index of the log2 histogram bin holding a non-negative value"""
+    return max(int(value), 0).bit_length()
+
+
+def bin_bounds(index: int) -> Tuple[int, int]:
+    """Smallest and largest value of a log2 histogram bin"""
+    if index == 0:
+        return 0, 0
+    return 2 ** (index - 1), 2 ** index - 1
+
+
+def merge_histograms(histograms: Iterable[Dict[int, int]]) -> Dict[int, int]:
+    """Add up histograms"""
+    merged: Dict[int, int] = defaultdict(int)
+    for histogram in histograms:
+        for index, count in histogram.items():
+            merged[index] += count
+    return dict(merged)
+
+
+def histogram_percentile(histogram: Dict[int, int], quantile: float) -> float:
+    """
+    Estimate a percentile from a log2 histogram
+
+    The value is interpolated linearly within the bin holding the requested rank.
+
+    Args:
+        histogram: Mapping of bin index to count
+        quantile: Quantile between 0 and 1
+
+    Returns:
+        Estimated value, 0 for an empty histogram
+    """
+    total = sum(histogram.values())
+    if total == 0:
+        return 0.0
+    rank = quantile * total
+    seen = 0
+    for index in sorted(histogram):
+        count = histogram[index]
+        if count and seen + count >= rank:
+            low, high = bin_bounds(index)
+            return low + (high - low) * (rank - seen) / count
+        seen += count
+    return float(bin_bounds(max(histogram))[1])
+
+
+def load_histogram(text: str) -> Dict[int, int]:
+    """Parse a histogram column"""
+    return {int(index): count for index, count in json.loads(text or "{}").items()}
+
+
+def dump_histogram(histogram: Dict[int, int]) -> str:
+    """Serialize a histogram column"""
+    return json.dumps({str(index): count for index, count in sorted(histogram.items())}, separators=(",", ":"))
+
+
+def update_rollups(db: Session, executions: List[Dict[str, Any]]):
+    """
+    Add executions to their hourly and daily rollup rows
+
+    Rows are read, merged and written back, which relies on the history
+    writer being the only writer.
+
+    Args:
+        db: Database session, committed by the caller
+        executions: Column values of newly written AlgorithmExecution rows
+    """
+    deltas: Dict[Tuple[str, datetime, str], Dict[str, Any]] = {}
+    for values in executions:
+        for granularity in GRANULARITIES:
+            key = (granularity, bucket_start(values["timestamp"], granularity), values["algorithm_type"])
+            delta = deltas.get(key)
+            if delta is None:
+                delta = deltas[key] = {
+                    "runs": 0, "comparisons": 0, "swaps": 0, "array_size": 0,
+                    "histograms": {field: defaultdict(int) for field in HISTOGRAM_FIELDS}
+                }
+            delta["runs"] += 1
+            for field in HISTOGRAM_FIELDS:
+                delta[field] += values[field]
+                delta["histograms"][field][histogram_bin(values[field])] += 1
+
+    for (granularity, start, algorithm_type), delta in deltas.items():
+        row = db.get(ExecutionRollup, (granularity, start, algorithm_type))
+        if row is None:
+            row = ExecutionRollup(
+                granularity=granularity, bucket_start=start, algorithm_type=algorithm_type,
+                runs=0, sum_comparisons=0, sum_swaps=0, sum_array_size=0,
+                comparisons_histogram="{}", swaps_histogram="{}", array_size_histogram="{}"
+            )
+            db.add(row)
+        row.runs += delta["runs"]
+        row.sum_comparisons += delta["comparisons"]
+        row.sum_swaps += delta["swaps"]
+        row.sum_array_size += delta["array_size"]
+        for field, column in HISTOGRAM_FIELDS.items():
+            merged = merge_histograms([load_histogram(getattr(row, column)), delta["histograms"][field]])
+            setattr(row, column, dump_histogram(merged))
+    db.flush()
+
+
+def backfill_rollups(db: Session, chunk_size: int = 10000):
+    """
+    Rebuild all rollups from the executions table
+
+    Args:
+        db: Database session, committed by the caller
+        chunk_size: Number of executions read at a time
+    """
+    db.query(ExecutionRollup).delete()
+    last_id = 0
+    while True:
+        rows = (
+            db.query(
+                AlgorithmExecution.id, AlgorithmExecution.algorithm_type, AlgorithmExecution.timestamp,
+                AlgorithmExecution.comparisons, AlgorithmExecution.swaps, AlgorithmExecution.array_size
+            )
+            .filter(AlgorithmExecution.id > last_id)
+            .order_by(AlgorithmExecution.id)
+            .limit(chunk_size)
+            .all()
+        )
+        if not rows:
+            return
+        update_rollups(db, [row._asdict() for row in rows])
+        last_id = rows[-1].id
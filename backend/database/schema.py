@@ -0,0 +1,88 @@
+from sqlalchemy import inspect, func, insert, text
+from sqlalchemy.engine import Engine
+
+from .connection import Base, SessionLocal
+from .models import AlgorithmExecution, ExecutionCounter, ExecutionRollup
+from .rollups import backfill_rollups
+
+
+def ensure_schema(bind: Engine):
+    """
+    Create missing tables and indexes and backfill derived tables
+
+    create_all only creates columns and indexes together with their table, so
+    nullable columns and indexes added to existing tables are created here.
+    Counter tables created for an existing database (execution counters and
+    rollups) are filled from the rows already stored.
+
+    Args:
+        bind: Database engine
+    """
+    existing_tables = set(inspect(bind).get_table_names())
+    Base.metadata.create_all(bind=bind)
+
+    for table in Base.metadata.sorted_tables:
+        if table.name in existing_tables:
+            add_missing_columns(bind, table)
+            for index in table.indexes:
+                index.create(bind=bind, checkfirst=True)
+
+    if ExecutionCounter.__tablename__ not in existing_tables:
+        backfill_execution_counters(bind)
+    if ExecutionRollup.__tablename__ not in existing_tables:
+        db = SessionLocal(bind=bind)
+        try:
+            backfill_rollups(db)
+            db.commit()
+        finally:
+            db.close()
+
+
+def add_missing_columns(bind: Engine, table):
+    """
+    Add model columns missing from an existing table
+
+    Only nullable columns without server defaults can be added this way,
+    which is all ALTER TABLE ADD COLUMN supports portably.
+
+    Args:
+        bind: Database engine
+        table: SQLAlchemy table of a model
+    """
+    existing_columns = {column["name"] for column in inspect(bind).get_columns(table.name)}
+    preparer = bind.dialect.identifier_preparer
+    with bind.begin() as connection:
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            if not column.nullable:
+                raise RuntimeError(f"Cannot add non-nullable column {table.name}.{column.name} to an existing table")
+            column_type = column.type.compile(dialect=bind.dialect)
+            connection.execute(text(
+                f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} {column_type}"
+            ))
+
+
+def backfill_execution_counters(bind: Engine):
+    """
+    Rebuild the per-algorithm execution counters from the executions table
+
+    Args:
+        bind: Database engine
+    """
+    db = SessionLocal(bind=bind)
+    try:
+        counts = (
+            db.query(AlgorithmExecution.algorithm_type, func.count(AlgorithmExecution.id))
+            .group_by(AlgorithmExecution.algorithm_type)
+            .all()
+        )
+        db.query(ExecutionCounter).delete()
+        if counts:
+            db.execute(
+                insert(ExecutionCounter),
+                [{"algorithm_type": algorithm_type, "count": count} for algorithm_type, count in counts]
+            )
+        db.commit()
+    finally:
+        db.close()
@@ -0,0 +1,223 @@
+from typing import Any, Dict, List, Optional, Tuple, Type
+from collections import Counter, defaultdict
+from datetime import datetime
+import logging
+import os
+import queue
+import threading
+import time
+
+from sqlalchemy import insert, update
+
+from .connection import Base, SessionLocal
+from .models import AlgorithmExecution, ExecutionCounter
+from .rollups import update_rollups
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class HistoryWriter:
+    """
+    Write-behind queue for history records
+
+    Requests submit rows and return immediately; a background thread collects
+    them and writes them with one bulk INSERT per table and one commit per
+    batch, updating the per-algorithm execution counters and the hourly and
+    daily rollups in the same transaction. A batch is written once it holds
+    `batch_size` rows or its oldest row has waited `flush_interval` seconds.
+    Submitting never blocks: when `max_queue` items are already waiting,
+    for instance while the database is slow, the rows are dropped and
+    counted. `flush` waits until everything submitted so far is on disk and
+    `stop` drains the queue before returning.
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_queue: int = 10000
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.batches = 0
+        self.failed = 0
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the writer thread if it is not running"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+                self._thread.start()
+
+    def submit(self, model: Type[Base], **values: Any):
+        """
+        Queue a row for insertion
+
+        The timestamp is taken now rather than when the row is written.
+        The row is dropped if the queue is full.
+
+        Args:
+            model: SQLAlchemy model class, e.g. AlgorithmExecution
+            values: Column values of the row
+        """
+        if "timestamp" in model.__table__.columns and "timestamp" not in values:
+            values["timestamp"] = datetime.utcnow()
+        self._put((model, values), 1)
+
+    def submit_many(self, model: Type[Base], rows: List[Dict[str, Any]]):
+        """
+        Queue several rows of one table to be written in the same batch
+
+        The rows are dropped together if the queue is full.
+
+        Args:
+            model: SQLAlchemy model class, e.g. AlgorithmExecution
+            rows: Column values of each row
+        """
+        if not rows:
+            return
+        now = datetime.utcnow()
+        if "timestamp" in model.__table__.columns:
+            rows = [{"timestamp": now, **values} for values in rows]
+        self._put([(model, values) for values in rows], len(rows))
+
+    def _put(self, item: Any, rows: int):
+        """Queue an item without blocking the calling request, dropping it if the queue is full"""
+        self.start()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self.dropped += rows
+            logger.warning("History queue is full, dropped %d row(s)", rows)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every row submitted so far is written
+
+        Args:
+            timeout: Seconds to wait at most, None to wait indefinitely
+
+        Returns:
+            True if the rows were written in time
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def stop(self, timeout: Optional[float] = 10.0):
+        """
+        Write all queued rows and stop the writer thread
+
+        Args:
+            timeout: Seconds to wait for the queue to drain
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get writer counters
+
+        Returns:
+            Dictionary with pending, written, batches, failed and dropped counts
+        """
+        return {
+            "pending": self._queue.qsize(),
+            "written": self.written,
+            "batches": self.batches,
+            "failed": self.failed,
+            "dropped": self.dropped
+        }
+
+    def _run(self):
+        batch: List[Tuple[Type[Base], Dict[str, Any]]] = []
+        waiters: List[threading.Event] = []
+        deadline = None
+
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            stop = item is _STOP
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            elif item is not None and not stop:
+                # A list comes from submit_many and always lands in a single batch
+                if isinstance(item, list):
+                    batch.extend(item)
+                else:
+                    batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            due = deadline is not None and time.monotonic() >= deadline
+            if batch and (stop or waiters or due or len(batch) >= self.batch_size):
+                self._write(batch)
+                batch = []
+                deadline = None
+            for waiter in waiters:
+                waiter.set()
+            waiters = []
+
+            if stop:
+                return
+
+    def _write(self, batch: List[Tuple[Type[Base], Dict[str, Any]]]):
+        """Insert a batch with one statement per table in a single transaction"""
+        rows = defaultdict(list)
+        for model, values in batch:
+            rows[model].append(values)
+
+        db = self.session_factory()
+        try:
+            for model, values in rows.items():
+                db.execute(insert(model), values)
+            self._update_counters(db, rows.get(AlgorithmExecution, []))
+            update_rollups(db, rows.get(AlgorithmExecution, []))
+            db.commit()
+            self.written += len(batch)
+            self.batches += 1
+        except Exception:
+            db.rollback()
+            self.failed += len(batch)
+            logger.exception("Failed to write %d history rows", len(batch))
+        finally:
+            db.close()
+
+    @staticmethod
+    def _update_counters(db, executions: List[Dict[str, Any]]):
+        """Add newly written executions to the per-algorithm counters"""
+        counts = Counter(values["algorithm_type"] for values in executions)
+        for algorithm_type, count in counts.items():
+            result = db.execute(
+                update(ExecutionCounter)
+                .where(ExecutionCounter.algorithm_type == algorithm_type)
+                .values(count=ExecutionCounter.count + count)
+            )
+            if result.rowcount == 0:
+                db.execute(insert(ExecutionCounter).values(algorithm_type=algorithm_type, count=count))
+
+
+history_writer = HistoryWriter(
+    batch_size=int(os.getenv("HISTORY_BATCH_SIZE", 100)),
+    flush_interval=float(os.getenv("HISTORY_FLUSH_INTERVAL", 0.5))
+)
@@ -1,18 +1,33 @@
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 import os
 from datetime import datetime
 
-from database import Base, engine
-from routers import algorithms, complexity, ai, history
+from database import engine, ensure_schema, history_writer
+from routers import algorithms, complexity, ai, history, stats
 from models.response_models import HealthResponse
+from core.utils import engine_executor
 
 # Load environment variables
 load_dotenv()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# "development" enables the auto-reloader of `python main.py`
+ENVIRONMENT = os.getenv("ENVIRONMENT", "production").lower()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the schema before serving and stop the background workers on shutdown"""
+    # Create database tables and indexes
+    await run_in_threadpool(ensure_schema, engine)
+    yield
+    # Stop the engine worker pool and write out queued history
+    engine_executor.shutdown()
+    history_writer.stop()
+
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -20,7 +35,8 @@ app = FastAPI(
     description="Backend API for Algorithm Visualizer - Execute algorithms, analyze complexity, and query AI assistant",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -43,6 +59,7 @@ app.include_router(algorithms.router)
 app.include_router(complexity.router)
 app.include_router(ai.router)
 app.include_router(history.router)
+app.include_router(stats.router)
 
 
 @app.get("/", tags=["root"])
@@ -75,6 +92,6 @@ if __name__ == "__main__":
         "main:app",
         host=host,
         port=port,
-        reload=True,
+        reload=ENVIRONMENT == "development",
         log_level="info"
     )
@@ -0,0 +1,180 @@
+"""
+Binary encodings for algorithm execution responses
+
+Clients choose an encoding with the `Accept` header; JSON stays the default.
+
+application/msgpack (or application/x-msgpack)
+    The JSON response body encoded as MessagePack.
+
+application/vnd.algoviz.packed
+    A struct-packed columnar layout. All integers are little-endian.
+
+    Header
+        4s   magic b"AVZ2"
+        I    length of the metadata block in bytes
+        ...  metadata: UTF-8 JSON with every response field except `steps`,
+             plus "flag_names" (the flag table referenced by index below)
+             and "value_type" ("int32", or "int64" if any value needs it)
+        I    number of steps
+
+    Each step
+        Q    comparisons
+        Q    swaps
+        B    1 if the step carries the array, 0 if it is unchanged
+        I    array length n                     (only if the array is present)
+        n*i  values (int32, or n*q for int64)   (only if the array is present)
+        n*i  ids (int32)                        (only if the array is present)
+        B    number of flags
+        each flag:
+            B    index into flag_names
+            H    number of [start, stop) ranges
+            2*I  start, stop for every range
+        H    length of the description in bytes
+        ...  description (UTF-8)
+"""
+from typing import List, Dict, Any, Iterable, Tuple
+from array import array
+import json
+import struct
+import sys
+
+import msgpack
+from pydantic import BaseModel
+
+from core.algorithm_engine.frame import Frame
+from core.algorithm_engine.trace import encode_columnar_steps
+
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+PACKED_MEDIA_TYPE = "application/vnd.algoviz.packed"
+
+MEDIA_TYPES = {
+    "application/json": JSON_MEDIA_TYPE,
+    "application/msgpack": MSGPACK_MEDIA_TYPE,
+    "application/x-msgpack": MSGPACK_MEDIA_TYPE,
+    PACKED_MEDIA_TYPE: PACKED_MEDIA_TYPE,
+}
+
+# AVZ1 packed the counters as uint32, which quadratic runs on large inputs overflow
+PACKED_MAGIC = b"AVZ2"
+
+INT32_MIN = -2 ** 31
+INT32_MAX = 2 ** 31 - 1
+
+
+def negotiate_media_type(accept: str) -> str:
+    """
+    Pick the response encoding from an Accept header
+
+    Args:
+        accept: Value of the Accept header
+
+    Returns:
+        The supported media type with the highest quality, JSON if none match
+    """
+    best = JSON_MEDIA_TYPE
+    best_quality = 0.0
+    for entry in (accept or "").split(","):
+        parts = [part.strip() for part in entry.split(";")]
+        media_type = MEDIA_TYPES.get(parts[0].lower())
+        if media_type is None:
+            continue
+        quality = 1.0
+        for param in parts[1:]:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > best_quality:
+            best, best_quality = media_type, quality
+    return best
+
+
+def _pack_step(step: Dict[str, Any], flag_index: Dict[str, int], value_typecode: str) -> bytes:
+    """Pack a single columnar step"""
+    parts = [struct.pack("<QQ", step["comparisons"], step["swaps"])]
+
+    if "values" in step or "ids" in step:
+        values = array(value_typecode, step["values"])
+        ids = array("i", step["ids"])
+        if sys.byteorder != "little":
+            values.byteswap()
+            ids.byteswap()
+        parts.append(struct.pack("<BI", 1, len(values)))
+        parts.append(values.tobytes())
+        parts.append(ids.tobytes())
+    else:
+        parts.append(struct.pack("<B", 0))
+
+    parts.append(struct.pack("<B", len(step["flags"])))
+    for name, ranges in step["flags"].items():
+        parts.append(struct.pack("<BH", flag_index[name], len(ranges)))
+        for start, stop in ranges:
+            parts.append(struct.pack("<II", start, stop))
+
+    description = step["description"].encode("utf-8")
+    parts.append(struct.pack("<H", len(description)))
+    parts.append(description)
+    return b"".join(parts)
+
+
+def encode_packed(metadata: Dict[str, Any], frames: Iterable[Frame]) -> bytes:
+    """
+    Encode response metadata and frames in the packed layout
+
+    Args:
+        metadata: Response fields other than steps
+        frames: Frames to encode
+
+    Returns:
+        Packed response body
+    """
+    steps = []
+    flag_names: List[str] = []
+    value_typecode = "i"
+    previous_values = previous_ids = None
+    for step in encode_columnar_steps(frames):
+        # The packed layout always sends values and ids together
+        if "values" in step or "ids" in step:
+            previous_values = step.get("values", previous_values)
+            previous_ids = step.get("ids", previous_ids)
+            step["values"], step["ids"] = previous_values, previous_ids
+            if value_typecode == "i" and any(v < INT32_MIN or v > INT32_MAX for v in previous_values):
+                value_typecode = "q"
+        for name in step["flags"]:
+            if name not in flag_names:
+                flag_names.append(name)
+        steps.append(step)
+
+    flag_index = {name: idx for idx, name in enumerate(flag_names)}
+    header = json.dumps({
+        **metadata,
+        "flag_names": flag_names,
+        "value_type": "int32" if value_typecode == "i" else "int64"
+    }, separators=(",", ":")).encode("utf-8")
+    parts = [PACKED_MAGIC, struct.pack("<I", len(header)), header, struct.pack("<I", len(steps))]
+    parts.extend(_pack_step(step, flag_index, value_typecode) for step in steps)
+    return b"".join(parts)
+
+
+def encode_response(model: BaseModel, frames: Iterable[Frame], media_type: str) -> Tuple[bytes, str]:
+    """
+    Serialize a response model in the negotiated encoding
+
+    Args:
+        model: Response model; for the packed layout its steps are ignored
+        frames: Frames of the returned steps, used by the packed layout
+        media_type: Media type returned by negotiate_media_type
+
+    Returns:
+        Encoded body and its media type
+    """
+    if media_type == PACKED_MEDIA_TYPE:
+        metadata = model.model_dump(mode="json", exclude_none=True, exclude={"steps"})
+        metadata["format"] = "columnar"
+        return encode_packed(metadata, frames), media_type
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return msgpack.packb(model.model_dump(mode="json", exclude_none=True)), media_type
+    return model.model_dump_json(exclude_none=True).encode("utf-8"), JSON_MEDIA_TYPE
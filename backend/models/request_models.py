@@ -4,16 +4,71 @@ from typing import List, Optional
 
 class ExecuteAlgorithmRequest(BaseModel):
     """Request model for executing an algorithm"""
-    algorithm_type: str = Field(..., description="Type of algorithm: bubble, quick, merge, selection, insertion, linear, binary")
+    algorithm_type: str = Field(..., description="Type of algorithm: bubble, quick, merge, selection, insertion, heap, shell, counting, radix, intro, tim, linear, binary")
     array: List[int] = Field(..., description="Input array of integers")
     search_target: Optional[int] = Field(None, description="Target value for search algorithms")
+    format: str = Field("snapshot", description="Trace format: snapshot (full array per step), delta (operations per step) or columnar (typed columns and flag ranges)")
+    page_size: Optional[int] = Field(None, description="Return only the first page_size steps and keep the trace for paging", gt=0)
+    trace: bool = Field(True, description="Record the step-by-step trace; false returns only counters and the final array")
+    pivot: Optional[str] = Field(None, description="Quick sort pivot strategy: last (default), median3, random or ninther")
+    seed: Optional[int] = Field(None, description="Seed of the random pivot strategy (0 if omitted)")
+    variant: Optional[str] = Field(None, description="Engine variant: bubble sort standard, early_exit or cocktail; insertion sort linear or binary; quick sort lomuto or three_way; merge sort top_down or bottom_up; shell sort gap sequence shell, knuth or ciura")
+    max_steps: Optional[int] = Field(None, description="Decimate the trace to at most this many steps, keeping key events (pivot placements, starts of passes and merges, search results) in preference to other steps", ge=2)
 
     class Config:
         json_schema_extra = {
             "example": {
                 "algorithm_type": "bubble",
                 "array": [64, 34, 25, 12, 22, 11, 90],
-                "search_target": None
+                "search_target": None,
+                "format": "snapshot"
+            }
+        }
+
+
+class BatchJob(BaseModel):
+    """One algorithm run of a batch"""
+    algorithm_type: str = Field(..., description="Type of algorithm: bubble, quick, merge, selection, insertion, heap, shell, counting, radix, intro, tim, linear, binary")
+    array: List[int] = Field(..., description="Input array of integers")
+    search_target: Optional[int] = Field(None, description="Target value for search algorithms")
+    trace: bool = Field(True, description="Record the step-by-step trace; false returns only counters and the final array")
+    pivot: Optional[str] = Field(None, description="Quick sort pivot strategy: last (default), median3, random or ninther")
+    seed: Optional[int] = Field(None, description="Seed of the random pivot strategy (0 if omitted)")
+    variant: Optional[str] = Field(None, description="Engine variant: bubble sort standard, early_exit or cocktail; insertion sort linear or binary; quick sort lomuto or three_way; merge sort top_down or bottom_up; shell sort gap sequence shell, knuth or ciura")
+    max_steps: Optional[int] = Field(None, description="Decimate the trace to at most this many steps, keeping key events (pivot placements, starts of passes and merges, search results) in preference to other steps", ge=2)
+
+
+class ExecuteBatchRequest(BaseModel):
+    """Request model for executing many algorithm runs at once"""
+    jobs: List[BatchJob] = Field(..., description="Runs to execute", min_length=1, max_length=1000)
+    format: str = Field("snapshot", description="Trace format of every traced run: snapshot, delta or columnar")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "jobs": [
+                    {"algorithm_type": "quick", "array": [5, 3, 8, 1], "trace": False},
+                    {"algorithm_type": "binary", "array": [1, 3, 5, 8], "search_target": 5, "trace": False}
+                ],
+                "format": "snapshot"
+            }
+        }
+
+
+class CompareAlgorithmsRequest(BaseModel):
+    """Request model for running several sorting algorithms on the same input"""
+    array: List[int] = Field(..., description="Input array of integers")
+    algorithms: Optional[List[str]] = Field(None, description="Sorting algorithms to compare; all of them if omitted", min_length=1)
+    frames: Optional[int] = Field(None, description="Return each trace downsampled to this many frames, aligned on a common step timeline", gt=0, le=1000)
+    format: str = Field("columnar", description="Trace format of the returned frames: snapshot, delta or columnar")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "array": [64, 34, 25, 12, 22, 11, 90],
+                "algorithms": ["bubble", "quick", "merge"],
+                "frames": 50,
+                "format": "columnar"
             }
         }
 
@@ -22,6 +77,7 @@ class AnalyzeComplexityRequest(BaseModel):
     """Request model for complexity analysis"""
     algorithm_type: str = Field(..., description="Type of algorithm to analyze")
     array_size: int = Field(..., description="Size of the input array", gt=0)
+    variant: Optional[str] = Field(None, description="Engine variant, e.g. bubble sort early_exit, insertion sort binary or shell sort knuth")
 
     class Config:
         json_schema_extra = {
@@ -32,6 +88,23 @@ class AnalyzeComplexityRequest(BaseModel):
         }
 
 
+class ExactComplexityRequest(BaseModel):
+    """Request model for exact operation counts on a concrete input"""
+    algorithm_type: str = Field(..., description="Type of algorithm to analyze")
+    array: List[int] = Field(..., description="Input array of integers")
+    search_target: Optional[int] = Field(None, description="Target value for search algorithms")
+    variant: Optional[str] = Field(None, description="Engine variant, e.g. bubble sort early_exit, insertion sort binary or shell sort knuth")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "algorithm_type": "bubble",
+                "array": [64, 34, 25, 12, 22, 11, 90],
+                "search_target": None
+            }
+        }
+
+
 class AIQueryRequest(BaseModel):
     """Request model for AI assistant queries"""
     user_query: str = Field(..., description="User's question about algorithms")
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 
 
@@ -11,6 +11,26 @@ class AlgorithmStep(BaseModel):
     description: str = Field(..., description="Description of this step")
 
 
+class DeltaStep(BaseModel):
+    """Single step of a delta-encoded trace; only the first step carries the full array"""
+    array: Optional[List[Dict[str, Any]]] = Field(None, description="Initial array state (first step only)")
+    ops: List[List[Any]] = Field(default_factory=list, description="Operations applied to the previous array: [\"swap\", i, j] or [\"write\", k, value, id]")
+    marks: Dict[str, List[List[int]]] = Field(default_factory=dict, description="Half-open [start, stop) ranges where each flag is set in this step")
+    comparisons: int = Field(..., description="Total comparisons so far")
+    swaps: int = Field(..., description="Total swaps so far")
+    description: str = Field(..., description="Description of this step")
+
+
+class ColumnarStep(BaseModel):
+    """Single step of a columnar trace; values and ids are only sent when they change"""
+    values: Optional[List[int]] = Field(None, description="Element values, if changed since the previous step")
+    ids: Optional[List[int]] = Field(None, description="Element ids, if changed since the previous step")
+    flags: Dict[str, List[List[int]]] = Field(default_factory=dict, description="Half-open [start, stop) ranges where each flag is set in this step")
+    comparisons: int = Field(..., description="Total comparisons so far")
+    swaps: int = Field(..., description="Total swaps so far")
+    description: str = Field(..., description="Description of this step")
+
+
 class ComplexityInfo(BaseModel):
     """Complexity analysis information"""
     time_best: str = Field(..., description="Best case time complexity")
@@ -19,18 +39,55 @@ class ComplexityInfo(BaseModel):
     space: str = Field(..., description="Space complexity")
     stable: bool = Field(..., description="Whether the algorithm is stable")
     in_place: bool = Field(..., description="Whether the algorithm is in-place")
+    variant: Optional[str] = Field(None, description="Engine variant the complexity applies to, if not the default")
 
 
 class ExecuteAlgorithmResponse(BaseModel):
     """Response model for algorithm execution"""
     algorithm_type: str = Field(..., description="Type of algorithm executed")
     algorithm_name: str = Field(..., description="Human-readable algorithm name")
-    steps: List[AlgorithmStep] = Field(..., description="Step-by-step execution trace")
+    format: str = Field("snapshot", description="Trace format of steps: snapshot, delta or columnar")
+    steps: List[Union[AlgorithmStep, DeltaStep, ColumnarStep]] = Field(..., description="Step-by-step execution trace")
     complexity: ComplexityInfo = Field(..., description="Complexity information")
     total_comparisons: int = Field(..., description="Total comparisons made")
     total_swaps: int = Field(..., description="Total swaps made")
-    timestamp: str = Field(..., description="Execution timestamp")
+    timestamp: str = Field(..., description="When the result was computed; cached and coalesced responses keep the time of the run that produced them")
     category: str = Field(..., description="Algorithm category: sorting or searching")
+    trace_id: Optional[str] = Field(None, description="Identifier for paging through the stored trace")
+    total_steps: Optional[int] = Field(None, description="Number of steps in the stored trace")
+    source_steps: Optional[int] = Field(None, description="Number of steps the engine produced, when the trace was decimated with max_steps")
+    final_array: Optional[List[int]] = Field(None, description="Final array, returned when the trace is disabled")
+
+
+class TraceStepsResponse(BaseModel):
+    """Response model for a page of a stored trace"""
+    trace_id: str = Field(..., description="Identifier of the stored trace")
+    format: str = Field("snapshot", description="Trace format of steps: snapshot, delta or columnar")
+    start: int = Field(..., description="Index of the first returned step")
+    stop: int = Field(..., description="Index one past the last returned step")
+    total_steps: int = Field(..., description="Number of steps in the stored trace")
+    steps: List[Union[AlgorithmStep, DeltaStep, ColumnarStep]] = Field(..., description="Steps [start, stop) of the trace")
+
+
+class RaceEntry(BaseModel):
+    """Result of one algorithm in a comparison"""
+    algorithm_type: str = Field(..., description="Type of algorithm")
+    algorithm_name: str = Field(..., description="Human-readable algorithm name")
+    rank: int = Field(..., description="Position by comparisons + swaps, 1 for the fewest")
+    comparisons: int = Field(..., description="Total comparisons made")
+    swaps: int = Field(..., description="Total swaps made")
+    seconds: float = Field(..., description="Wall time of the counts-only run")
+    total_steps: Optional[int] = Field(None, description="Number of steps in the full trace")
+    steps: Optional[List[Union[AlgorithmStep, DeltaStep, ColumnarStep]]] = Field(None, description="One step per timeline position")
+
+
+class CompareAlgorithmsResponse(BaseModel):
+    """Response model for a head-to-head comparison"""
+    array_size: int = Field(..., description="Size of the input array")
+    format: str = Field("columnar", description="Trace format of steps: snapshot, delta or columnar")
+    timeline: Optional[List[int]] = Field(None, description="Step index shown at each frame; traces that finished earlier repeat their final step")
+    results: List[RaceEntry] = Field(..., description="Results in request order")
+    timestamp: str = Field(..., description="Execution timestamp")
 
 
 class AnalyzeComplexityResponse(BaseModel):
@@ -42,10 +99,37 @@ class AnalyzeComplexityResponse(BaseModel):
     array_size: int = Field(..., description="Array size used for analysis")
 
 
+class ExactComplexityResponse(BaseModel):
+    """Response model for exact operation counts"""
+    algorithm_type: str = Field(..., description="Type of algorithm analyzed")
+    algorithm_name: str = Field(..., description="Human-readable algorithm name")
+    complexity: ComplexityInfo = Field(..., description="Complexity information")
+    exact_operations: Dict[str, int] = Field(..., description="Comparisons and swaps the engine would report for this input")
+    array_size: int = Field(..., description="Size of the analyzed array")
+
+
+class CurveFit(BaseModel):
+    """Curve fitted to a measured metric"""
+    curve: str = Field(..., description="Growth curve f(n): 1, log n, n, n log n or n²")
+    coefficient: float = Field(..., description="Coefficient a in a * f(n) + b")
+    intercept: float = Field(..., description="Intercept b in a * f(n) + b")
+    error: float = Field(..., description="Mean relative squared error of the fit")
+
+
+class ComplexityProfileResponse(BaseModel):
+    """Response model for empirical complexity profiles"""
+    algorithm_type: str = Field(..., description="Type of algorithm profiled")
+    algorithm_name: str = Field(..., description="Human-readable algorithm name")
+    variant: Optional[str] = Field(None, description="Engine variant that was profiled, if not the default")
+    sizes: List[int] = Field(..., description="Input sizes the algorithm was measured at")
+    fits: Dict[str, Dict[str, CurveFit]] = Field(..., description="Fitted curves keyed by input case and then by metric (comparisons, swaps, operations, seconds)")
+
+
 class AIQueryResponse(BaseModel):
     """Response model for AI queries"""
     response: str = Field(..., description="AI-generated response")
     timestamp: str = Field(..., description="Response timestamp")
+    cached: bool = Field(False, description="Whether the response was served from the AI response cache")
 
 
 class HistoryEntry(BaseModel):
@@ -62,6 +146,75 @@ class HistoryResponse(BaseModel):
     """Response model for history queries"""
     entries: List[HistoryEntry] = Field(..., description="List of history entries")
     total: int = Field(..., description="Total number of entries")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, absent on the last page")
+
+
+class HistogramBin(BaseModel):
+    """Bin of a log2 histogram"""
+    low: int = Field(..., description="Smallest value in the bin")
+    high: int = Field(..., description="Largest value in the bin")
+    count: int = Field(..., description="Number of executions in the bin")
+
+
+class StatsBucket(BaseModel):
+    """Aggregates of one algorithm over one hour or day"""
+    bucket_start: datetime = Field(..., description="Start of the hour or day")
+    runs: int = Field(..., description="Number of executions")
+    mean_comparisons: float = Field(..., description="Mean comparisons per execution")
+    mean_swaps: float = Field(..., description="Mean swaps per execution")
+    mean_array_size: float = Field(..., description="Mean array size per execution")
+
+
+class AlgorithmStats(BaseModel):
+    """Aggregates of one algorithm over the requested time range"""
+    algorithm_type: str = Field(..., description="Type of algorithm")
+    runs: int = Field(..., description="Number of executions")
+    mean_comparisons: float = Field(..., description="Mean comparisons per execution")
+    mean_swaps: float = Field(..., description="Mean swaps per execution")
+    mean_array_size: float = Field(..., description="Mean array size per execution")
+    comparisons_percentiles: Dict[str, float] = Field(..., description="Estimated p50, p90 and p99 of comparisons")
+    swaps_percentiles: Dict[str, float] = Field(..., description="Estimated p50, p90 and p99 of swaps")
+    array_size_histogram: List[HistogramBin] = Field(..., description="Distribution of array sizes in log2 bins")
+    buckets: List[StatsBucket] = Field(..., description="Per-bucket aggregates, oldest first")
+
+
+class StatsResponse(BaseModel):
+    """Response model for aggregate execution statistics"""
+    granularity: str = Field(..., description="Bucket size: hour or day")
+    since: Optional[datetime] = Field(None, description="Start of the requested range")
+    until: Optional[datetime] = Field(None, description="End of the requested range")
+    algorithms: List[AlgorithmStats] = Field(..., description="Aggregates per algorithm")
+
+
+class CacheStats(BaseModel):
+    """Counters of a single cache"""
+    entries: int = Field(..., description="Number of cached entries")
+    bytes: int = Field(..., description="Bytes currently cached")
+    max_bytes: int = Field(..., description="Byte budget of the cache")
+    hits: int = Field(..., description="Lookups served from the cache")
+    misses: int = Field(..., description="Lookups not found in the cache")
+    evictions: int = Field(..., description="Entries evicted to stay within the byte budget")
+
+
+class AICacheStats(CacheStats):
+    """Counters of the AI response cache"""
+    persistent_hits: int = Field(..., description="Memory misses served from the ai_queries table")
+
+
+class CoalescingStats(BaseModel):
+    """Counters of request coalescing for one endpoint"""
+    leaders: int = Field(..., description="Computations started")
+    collapsed: int = Field(..., description="Requests that shared a computation already in flight")
+    in_flight: int = Field(..., description="Computations currently running")
+    collapse_ratio: float = Field(..., description="Share of requests that did not start their own computation")
+
+
+class CacheStatsResponse(BaseModel):
+    """Response model for cache statistics"""
+    trace_cache: CacheStats = Field(..., description="Cache of encoded execute-algorithm responses")
+    ai_cache: AICacheStats = Field(..., description="Cache of AI assistant responses")
+    execution_coalescing: CoalescingStats = Field(..., description="Identical concurrent algorithm executions")
+    ai_coalescing: CoalescingStats = Field(..., description="Identical concurrent AI queries")
 
 
 class HealthResponse(BaseModel):
@@ -1,100 +1,122 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
+import json
 import os
-from dotenv import load_dotenv
-from google import genai
 
 from models.request_models import AIQueryRequest
 from models.response_models import AIQueryResponse
-from database import get_db
+from core.ai import AIUnavailable, AITimeout, assistant
+from core.utils import AIResponseCache, SingleFlight, query_key
+from database import history_writer
+from database.connection import SessionLocal
 from database.models import AIQuery
 
-load_dotenv()
-
 router = APIRouter(prefix="/api", tags=["ai"])
 
-# Configure Gemini API
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-client = None
-if GEMINI_API_KEY:
-    client = genai.Client(api_key=GEMINI_API_KEY)
+
+def _load_cached_response(key: str, not_before: datetime) -> Optional[str]:
+    """Find the newest stored response for a query key that is still fresh"""
+    db = SessionLocal()
+    try:
+        record = (
+            db.query(AIQuery.ai_response)
+            .filter(AIQuery.query_key == key, AIQuery.timestamp >= not_before)
+            .order_by(AIQuery.timestamp.desc())
+            .first()
+        )
+        return record.ai_response if record else None
+    finally:
+        db.close()
+
+
+# Responses keyed by normalized (query, context), backed by the ai_queries table
+ai_cache = AIResponseCache(
+    max_bytes=int(os.getenv("AI_CACHE_MAX_BYTES", 8 * 1024 * 1024)),
+    ttl=float(os.getenv("AI_CACHE_TTL", 24 * 60 * 60)),
+    load=_load_cached_response
+)
+
+# Identical concurrent questions share one model call
+ai_flights = SingleFlight()
+
+
+def _record_answer(request: AIQueryRequest, key: str, ai_response: str):
+    """Cache an answer and queue the query for the history table"""
+    ai_cache.put(key, ai_response)
+    history_writer.submit(
+        AIQuery,
+        user_query=request.user_query,
+        ai_response=ai_response,
+        context=request.context,
+        query_key=key
+    )
 
 
 @router.post("/ai/query", response_model=AIQueryResponse)
 async def query_ai(
-    request: AIQueryRequest,
-    db: Session = Depends(get_db)
+    request: AIQueryRequest
 ):
     """
     Query the AI assistant (Gemini) about algorithms
     
+    Answers are cached by normalized question and context for AI_CACHE_TTL
+    seconds, so repeated questions skip the model call, and identical questions
+    asked while one is being answered share its model call. The model is called
+    through the async client, so waiting for it does not block other requests.
+    
     Args:
         request: AI query request containing user's question
-        db: Database session
         
     Returns:
         AI-generated response
     """
     try:
         print(f"[AI] Received query: {request.user_query[:50]}...")
-        print(f"[AI] API Key configured: {bool(GEMINI_API_KEY)}")
-        print(f"[AI] Client initialized: {bool(client)}")
         
-        if not client:
-            print("[AI] ERROR: Gemini client not initialized")
-            raise HTTPException(
-                status_code=500,
-                detail="GEMINI_API_KEY not configured. Please set it in the .env file."
+        # Serve repeated questions from the cache
+        key = query_key(request.user_query, request.context)
+        cached_response = await run_in_threadpool(ai_cache.get, key)
+        if cached_response is not None:
+            print("[AI] Cache hit")
+            return AIQueryResponse(
+                response=cached_response,
+                timestamp=datetime.utcnow().isoformat(),
+                cached=True
             )
         
-        # Prepare the prompt with context
-        system_prompt = """You are an expert Algorithm Learning Assistant. Answer questions about sorting algorithms, search algorithms, time complexity, space complexity, and algorithm design. Keep responses concise and educational.
-
-Available algorithms in the visualizer:
-- Sorting: Bubble Sort, Quick Sort, Merge Sort, Insertion Sort, Selection Sort
-- Searching: Linear Search, Binary Search
-
-Provide accurate technical explanations and help users understand algorithm concepts."""
-        
-        user_prompt = request.user_query
-        if request.context:
-            user_prompt = f"Context: Currently viewing {request.context} algorithm.\n\nQuestion: {user_prompt}"
-        
-        full_prompt = f"{system_prompt}\n\n{user_prompt}"
-        
-        # Generate response using new SDK
-        print("[AI] Generating content with gemini-2.0-flash-exp...")
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-exp",
-            contents=full_prompt
-        )
-        print(f"[AI] Response received: {bool(response.text)}")
-        
-        if not response.text:
-            print("[AI] ERROR: Empty response from Gemini")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to generate AI response"
-            )
+        async def generate(is_disconnected) -> str:
+            ai_response = await assistant.answer(request.user_query, request.context)
+            
+            if not ai_response:
+                print("[AI] ERROR: Empty response from the model")
+                raise HTTPException(
+                    status_code=500,
+                    detail="Failed to generate AI response"
+                )
+            
+            print(f"[AI] Success! Response length: {len(ai_response)}")
+            _record_answer(request, key, ai_response)
+            return ai_response
         
-        ai_response = response.text
-        print(f"[AI] Success! Response length: {len(ai_response)}")
-        
-        # Store query in database
-        query_record = AIQuery(
-            user_query=request.user_query,
-            ai_response=ai_response,
-            context=request.context
-        )
-        db.add(query_record)
-        db.commit()
+        # Questions with the same key asked while this one is answered wait for the same answer
+        ai_response, shared = await ai_flights.do(key, generate)
+        if shared:
+            print("[AI] Shared an answer in flight")
         
         return AIQueryResponse(
             response=ai_response,
             timestamp=datetime.utcnow().isoformat()
         )
         
+    except HTTPException:
+        raise
+    except AIUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except AITimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         # Log the error but provide a user-friendly message
         print(f"AI Query Error: {str(e)}")
@@ -102,3 +124,56 @@ Provide accurate technical explanations and help users understand algorithm conc
             status_code=500,
             detail=f"Failed to process AI query: {str(e)}"
         )
+
+
+@router.post("/ai/query/stream")
+async def stream_ai_query(
+    request: AIQueryRequest
+):
+    """
+    Query the AI assistant and stream the answer as Server-Sent Events
+    
+    Events are `start`, one `token` per chunk of the answer (`{"text": ...}`),
+    `end` and `error`. Cached answers are sent as a single token. The answer is
+    cached and recorded once the stream completes.
+    
+    Args:
+        request: AI query request containing user's question
+        
+    Returns:
+        Streaming response with one event per chunk
+    """
+    key = query_key(request.user_query, request.context)
+    cached_response = await run_in_threadpool(ai_cache.get, key)
+    if cached_response is None and not assistant.available:
+        raise HTTPException(status_code=503, detail="GEMINI_API_KEY not configured. Please set it in the .env file.")
+
+    def format_event(event: str, data: Dict[str, Any]) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+    async def generate() -> AsyncIterator[str]:
+        yield format_event("start", {"cached": cached_response is not None})
+        if cached_response is not None:
+            yield format_event("token", {"text": cached_response})
+        else:
+            chunks = []
+            try:
+                async for chunk in assistant.stream(request.user_query, request.context):
+                    chunks.append(chunk)
+                    yield format_event("token", {"text": chunk})
+            except (AIUnavailable, AITimeout) as e:
+                yield format_event("error", {"detail": str(e)})
+                return
+            except Exception as e:
+                print(f"AI Query Error: {str(e)}")
+                yield format_event("error", {"detail": f"Failed to process AI query: {str(e)}"})
+                return
+            if chunks:
+                _record_answer(request, key, "".join(chunks))
+
+        yield format_event("end", {
+            "cached": cached_response is not None,
+            "timestamp": datetime.utcnow().isoformat()
+        })
+
+    return StreamingResponse(generate(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
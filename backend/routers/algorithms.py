@@ -1,127 +1,726 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Request, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
 from datetime import datetime
-from typing import List
+from typing import List, Dict, Any, AsyncIterator, Iterator, Optional, Tuple
+import asyncio
+import json
+import os
+import time
 
-from models.request_models import ExecuteAlgorithmRequest
-from models.response_models import ExecuteAlgorithmResponse, AlgorithmStep, ComplexityInfo
-from core.algorithm_engine import (
-    bubble_sort, quick_sort, merge_sort, selection_sort, insertion_sort,
-    linear_search, binary_search
+from models.request_models import ExecuteAlgorithmRequest, ExecuteBatchRequest, BatchJob, CompareAlgorithmsRequest
+from models.binary_encoding import JSON_MEDIA_TYPE, PACKED_MEDIA_TYPE, negotiate_media_type, encode_response
+from models.response_models import (
+    ExecuteAlgorithmResponse, AlgorithmStep, DeltaStep, ColumnarStep, ComplexityInfo, TraceStepsResponse,
+    CacheStatsResponse, RaceEntry, CompareAlgorithmsResponse
 )
+from core.algorithm_engine import iter_algorithm_steps, run_algorithm_counts, algorithm_types, get_spec
+from core.algorithm_engine.frame import Frame
+from core.algorithm_engine.decimate import decimate_frames
+from core.algorithm_engine.race import sample_frames, race_timeline, align_frames
+from core.algorithm_engine.trace import TRACE_FORMATS, encode_steps
+from core.algorithm_engine.trace_store import StoredTrace, trace_store
 from core.analyzer import get_complexity_info
-from core.utils import get_algorithm_metadata
-from database import get_db
+from core.utils import (
+    get_algorithm_metadata, LRUCache, content_key, CancelToken, JobCancelled, JobTimeout, engine_executor,
+    SingleFlight
+)
+from database import history_writer
+from routers.ai import ai_cache, ai_flights
 from database.models import AlgorithmExecution
 
 router = APIRouter(prefix="/api", tags=["algorithms"])
 
+MAX_PAGE_SIZE = 1000
+
+STEP_MODELS = {
+    "snapshot": AlgorithmStep,
+    "delta": DeltaStep,
+    "columnar": ColumnarStep
+}
+
+# Encoded execute-algorithm bodies keyed by a hash of the request contents
+trace_cache = LRUCache(max_bytes=int(os.getenv("TRACE_CACHE_MAX_BYTES", 64 * 1024 * 1024)))
+
+# Identical concurrent executions share one run
+execution_flights = SingleFlight()
+
+
+def _body_response(body: bytes, media_type: str, headers: Dict[str, str] = None) -> Response:
+    """Wrap an encoded body in a response that reports its size"""
+    return Response(
+        content=body,
+        media_type=media_type,
+        headers={"X-Encoded-Size": str(len(body)), **(headers or {})}
+    )
+
+
+def _encoded_response(model: BaseModel, frames: List[Frame], media_type: str) -> Response:
+    """Serialize a response in the negotiated encoding and report its size"""
+    body, media_type = encode_response(model, frames, media_type)
+    return _body_response(body, media_type)
+
+
+def _execution_row(algorithm_type: str, metadata: Dict[str, str],
+                   array_size: int, comparisons: int, swaps: int) -> Dict[str, Any]:
+    """Column values of an algorithm_executions row"""
+    return {
+        "algorithm_type": algorithm_type,
+        "algorithm_name": metadata["name"],
+        "array_size": array_size,
+        "comparisons": comparisons,
+        "swaps": swaps,
+        "category": metadata["category"]
+    }
+
+
+def _record_execution(algorithm_type: str, metadata: Dict[str, str],
+                      array_size: int, comparisons: int, swaps: int):
+    """Queue an algorithm execution for the history table"""
+    history_writer.submit(
+        AlgorithmExecution, **_execution_row(algorithm_type, metadata, array_size, comparisons, swaps)
+    )
+
+
+def _engine_options(algorithm_type: str, request: Any) -> Dict[str, Any]:
+    """Validated engine options (pivot, seed, variant) of an execution request or batch job"""
+    return get_spec(algorithm_type).check_options({
+        "pivot": request.pivot,
+        "seed": request.seed,
+        "variant": request.variant
+    })
+
+
+def _build_body(
+    algorithm_type: str,
+    trace_format: str,
+    media_type: str,
+    steps: List[Frame],
+    total_comparisons: int,
+    total_swaps: int,
+    trace_id: Optional[str] = None,
+    total_steps: Optional[int] = None,
+    final_array: Optional[List[int]] = None,
+    variant: Optional[str] = None,
+    source_steps: Optional[int] = None
+) -> Tuple[bytes, str]:
+    """Build an execute-algorithm response and encode it in the negotiated media type"""
+    metadata = get_algorithm_metadata(algorithm_type)
+
+    # Get complexity information
+    complexity_data = get_complexity_info(algorithm_type, variant)
+    complexity = ComplexityInfo(
+        time_best=complexity_data["time_best"],
+        time_average=complexity_data["time_average"],
+        time_worst=complexity_data["time_worst"],
+        space=complexity_data["space"],
+        stable=complexity_data["stable"],
+        in_place=complexity_data["in_place"],
+        variant=complexity_data.get("variant")
+    )
+
+    # Convert steps to response model; the packed layout encodes frames directly
+    algorithm_steps = []
+    if media_type != PACKED_MEDIA_TYPE:
+        step_model = STEP_MODELS[trace_format]
+        algorithm_steps = [step_model(**step) for step in encode_steps(steps, trace_format)]
+
+    response = ExecuteAlgorithmResponse(
+        algorithm_type=algorithm_type,
+        algorithm_name=metadata["name"],
+        format=trace_format,
+        steps=algorithm_steps,
+        complexity=complexity,
+        total_comparisons=total_comparisons,
+        total_swaps=total_swaps,
+        timestamp=datetime.utcnow().isoformat(),
+        category=metadata["category"],
+        trace_id=trace_id,
+        total_steps=total_steps,
+        source_steps=source_steps,
+        final_array=final_array
+    )
+    return encode_response(response, steps, media_type)
 
-@router.post("/execute-algorithm", response_model=ExecuteAlgorithmResponse)
+
+def _execute_job(
+    algorithm_type: str,
+    array: List[int],
+    search_target: Optional[int],
+    options: Dict[str, Any],
+    trace: bool,
+    trace_format: str,
+    media_type: str,
+    max_steps: Optional[int],
+    token: CancelToken
+) -> Tuple[bytes, str, int, int]:
+    """
+    Run an algorithm and encode the full response
+
+    Runs in the engine executor, so it has to stay a top-level function.
+    With max_steps set, the trace is decimated while it is produced.
+
+    Returns:
+        Encoded body, its media type, total comparisons and total swaps
+    """
+    final_array = None
+    source_steps = None
+    if not trace:
+        # Counters only, no frames are recorded
+        result = run_algorithm_counts(algorithm_type, array, search_target, options, check=token.check)
+        steps = []
+        final_array = result["array"]
+        total_comparisons = result["comparisons"]
+        total_swaps = result["swaps"]
+    else:
+        frames = token.guard(iter_algorithm_steps(algorithm_type, array, search_target, options))
+        if max_steps:
+            source_steps, steps = decimate_frames(frames, max_steps)
+        else:
+            steps = list(frames)
+        total_comparisons = steps[-1].comparisons if steps else 0
+        total_swaps = steps[-1].swaps if steps else 0
+
+    token.check()
+    body, media_type = _build_body(
+        algorithm_type, trace_format, media_type, steps, total_comparisons, total_swaps, final_array=final_array,
+        variant=options.get("variant"), source_steps=source_steps
+    )
+    return body, media_type, total_comparisons, total_swaps
+
+
+def _trace_job(
+    algorithm_type: str,
+    array: List[int],
+    search_target: Optional[int],
+    options: Dict[str, Any],
+    max_steps: Optional[int],
+    keyframe_interval: int,
+    token: CancelToken
+) -> Tuple[StoredTrace, Optional[int]]:
+    """
+    Run an algorithm into a keyframe trace for paging
+
+    Runs in the engine executor, so it has to stay a top-level function.
+
+    Returns:
+        The trace, and the number of steps the engine produced if it was decimated with max_steps
+    """
+    steps = token.guard(iter_algorithm_steps(algorithm_type, array, search_target, options))
+    source_steps = None
+    if max_steps:
+        source_steps, steps = decimate_frames(steps, max_steps)
+    return StoredTrace(steps, keyframe_interval), source_steps
+
+
+@router.post("/execute-algorithm", response_model=ExecuteAlgorithmResponse, response_model_exclude_none=True)
 async def execute_algorithm(
     request: ExecuteAlgorithmRequest,
-    db: Session = Depends(get_db)
+    http_request: Request
 ):
     """
     Execute an algorithm and return step-by-step visualization data
-    
+
+    The body is JSON unless the Accept header asks for MessagePack or the packed
+    binary layout (see models.binary_encoding); X-Encoded-Size reports its size.
+    Unpaged results are cached by request contents, so repeated requests skip
+    the algorithm run and serialization; identical requests arriving while one
+    runs share its result (X-Trace-Cache reports hit, miss or coalesced).
+    Cached bodies are served as encoded, so their timestamp is the time the
+    result was computed, not the time of the request.
+    The algorithm runs in the engine executor (see core.utils.executor); it is
+    cancelled when the client disconnects and answered with 504 on timeout.
+
     Args:
         request: Algorithm execution request containing algorithm type and input array
-        db: Database session
-        
+        http_request: Incoming HTTP request, used for content negotiation
+
     Returns:
         Detailed execution steps and complexity information
     """
     try:
         algorithm_type = request.algorithm_type.lower()
-        
+        trace_format = request.format.lower()
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format: {trace_format}")
+
         # Get algorithm metadata
         metadata = get_algorithm_metadata(algorithm_type)
-        
-        # Execute the appropriate algorithm
-        steps = []
-        if algorithm_type == "bubble":
-            steps = bubble_sort(request.array)
-        elif algorithm_type == "quick":
-            steps = quick_sort(request.array)
-        elif algorithm_type == "merge":
-            steps = merge_sort(request.array)
-        elif algorithm_type == "selection":
-            steps = selection_sort(request.array)
-        elif algorithm_type == "insertion":
-            steps = insertion_sort(request.array)
-        elif algorithm_type == "linear":
-            if request.search_target is None:
-                raise HTTPException(
-                    status_code=400,
-                    detail="search_target is required for linear search"
+        options = _engine_options(algorithm_type, request)
+        media_type = negotiate_media_type(http_request.headers.get("accept", ""))
+
+        # Serve repeated requests from the trace cache
+        cache_key = None
+        if not request.page_size:
+            cache_key = content_key(
+                algorithm_type, request.array, request.search_target, options, request.trace, trace_format, media_type,
+                request.max_steps
+            )
+            cached = trace_cache.get(cache_key)
+            if cached is not None:
+                body, cached_media_type, total_comparisons, total_swaps = cached
+                _record_execution(algorithm_type, metadata, len(request.array), total_comparisons, total_swaps)
+                return _body_response(body, cached_media_type, {"X-Trace-Cache": "hit"})
+
+        async def run(is_disconnected) -> Tuple[bytes, str, int, int]:
+            # Execute the appropriate algorithm off the event loop
+            if request.trace and request.page_size:
+                # Keep the trace as keyframes plus deltas and return only the first page
+                trace, source_steps = await engine_executor.run(
+                    _trace_job, algorithm_type, request.array, request.search_target, options, request.max_steps,
+                    trace_store.keyframe_interval,
+                    is_disconnected=is_disconnected
                 )
-            steps = linear_search(request.array, request.search_target)
-        elif algorithm_type == "binary":
-            if request.search_target is None:
-                raise HTTPException(
-                    status_code=400,
-                    detail="search_target is required for binary search"
+                trace_id = trace_store.add(trace)
+                body, body_media_type = _build_body(
+                    algorithm_type, trace_format, media_type,
+                    trace.get_steps(0, min(request.page_size, MAX_PAGE_SIZE)),
+                    trace.total_comparisons, trace.total_swaps, trace_id=trace_id, total_steps=len(trace),
+                    variant=options.get("variant"), source_steps=source_steps
                 )
-            steps = binary_search(request.array, request.search_target)
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unknown algorithm type: {algorithm_type}"
+                return body, body_media_type, trace.total_comparisons, trace.total_swaps
+
+            result = await engine_executor.run(
+                _execute_job, algorithm_type, request.array, request.search_target, options, request.trace,
+                trace_format, media_type, request.max_steps,
+                is_disconnected=is_disconnected
             )
-        
-        # Get complexity information
-        complexity_data = get_complexity_info(algorithm_type)
-        complexity = ComplexityInfo(
-            time_best=complexity_data["time_best"],
-            time_average=complexity_data["time_average"],
-            time_worst=complexity_data["time_worst"],
-            space=complexity_data["space"],
-            stable=complexity_data["stable"],
-            in_place=complexity_data["in_place"]
+            if cache_key is not None:
+                trace_cache.put(cache_key, result, len(result[0]))
+            return result
+
+        # Identical requests arriving while this one runs wait for the same result;
+        # paged requests then share the stored trace
+        flight_key = cache_key or content_key(
+            algorithm_type, request.array, request.search_target, options, request.trace, trace_format, media_type,
+            request.max_steps, request.page_size
         )
-        
-        # Convert steps to response model
-        algorithm_steps = [
-            AlgorithmStep(
-                array=step["array"],
-                comparisons=step["comparisons"],
-                swaps=step["swaps"],
-                description=step["description"]
+        (body, media_type, total_comparisons, total_swaps), shared = await execution_flights.do(
+            flight_key, run, http_request.is_disconnected
+        )
+
+        # Queue execution for the history table
+        _record_execution(algorithm_type, metadata, len(request.array), total_comparisons, total_swaps)
+
+        return _body_response(body, media_type, {"X-Trace-Cache": "coalesced" if shared else "miss"})
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except JobTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except JobCancelled as e:
+        # Nobody is listening any more; 499 is what proxies log for client-closed requests
+        raise HTTPException(status_code=499, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+async def _run_batch_job(
+    job: BatchJob,
+    trace_format: str,
+    is_disconnected
+) -> Tuple[bytes, int, int]:
+    """Run one job of a batch through the trace cache and the engine executor"""
+    algorithm_type = job.algorithm_type.lower()
+    options = _engine_options(algorithm_type, job)
+    cache_key = content_key(
+        algorithm_type, job.array, job.search_target, options, job.trace, trace_format, JSON_MEDIA_TYPE,
+        job.max_steps
+    )
+    cached = trace_cache.get(cache_key)
+    if cached is not None:
+        body, _, total_comparisons, total_swaps = cached
+        return body, total_comparisons, total_swaps
+
+    result = await engine_executor.run(
+        _execute_job, algorithm_type, job.array, job.search_target, options, job.trace, trace_format,
+        JSON_MEDIA_TYPE, job.max_steps,
+        is_disconnected=is_disconnected
+    )
+    trace_cache.put(cache_key, result, len(result[0]))
+    body, _, total_comparisons, total_swaps = result
+    return body, total_comparisons, total_swaps
+
+
+@router.post("/execute-batch")
+async def execute_batch(
+    request: ExecuteBatchRequest,
+    http_request: Request
+):
+    """
+    Execute many algorithm runs in parallel and stream each result as it finishes
+
+    Jobs are fanned out over the engine executor, so at most ENGINE_WORKERS run
+    at once. The response is newline-delimited JSON: a `start` message, one
+    `result` message per successful job (`{"index": ..., "response": ...}` with
+    the same response as /execute-algorithm) or `error` message per failed job
+    (`{"index": ..., "status": ..., "detail": ...}`) in completion order, and an
+    `end` message with totals. The history rows of all successful jobs are
+    queued together and written in a single bulk insert.
+
+    Args:
+        request: Batch request containing the jobs and the trace format
+        http_request: Incoming HTTP request, used to cancel the jobs on disconnect
+
+    Returns:
+        Streaming response with one message per job
+    """
+    trace_format = request.format.lower()
+    if trace_format not in TRACE_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown trace format: {trace_format}")
+
+    def format_message(event: str, data: Dict[str, Any]) -> bytes:
+        return json.dumps({"event": event, "data": data}, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    async def run(job: BatchJob) -> Tuple[Dict[str, str], Tuple[bytes, int, int]]:
+        metadata = get_algorithm_metadata(job.algorithm_type.lower())
+        return metadata, await _run_batch_job(job, trace_format, http_request.is_disconnected)
+
+    async def generate() -> AsyncIterator[bytes]:
+        yield format_message("start", {"jobs": len(request.jobs), "format": trace_format})
+
+        tasks = [asyncio.ensure_future(run(job)) for job in request.jobs]
+        indices = {task: index for index, task in enumerate(tasks)}
+        rows = []
+        failed = 0
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = indices[task]
+                    try:
+                        metadata, (body, total_comparisons, total_swaps) = task.result()
+                    except ValueError as e:
+                        failed += 1
+                        yield format_message("error", {"index": index, "status": 400, "detail": str(e)})
+                        continue
+                    except JobTimeout as e:
+                        failed += 1
+                        yield format_message("error", {"index": index, "status": 504, "detail": str(e)})
+                        continue
+                    except JobCancelled:
+                        return
+                    except Exception as e:
+                        failed += 1
+                        yield format_message("error", {
+                            "index": index, "status": 500, "detail": f"Internal server error: {str(e)}"
+                        })
+                        continue
+
+                    job = request.jobs[index]
+                    rows.append(_execution_row(
+                        job.algorithm_type.lower(), metadata, len(job.array), total_comparisons, total_swaps
+                    ))
+                    # The encoded body is already JSON, so it is embedded without re-parsing
+                    yield b'{"event":"result","data":{"index":%d,"response":%s}}\n' % (index, body)
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Results already sent are recorded even if the client went away
+            history_writer.submit_many(AlgorithmExecution, rows)
+
+        yield format_message("end", {
+            "succeeded": len(rows),
+            "failed": failed,
+            "timestamp": datetime.utcnow().isoformat()
+        })
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson", headers={"Cache-Control": "no-cache"})
+
+
+def _race_job(
+    algorithm_type: str,
+    array: List[int],
+    frames: Optional[int],
+    token: CancelToken
+) -> Dict[str, Any]:
+    """
+    Time the counts-only run of an algorithm and optionally sample its trace
+
+    Runs in the engine executor, so it has to stay a top-level function.
+
+    Returns:
+        Dictionary with comparisons, swaps, seconds and, if frames is set,
+        total_steps, sample_indices and samples
+    """
+    start = time.perf_counter()
+    result = run_algorithm_counts(algorithm_type, array, check=token.check)
+    seconds = time.perf_counter() - start
+    token.check()
+
+    entry = {"comparisons": result["comparisons"], "swaps": result["swaps"], "seconds": seconds}
+    if frames:
+        steps = token.guard(iter_algorithm_steps(algorithm_type, array))
+        entry["total_steps"], entry["sample_indices"], entry["samples"] = sample_frames(steps, frames)
+    return entry
+
+
+@router.post("/compare", response_model=CompareAlgorithmsResponse, response_model_exclude_none=True)
+async def compare_algorithms(
+    request: CompareAlgorithmsRequest,
+    http_request: Request
+):
+    """
+    Run several sorting algorithms on the same array in parallel
+
+    Every algorithm runs in its own engine executor job. Counters and wall time
+    come from the counts-only implementations; with `frames` set each trace is
+    also downsampled and aligned on a common step timeline, so frame k of every
+    trace shows the algorithms after the same number of steps (or finished).
+
+    Args:
+        request: Comparison request containing the array and the algorithms
+        http_request: Incoming HTTP request, used to cancel the runs on disconnect
+
+    Returns:
+        Counters, wall time and rank of every algorithm, and optionally their traces
+    """
+    try:
+        trace_format = request.format.lower()
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format: {trace_format}")
+
+        racers = list(dict.fromkeys(
+            algorithm_type.lower() for algorithm_type in (request.algorithms or algorithm_types("sorting"))
+        ))
+        metadata = {algorithm_type: get_algorithm_metadata(algorithm_type) for algorithm_type in racers}
+        for algorithm_type, info in metadata.items():
+            if info["category"] != "sorting":
+                raise ValueError(f"Only sorting algorithms can be compared: {algorithm_type}")
+        # Validates the array once for every engine
+        iter_algorithm_steps(racers[0], request.array)
+
+        entries = await asyncio.gather(*(
+            engine_executor.run(
+                _race_job, algorithm_type, request.array, request.frames,
+                is_disconnected=http_request.is_disconnected
             )
-            for step in steps
-        ]
-        
-        # Get final statistics
-        final_step = steps[-1] if steps else {"comparisons": 0, "swaps": 0}
-        total_comparisons = final_step["comparisons"]
-        total_swaps = final_step["swaps"]
-        
-        # Store execution in database
-        execution = AlgorithmExecution(
-            algorithm_type=algorithm_type,
-            algorithm_name=metadata["name"],
+            for algorithm_type in racers
+        ))
+
+        timeline = None
+        if request.frames:
+            timeline = race_timeline([entry["total_steps"] for entry in entries], request.frames)
+
+        operations = sorted(entry["comparisons"] + entry["swaps"] for entry in entries)
+        results = []
+        rows = []
+        for algorithm_type, entry in zip(racers, entries):
+            steps = None
+            if timeline is not None:
+                frames = align_frames(entry["sample_indices"], entry["samples"], timeline)
+                steps = [STEP_MODELS[trace_format](**step) for step in encode_steps(frames, trace_format)]
+            results.append(RaceEntry(
+                algorithm_type=algorithm_type,
+                algorithm_name=metadata[algorithm_type]["name"],
+                rank=operations.index(entry["comparisons"] + entry["swaps"]) + 1,
+                comparisons=entry["comparisons"],
+                swaps=entry["swaps"],
+                seconds=entry["seconds"],
+                total_steps=entry.get("total_steps"),
+                steps=steps
+            ))
+            rows.append(_execution_row(
+                algorithm_type, metadata[algorithm_type], len(request.array), entry["comparisons"], entry["swaps"]
+            ))
+
+        history_writer.submit_many(AlgorithmExecution, rows)
+
+        return CompareAlgorithmsResponse(
             array_size=len(request.array),
-            comparisons=total_comparisons,
-            swaps=total_swaps,
-            category=metadata["category"]
-        )
-        db.add(execution)
-        db.commit()
-        
-        # Return response
-        return ExecuteAlgorithmResponse(
-            algorithm_type=algorithm_type,
-            algorithm_name=metadata["name"],
-            steps=algorithm_steps,
-            complexity=complexity,
-            total_comparisons=total_comparisons,
-            total_swaps=total_swaps,
-            timestamp=datetime.utcnow().isoformat(),
-            category=metadata["category"]
+            format=trace_format,
+            timeline=timeline,
+            results=results,
+            timestamp=datetime.utcnow().isoformat()
         )
-        
+
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except JobTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except JobCancelled as e:
+        raise HTTPException(status_code=499, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get("/executions/{trace_id}/steps", response_model=TraceStepsResponse, response_model_exclude_none=True)
+async def get_trace_steps(
+    trace_id: str,
+    http_request: Request,
+    start: int = Query(0, ge=0, description="Index of the first step to return"),
+    stop: int = Query(100, ge=0, description="Index one past the last step to return"),
+    format: str = Query("snapshot", description="Trace format: snapshot, delta or columnar")
+):
+    """
+    Get steps [start, stop) of a trace stored by a paged execution
+
+    Args:
+        trace_id: Identifier returned by /execute-algorithm when page_size is set
+        start: Index of the first step to return
+        stop: Index one past the last step to return
+        format: Trace format of the returned steps
+        http_request: Incoming HTTP request, used for content negotiation
+
+    Returns:
+        The requested page of steps
+    """
+    trace_format = format.lower()
+    if trace_format not in TRACE_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown trace format: {trace_format}")
+    if stop - start > MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_PAGE_SIZE} steps can be requested at once")
+
+    trace = trace_store.get(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"Trace not found or expired: {trace_id}")
+
+    stop = min(stop, len(trace))
+    start = min(start, stop)
+    frames = trace.get_steps(start, stop)
+    media_type = negotiate_media_type(http_request.headers.get("accept", ""))
+    steps = []
+    if media_type != PACKED_MEDIA_TYPE:
+        step_model = STEP_MODELS[trace_format]
+        steps = [step_model(**step) for step in encode_steps(frames, trace_format)]
+
+    response = TraceStepsResponse(
+        trace_id=trace_id,
+        format=trace_format,
+        start=start,
+        stop=stop,
+        total_steps=len(trace),
+        steps=steps
+    )
+    return _encoded_response(response, frames, media_type)
+
+
+@router.get("/cache/stats", response_model=CacheStatsResponse)
+async def get_cache_stats():
+    """
+    Get hit, miss and size counters of the in-process caches
+
+    Also reports how many identical concurrent requests shared one computation.
+
+    Returns:
+        Counters for each cache
+    """
+    return CacheStatsResponse(
+        trace_cache=trace_cache.stats(),
+        ai_cache=ai_cache.stats(),
+        execution_coalescing=execution_flights.stats(),
+        ai_coalescing=ai_flights.stats()
+    )
+
+
+@router.post("/execute-algorithm/stream")
+async def stream_algorithm(
+    request: ExecuteAlgorithmRequest,
+    http_request: Request
+):
+    """
+    Execute an algorithm and stream its steps as they are produced
+
+    Steps are sent as newline-delimited JSON, or as Server-Sent Events when the
+    client sends `Accept: text/event-stream`. Every message has an `event`
+    (start, step, end or error) and a `data` payload; only the current step is
+    held in memory. The sync generator is iterated in Starlette's threadpool,
+    so it does not block the event loop and stops when the client disconnects;
+    it ends with an error event once ENGINE_TIMEOUT is exceeded.
+
+    With max_steps set the response is buffered rather than streamed: the
+    start event is sent at once, but decimation (see
+    core.algorithm_engine.decimate) may drop any kept step until the engine
+    finishes, so no step is sent before the run completes. At most max_steps
+    steps are held in memory meanwhile.
+
+    Streaming always sends the whole trace, so requests with trace=false or
+    page_size are rejected with 400; /execute-algorithm serves those.
+
+    Args:
+        request: Algorithm execution request containing algorithm type and input array
+        http_request: Incoming HTTP request, used for content negotiation
+
+    Returns:
+        Streaming response with one message per step
+    """
+    try:
+        algorithm_type = request.algorithm_type.lower()
+        trace_format = request.format.lower()
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format: {trace_format}")
+
+        if not request.trace:
+            raise ValueError("Streaming always sends the trace; use /execute-algorithm with trace=false for counters only")
+        if request.page_size:
+            raise ValueError("Streaming does not page the trace; use /execute-algorithm with page_size")
+
+        metadata = get_algorithm_metadata(algorithm_type)
+        options = _engine_options(algorithm_type, request)
+        complexity_data = get_complexity_info(algorithm_type, options.get("variant"))
+        steps = iter_algorithm_steps(algorithm_type, request.array, request.search_target, options)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    use_sse = "text/event-stream" in http_request.headers.get("accept", "")
+
+    def format_message(event: str, data: Dict[str, Any]) -> str:
+        payload = json.dumps(data, separators=(",", ":"))
+        if use_sse:
+            return f"event: {event}\ndata: {payload}\n\n"
+        return json.dumps({"event": event, "data": data}, separators=(",", ":")) + "\n"
+
+    def generate() -> Iterator[str]:
+        yield format_message("start", {
+            "algorithm_type": algorithm_type,
+            "algorithm_name": metadata["name"],
+            "category": metadata["category"],
+            "format": trace_format,
+            "complexity": ComplexityInfo(**complexity_data).model_dump()
+        })
+
+        total_comparisons = 0
+        total_swaps = 0
+        total_steps = 0
+        timeout = engine_executor.timeout
+        deadline = time.monotonic() + timeout if timeout else None
+
+        def track(source: Iterator[Frame]) -> Iterator[Frame]:
+            nonlocal total_comparisons, total_swaps, total_steps
+            for frame in source:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise JobTimeout(f"Job did not finish within {timeout:g} seconds")
+                total_comparisons = frame.comparisons
+                total_swaps = frame.swaps
+                total_steps += 1
+                yield frame
+
+        source_steps = None
+        try:
+            frames = track(steps)
+            if request.max_steps:
+                source_steps, frames = decimate_frames(frames, request.max_steps)
+            for step in encode_steps(frames, trace_format):
+                yield format_message("step", step)
+        except JobTimeout as e:
+            yield format_message("error", {"detail": str(e)})
+            return
+        except Exception as e:
+            yield format_message("error", {"detail": f"Internal server error: {str(e)}"})
+            return
+
+        end = {
+            "total_steps": total_steps if source_steps is None else len(frames),
+            "total_comparisons": total_comparisons,
+            "total_swaps": total_swaps,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        if source_steps is not None:
+            end["source_steps"] = source_steps
+        yield format_message("end", end)
+
+        _record_execution(algorithm_type, metadata, len(request.array), total_comparisons, total_swaps)
+
+    media_type = "text/event-stream" if use_sse else "application/x-ndjson"
+    return StreamingResponse(generate(), media_type=media_type, headers={"Cache-Control": "no-cache"})
@@ -1,28 +1,56 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from datetime import datetime
+from typing import Any, Dict, List, Optional
+import os
 
-from models.request_models import AnalyzeComplexityRequest
-from models.response_models import AnalyzeComplexityResponse, ComplexityInfo
-from core.analyzer import get_complexity_info, estimate_operations
-from core.utils import get_algorithm_metadata
-from database import get_db
+from fastapi import APIRouter, HTTPException, Request
+
+from models.request_models import AnalyzeComplexityRequest, ExactComplexityRequest
+from models.response_models import (
+    AnalyzeComplexityResponse, ExactComplexityResponse, ComplexityProfileResponse, ComplexityInfo
+)
+from core.analyzer import (
+    get_complexity_info, estimate_operations, exact_operation_counts, exact_counts_are_fast, profiler
+)
+from core.utils import get_algorithm_metadata, CancelToken, JobCancelled, JobTimeout, engine_executor
+from database import history_writer
 from database.models import ComplexityAnalysis
 
 router = APIRouter(prefix="/api", tags=["complexity"])
 
+# Largest array the exact endpoint counts; bigger inputs are rejected before any work is done.
+# Counting that can be quadratic (see exact_counts_are_fast) gets the much smaller limit.
+MAX_EXACT_ARRAY_SIZE = int(os.getenv("EXACT_MAX_ARRAY_SIZE", 1_000_000))
+MAX_SIMULATED_EXACT_ARRAY_SIZE = int(os.getenv("EXACT_MAX_SIMULATED_ARRAY_SIZE", 5_000))
+
+
+def _exact_job(
+    algorithm_type: str,
+    array: List[int],
+    search_target: Optional[int],
+    options: Dict[str, Any],
+    token: CancelToken
+) -> Dict[str, int]:
+    """
+    Compute exact operation counts
+
+    Runs in the engine executor, so it has to stay a top-level function. The
+    counts-only implementations check the token once per outer iteration.
+
+    Returns:
+        Dictionary with comparisons and swaps
+    """
+    token.check()
+    return exact_operation_counts(algorithm_type, array, search_target, options, check=token.check)
+
 
 @router.post("/analyze-complexity", response_model=AnalyzeComplexityResponse)
 async def analyze_complexity(
-    request: AnalyzeComplexityRequest,
-    db: Session = Depends(get_db)
+    request: AnalyzeComplexityRequest
 ):
     """
     Analyze the complexity of an algorithm for a given array size
     
     Args:
         request: Complexity analysis request
-        db: Database session
         
     Returns:
         Complexity information and estimated operations
@@ -34,28 +62,28 @@ async def analyze_complexity(
         metadata = get_algorithm_metadata(algorithm_type)
         
         # Get complexity information
-        complexity_data = get_complexity_info(algorithm_type)
+        complexity_data = get_complexity_info(algorithm_type, request.variant)
         complexity = ComplexityInfo(
             time_best=complexity_data["time_best"],
             time_average=complexity_data["time_average"],
             time_worst=complexity_data["time_worst"],
             space=complexity_data["space"],
             stable=complexity_data["stable"],
-            in_place=complexity_data["in_place"]
+            in_place=complexity_data["in_place"],
+            variant=complexity_data.get("variant")
         )
         
         # Estimate operations
-        operations = estimate_operations(algorithm_type, request.array_size)
+        operations = estimate_operations(algorithm_type, request.array_size, {"variant": request.variant})
         
-        # Store analysis in database
-        analysis = ComplexityAnalysis(
+        # Queue analysis for the history table
+        history_writer.submit(
+            ComplexityAnalysis,
             algorithm_type=algorithm_type,
             algorithm_name=metadata["name"],
             array_size=request.array_size,
             estimated_operations=operations["average"]
         )
-        db.add(analysis)
-        db.commit()
         
         return AnalyzeComplexityResponse(
             algorithm_type=algorithm_type,
@@ -69,3 +97,119 @@ async def analyze_complexity(
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.post("/analyze-complexity/exact", response_model=ExactComplexityResponse)
+async def analyze_complexity_exact(
+    request: ExactComplexityRequest,
+    http_request: Request
+):
+    """
+    Compute the exact operation counts of an algorithm on a concrete array
+    
+    Counting runs in the engine executor, like execute-algorithm, so a large
+    or quadratic input never blocks the event loop; it gets a 504 after
+    ENGINE_TIMEOUT seconds. Arrays longer than EXACT_MAX_ARRAY_SIZE are
+    rejected with 400, and so are arrays longer than
+    EXACT_MAX_SIMULATED_ARRAY_SIZE when counting can take quadratic time.
+    
+    Args:
+        request: Exact complexity request containing the input array
+        http_request: Incoming HTTP request, used to notice client disconnects
+        
+    Returns:
+        Complexity information and the exact comparisons and swaps
+    """
+    try:
+        algorithm_type = request.algorithm_type.lower()
+        options = {"variant": request.variant}
+        
+        # Get algorithm metadata
+        metadata = get_algorithm_metadata(algorithm_type)
+        
+        max_size = MAX_EXACT_ARRAY_SIZE
+        if not exact_counts_are_fast(algorithm_type, options):
+            max_size = min(max_size, MAX_SIMULATED_EXACT_ARRAY_SIZE)
+        if len(request.array) > max_size:
+            raise ValueError(
+                f"Exact counts for {metadata['name'].lower()} support arrays of at most {max_size} elements, "
+                f"got {len(request.array)}"
+            )
+        
+        # Get complexity information
+        complexity_data = get_complexity_info(algorithm_type, request.variant)
+        complexity = ComplexityInfo(
+            time_best=complexity_data["time_best"],
+            time_average=complexity_data["time_average"],
+            time_worst=complexity_data["time_worst"],
+            space=complexity_data["space"],
+            stable=complexity_data["stable"],
+            in_place=complexity_data["in_place"],
+            variant=complexity_data.get("variant")
+        )
+        
+        # Count operations without tracing the algorithm, off the event loop
+        operations = await engine_executor.run(
+            _exact_job, algorithm_type, request.array, request.search_target, options,
+            is_disconnected=http_request.is_disconnected
+        )
+        
+        # Queue analysis for the history table
+        history_writer.submit(
+            ComplexityAnalysis,
+            algorithm_type=algorithm_type,
+            algorithm_name=metadata["name"],
+            array_size=len(request.array),
+            estimated_operations=operations["comparisons"] + operations["swaps"]
+        )
+        
+        return ExactComplexityResponse(
+            algorithm_type=algorithm_type,
+            algorithm_name=metadata["name"],
+            complexity=complexity,
+            exact_operations=operations,
+            array_size=len(request.array)
+        )
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except JobTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except JobCancelled as e:
+        # Nobody is listening any more; 499 is what proxies log for client-closed requests
+        raise HTTPException(status_code=499, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get("/analyze-complexity/profile/{algorithm_type}", response_model=ComplexityProfileResponse)
+async def get_complexity_profile(algorithm_type: str, variant: Optional[str] = None):
+    """
+    Get the curves fitted to measured runs of an algorithm
+    
+    Args:
+        algorithm_type: Type of algorithm
+        variant: Engine variant to profile, e.g. early_exit for bubble sort
+        
+    Returns:
+        Fitted curves for every input case and metric
+    """
+    try:
+        algorithm_type = algorithm_type.lower()
+        metadata = get_algorithm_metadata(algorithm_type)
+        complexity_data = get_complexity_info(algorithm_type, variant)
+        
+        fits = profiler.profile(algorithm_type, complexity_data["category"], {"variant": variant})
+        
+        return ComplexityProfileResponse(
+            algorithm_type=algorithm_type,
+            algorithm_name=metadata["name"],
+            variant=variant,
+            sizes=list(profiler.sizes),
+            fits=fits
+        )
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
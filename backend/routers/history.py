@@ -1,47 +1,101 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, or_, and_
 from sqlalchemy.orm import Session
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
+import base64
+import json
 
 from models.response_models import HistoryResponse, HistoryEntry
-from database import get_db
-from database.models import AlgorithmExecution
+from database import get_db, history_writer
+from database.models import AlgorithmExecution, ExecutionCounter
 
 router = APIRouter(prefix="/api", tags=["history"])
 
 
-@router.get("/history", response_model=HistoryResponse)
+def encode_cursor(timestamp: datetime, entry_id: int) -> str:
+    """Encode the position after a history entry as an opaque cursor"""
+    payload = json.dumps([timestamp.isoformat(), entry_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor returned by encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        timestamp, entry_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(timestamp), int(entry_id)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+@router.get("/history", response_model=HistoryResponse, response_model_exclude_none=True)
 async def get_history(
     algorithm_type: Optional[str] = Query(None, description="Filter by algorithm type"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of entries to return"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    flush: bool = Query(False, description="Wait up to 5 seconds for queued executions to be written first"),
     db: Session = Depends(get_db)
 ):
     """
     Get algorithm execution history
     
+    Entries are ordered by (timestamp, id), most recent first. Pages are
+    fetched by keyset pagination: pass the previous page's `next_cursor` to
+    continue after its last entry, so every page costs the same however deep
+    it is. The total comes from per-algorithm counters instead of COUNT(*).
+    Executions still queued in the history writer are only included when
+    `flush` is set, since waiting for the writer can stall the read.
+    
     Args:
         algorithm_type: Optional filter by algorithm type
         limit: Maximum number of entries to return
+        cursor: Position to continue from
+        flush: Whether to wait for the history writer before reading
         db: Database session
         
     Returns:
         List of historical algorithm executions
     """
     try:
+        if flush:
+            # Include executions still queued in the history writer
+            await run_in_threadpool(history_writer.flush, 5.0)
+        
         # Build query
         query = db.query(AlgorithmExecution)
+        total_query = db.query(func.coalesce(func.sum(ExecutionCounter.count), 0))
         
         # Apply filter if provided
         if algorithm_type:
             query = query.filter(AlgorithmExecution.algorithm_type == algorithm_type.lower())
+            total_query = total_query.filter(ExecutionCounter.algorithm_type == algorithm_type.lower())
+        
+        # Continue after the last entry of the previous page
+        if cursor:
+            timestamp, entry_id = decode_cursor(cursor)
+            query = query.filter(or_(
+                AlgorithmExecution.timestamp < timestamp,
+                and_(AlgorithmExecution.timestamp == timestamp, AlgorithmExecution.id < entry_id)
+            ))
         
         # Order by most recent first
-        query = query.order_by(AlgorithmExecution.timestamp.desc())
+        query = query.order_by(AlgorithmExecution.timestamp.desc(), AlgorithmExecution.id.desc())
         
         # Get total count
-        total = query.count()
+        total = total_query.scalar()
         
-        # Apply limit
-        executions = query.limit(limit).all()
+        # Fetch one extra entry to know whether another page follows
+        executions = query.limit(limit + 1).all()
+        next_cursor = None
+        if len(executions) > limit:
+            executions = executions[:limit]
+            next_cursor = encode_cursor(executions[-1].timestamp, executions[-1].id)
         
         # Convert to response model
         entries = [
@@ -58,8 +112,11 @@ async def get_history(
         
         return HistoryResponse(
             entries=entries,
-            total=total
+            total=total,
+            next_cursor=next_cursor
         )
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
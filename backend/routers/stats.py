@@ -0,0 +1,119 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from collections import defaultdict
+from datetime import datetime
+from typing import Optional
+
+from models.response_models import StatsResponse, AlgorithmStats, StatsBucket, HistogramBin
+from database import get_db, history_writer
+from database.models import ExecutionRollup
+from database.rollups import (
+    GRANULARITIES, HISTOGRAM_FIELDS, bin_bounds, bucket_start, histogram_percentile, load_histogram,
+    merge_histograms
+)
+
+router = APIRouter(prefix="/api", tags=["stats"])
+
+PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+
+@router.get("/stats", response_model=StatsResponse, response_model_exclude_none=True)
+async def get_stats(
+    granularity: str = Query("day", description="Bucket size: hour or day"),
+    algorithm_type: Optional[str] = Query(None, description="Filter by algorithm type"),
+    since: Optional[datetime] = Query(None, description="Only include buckets containing or after this time"),
+    until: Optional[datetime] = Query(None, description="Only include buckets starting before this time"),
+    flush: bool = Query(False, description="Wait up to 5 seconds for queued executions to be written first"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get aggregate execution statistics per algorithm
+    
+    Served from the hourly and daily rollups the history writer maintains, so
+    the cost grows with the number of buckets in the range, not with the
+    number of stored executions. Percentiles are estimated from log2
+    histograms. Executions still queued in the history writer are only
+    included when `flush` is set.
+    
+    Args:
+        granularity: Bucket size of the returned time series
+        algorithm_type: Optional filter by algorithm type
+        since: Start of the range
+        until: End of the range
+        flush: Whether to wait for the history writer before reading
+        db: Database session
+        
+    Returns:
+        Run counts, means, percentiles, array size distribution and time series per algorithm
+    """
+    try:
+        granularity = granularity.lower()
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        
+        if flush:
+            # Include executions still queued in the history writer
+            await run_in_threadpool(history_writer.flush, 5.0)
+        
+        query = db.query(ExecutionRollup).filter(ExecutionRollup.granularity == granularity)
+        if algorithm_type:
+            query = query.filter(ExecutionRollup.algorithm_type == algorithm_type.lower())
+        if since:
+            query = query.filter(ExecutionRollup.bucket_start >= bucket_start(since, granularity))
+        if until:
+            query = query.filter(ExecutionRollup.bucket_start < until)
+        rows = query.order_by(ExecutionRollup.algorithm_type, ExecutionRollup.bucket_start).all()
+        
+        rows_by_algorithm = defaultdict(list)
+        for row in rows:
+            rows_by_algorithm[row.algorithm_type].append(row)
+        
+        algorithms = []
+        for algorithm, algorithm_rows in rows_by_algorithm.items():
+            runs = sum(row.runs for row in algorithm_rows)
+            histograms = {
+                field: merge_histograms(load_histogram(getattr(row, column)) for row in algorithm_rows)
+                for field, column in HISTOGRAM_FIELDS.items()
+            }
+            algorithms.append(AlgorithmStats(
+                algorithm_type=algorithm,
+                runs=runs,
+                mean_comparisons=sum(row.sum_comparisons for row in algorithm_rows) / runs,
+                mean_swaps=sum(row.sum_swaps for row in algorithm_rows) / runs,
+                mean_array_size=sum(row.sum_array_size for row in algorithm_rows) / runs,
+                comparisons_percentiles={
+                    name: histogram_percentile(histograms["comparisons"], quantile)
+                    for name, quantile in PERCENTILES.items()
+                },
+                swaps_percentiles={
+                    name: histogram_percentile(histograms["swaps"], quantile)
+                    for name, quantile in PERCENTILES.items()
+                },
+                array_size_histogram=[
+                    HistogramBin(low=bin_bounds(index)[0], high=bin_bounds(index)[1], count=count)
+                    for index, count in sorted(histograms["array_size"].items())
+                ],
+                buckets=[
+                    StatsBucket(
+                        bucket_start=row.bucket_start,
+                        runs=row.runs,
+                        mean_comparisons=row.sum_comparisons / row.runs,
+                        mean_swaps=row.sum_swaps / row.runs,
+                        mean_array_size=row.sum_array_size / row.runs
+                    )
+                    for row in algorithm_rows
+                ]
+            ))
+        
+        return StatsResponse(
+            granularity=granularity,
+            since=since,
+            until=until,
+            algorithms=algorithms
+        )
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
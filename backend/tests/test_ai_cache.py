@@ -0,0 +1,54 @@
+"""
+Differently spelled versions of a question must share one cache entry
+
+Questions that ask something different, or the same thing in a different
+context, must not.
+"""
+from datetime import datetime
+
+import pytest
+
+from core.utils.ai_cache import AIResponseCache, normalize_query, query_key
+
+
+@pytest.mark.parametrize("query", [
+    "What is QuickSort?",
+    "what's quick-sort",
+    "  Can you please explain   quick sort?? ",
+    "ＱＵＩＣＫＳＯＲＴ",
+    "Tell me about the quicksort, thanks!",
+])
+def test_spellings_share_a_key(query):
+    assert normalize_query(query) == "quick sort"
+    assert query_key(query, "Quick Sort") == query_key("quick sort", "quicksort")
+
+
+@pytest.mark.parametrize("query, other", [
+    ("What is quick sort?", "What is merge sort?"),
+    ("Is quick sort stable?", "Is quick sort in place?"),
+    ("binary search", "binary sort"),
+])
+def test_different_questions_differ(query, other):
+    assert query_key(query, None) != query_key(other, None)
+
+
+def test_context_is_part_of_the_key():
+    assert query_key("How fast is it?", "bubble") != query_key("How fast is it?", "merge")
+    assert query_key("How fast is it?", None) == query_key("How fast is it?", "")
+
+
+def test_persistent_tier_fills_memory():
+    loads = []
+
+    def load(key, since):
+        loads.append((key, since))
+        return "stored answer" if key == "known" else None
+
+    cache = AIResponseCache(max_bytes=1024, ttl=60, load=load)
+    assert cache.get("missing") is None
+    assert cache.get("known") == "stored answer"
+    assert cache.get("known") == "stored answer"
+
+    assert [key for key, _ in loads] == ["missing", "known"]
+    assert all(since < datetime.utcnow() for _, since in loads)
+    assert cache.stats()["persistent_hits"] == 1
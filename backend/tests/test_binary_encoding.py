@@ -0,0 +1,77 @@
+"""
+The packed layout must decode back to the columnar trace
+
+A small decoder follows the layout documented in models.binary_encoding.
+"""
+import json
+import struct
+
+from core.algorithm_engine import iter_algorithm_steps
+from core.algorithm_engine.frame import TraceArray
+from core.algorithm_engine.trace import encode_columnar_steps
+from models.binary_encoding import PACKED_MAGIC, encode_packed
+
+
+def _decode_packed(body):
+    assert body[:4] == PACKED_MAGIC
+    offset = 4
+
+    def take(fmt):
+        nonlocal offset
+        values = struct.unpack_from(fmt, body, offset)
+        offset += struct.calcsize(fmt)
+        return values
+
+    (header_length,) = take("<I")
+    metadata = json.loads(body[offset:offset + header_length])
+    offset += header_length
+    value_code = "q" if metadata["value_type"] == "int64" else "i"
+
+    steps = []
+    (count,) = take("<I")
+    for _ in range(count):
+        comparisons, swaps, has_array = take("<QQB")
+        step = {"comparisons": comparisons, "swaps": swaps}
+        if has_array:
+            (n,) = take("<I")
+            step["values"] = list(take(f"<{n}{value_code}"))
+            step["ids"] = list(take(f"<{n}i"))
+        flags = {}
+        (flag_count,) = take("<B")
+        for _ in range(flag_count):
+            index, range_count = take("<BH")
+            flags[metadata["flag_names"][index]] = [list(take("<II")) for _ in range(range_count)]
+        step["flags"] = flags
+        (length,) = take("<H")
+        step["description"] = body[offset:offset + length].decode("utf-8")
+        offset += length
+        steps.append(step)
+
+    assert offset == len(body)
+    return metadata, steps
+
+
+def test_packed_round_trip():
+    frames = list(iter_algorithm_steps("quick", [5, -3, 2 ** 40, 0, 5, 1]))
+    metadata, steps = _decode_packed(encode_packed({"algorithm_type": "quick"}, frames))
+
+    assert metadata["algorithm_type"] == "quick"
+    assert metadata["value_type"] == "int64"
+    # The packed layout sends values and ids together whenever either changed
+    expected = []
+    values = ids = None
+    for step in encode_columnar_steps(frames):
+        if "values" in step or "ids" in step:
+            values, ids = step.get("values", values), step.get("ids", ids)
+            step["values"], step["ids"] = values, ids
+        expected.append(step)
+    assert steps == expected
+
+
+def test_packed_counters_beyond_uint32():
+    trace = TraceArray([2, 1])
+    frame = trace.frame({"isSorted": range(2)}, 3 * 2 ** 32, 2 ** 33 + 1, "Large counters")
+    _, (step,) = _decode_packed(encode_packed({}, [frame]))
+
+    assert step["comparisons"] == 3 * 2 ** 32
+    assert step["swaps"] == 2 ** 33 + 1
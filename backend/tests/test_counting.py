@@ -0,0 +1,91 @@
+"""
+The counts-only implementations must report what the traced engines report
+
+Every algorithm runs with every value of its options on small random,
+sorted, reversed and duplicate-heavy inputs, and the final array and
+counters of run_algorithm_counts are compared with the last frame of
+iter_algorithm_steps. The `check` hook must be able to cancel every
+implementation whose run grows faster than its input.
+"""
+from itertools import product
+import random
+
+import pytest
+
+from core.algorithm_engine import algorithm_types, iter_algorithm_steps, run_algorithm_counts
+from core.algorithm_engine.registry import get_spec
+
+
+SIZES = (0, 1, 2, 3, 7, 16, 33, 70)
+DISTRIBUTIONS = ("random", "sorted", "reversed", "duplicates")
+SEED = 0
+
+
+def _inputs():
+    for distribution in DISTRIBUTIONS:
+        for n in SIZES:
+            rng = random.Random(f"{SEED}/{distribution}/{n}")
+            if distribution == "duplicates":
+                array = [rng.randint(0, 2) for _ in range(n)]
+            else:
+                array = [rng.randint(-50, 50) for _ in range(n)]
+            if distribution == "sorted":
+                array.sort()
+            elif distribution == "reversed":
+                array.sort(reverse=True)
+            yield pytest.param(array, id=f"{distribution}-{n}")
+
+
+def _option_sets():
+    for algorithm_type in algorithm_types():
+        spec = get_spec(algorithm_type)
+        # Options without a fixed set of values (the random pivot seed) get one sample value
+        names = list(spec.options)
+        choices = [spec.options[name] or (7,) for name in names]
+        yield pytest.param(algorithm_type, None, id=algorithm_type)
+        for values in product(*choices):
+            options = dict(zip(names, values))
+            label = ",".join(f"{name}={value}" for name, value in options.items())
+            yield pytest.param(algorithm_type, options, id=f"{algorithm_type}[{label}]")
+
+
+@pytest.mark.parametrize("algorithm_type, options", list(_option_sets()))
+@pytest.mark.parametrize("array", list(_inputs()))
+def test_counts_match_engine(algorithm_type, options, array):
+    targets = [None]
+    if get_spec(algorithm_type).needs_target:
+        array = sorted(array) if algorithm_type == "binary" else array
+        # A value in the middle of the array, if any, and one that is missing
+        targets = [array[len(array) // 2]] if array else []
+        targets.append(max(array, default=0) + 1)
+
+    for search_target in targets:
+        frames = list(iter_algorithm_steps(algorithm_type, array, search_target, options))
+        counts = run_algorithm_counts(algorithm_type, array, search_target, options)
+
+        last = frames[-1]
+        assert counts["comparisons"] == last.comparisons
+        assert counts["swaps"] == last.swaps
+        assert counts["array"] == list(last.values)
+
+
+class _Stop(Exception):
+    pass
+
+
+@pytest.mark.parametrize("algorithm_type", [
+    algorithm_type for algorithm_type in algorithm_types("sorting") if algorithm_type != "counting"
+])
+def test_check_cancels_counts(algorithm_type):
+    calls = 0
+
+    def check():
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise _Stop()
+
+    array = list(range(1000))
+    random.Random(SEED).shuffle(array)
+    with pytest.raises(_Stop):
+        run_algorithm_counts(algorithm_type, array, check=check)
@@ -0,0 +1,61 @@
+"""
+Decimated traces must fit the max_steps budget
+
+The first frame and the final state always survive, kept frames stay in
+trace order, and key frames are kept whenever the budget can hold them all.
+"""
+import random
+
+import pytest
+
+from core.algorithm_engine import algorithm_types, iter_algorithm_steps
+from core.algorithm_engine.decimate import decimate_frames, same_state
+from core.algorithm_engine.race import sample_frames
+from core.algorithm_engine.registry import get_spec
+
+
+def _frames(algorithm_type):
+    rng = random.Random(algorithm_type)
+    array = [rng.randint(0, 30) for _ in range(30)]
+    if get_spec(algorithm_type).needs_target:
+        return list(iter_algorithm_steps(algorithm_type, sorted(array), array[7]))
+    return list(iter_algorithm_steps(algorithm_type, array))
+
+
+def _is_subsequence(kept, frames):
+    remaining = iter(frames)
+    return all(any(frame is candidate for candidate in remaining) for frame in kept)
+
+
+@pytest.mark.parametrize("algorithm_type", algorithm_types())
+@pytest.mark.parametrize("max_steps", [2, 3, 5, 16, 100])
+def test_decimate_within_budget(algorithm_type, max_steps):
+    frames = _frames(algorithm_type)
+    total, kept = decimate_frames(iter(frames), max_steps)
+
+    assert total == len(frames)
+    assert len(kept) <= max_steps
+    assert _is_subsequence(kept, frames)
+    assert same_state(kept[0], frames[0])
+    assert same_state(kept[-1], frames[-1])
+
+
+@pytest.mark.parametrize("algorithm_type", algorithm_types())
+def test_decimate_keeps_key_frames(algorithm_type):
+    frames = _frames(algorithm_type)
+    keys = [frame for frame in frames if frame.key]
+    _, kept = decimate_frames(iter(frames), len(keys) + 2)
+
+    assert all(any(frame is candidate for candidate in kept) for frame in keys)
+
+
+@pytest.mark.parametrize("max_frames", [1, 2, 7, 64])
+def test_sample_frames_keeps_last(max_frames):
+    frames = _frames("merge")
+    total, indices, samples = sample_frames(iter(frames), max_frames)
+
+    assert total == len(frames)
+    assert len(samples) <= max_frames + 1
+    assert indices == sorted(set(indices))
+    assert indices[0] == 0 and indices[-1] == total - 1
+    assert all(frames[index] is frame for index, frame in zip(indices, samples))
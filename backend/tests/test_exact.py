@@ -0,0 +1,46 @@
+"""
+Exact counts must match the counts-only implementations
+
+The closed forms of bubble, insertion and selection sort replace a
+simulation, so they are compared with it on the same inputs as
+test_counting; algorithms whose counting can be quadratic must not be
+classified as cheap.
+"""
+import pytest
+
+from core.algorithm_engine import run_algorithm_counts
+from core.analyzer import count_inversions, exact_counts_are_fast, exact_operation_counts
+
+from .test_counting import _inputs
+
+
+@pytest.mark.parametrize("algorithm_type", ["bubble", "insertion", "selection"])
+@pytest.mark.parametrize("array", list(_inputs()))
+def test_closed_form_matches_counts(algorithm_type, array):
+    counts = run_algorithm_counts(algorithm_type, array)
+    exact = exact_operation_counts(algorithm_type, array)
+    assert exact == {"comparisons": counts["comparisons"], "swaps": counts["swaps"]}
+
+
+@pytest.mark.parametrize("array", list(_inputs()))
+def test_count_inversions(array):
+    expected = sum(
+        1 for i in range(len(array)) for j in range(i + 1, len(array)) if array[i] > array[j]
+    )
+    assert count_inversions(array) == expected
+
+
+@pytest.mark.parametrize("algorithm_type, options, fast", [
+    ("bubble", None, True),
+    ("bubble", {"variant": "early_exit"}, False),
+    ("insertion", {"variant": "binary"}, False),
+    ("quick", None, False),
+    ("quick", {"variant": "three_way"}, False),
+    ("shell", {"variant": "ciura"}, False),
+    ("merge", None, True),
+    ("heap", None, True),
+    ("tim", None, True),
+    ("binary", None, True),
+])
+def test_exact_counts_are_fast(algorithm_type, options, fast):
+    assert exact_counts_are_fast(algorithm_type, options) is fast
@@ -0,0 +1,62 @@
+"""
+The engine executor must stay usable after it gives up on a job
+
+A job that ignores its cancel token is abandoned on timeout; the next job
+has to run in a free worker instead of queueing behind it.
+"""
+import asyncio
+import time
+
+import pytest
+
+from core.utils.executor import EngineExecutor, JobTimeout
+
+
+def _sleep(seconds, token):
+    time.sleep(seconds)
+    return seconds
+
+
+def _checked_sleep(seconds, token):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        token.check()
+        time.sleep(0.001)
+    return seconds
+
+
+@pytest.fixture(params=["process", "thread"])
+def executor(request):
+    executor = EngineExecutor(request.param, max_workers=1, timeout=0.5)
+    yield executor
+    executor.shutdown()
+
+
+def test_quick_job_after_timeout(executor):
+    # A thread cannot be killed, so the thread pool relies on the job checking its token
+    job = _sleep if executor.kind == "process" else _checked_sleep
+
+    async def scenario():
+        with pytest.raises(JobTimeout):
+            await executor.run(job, 60)
+        return await executor.run(_sleep, 0.01)
+
+    start = time.monotonic()
+    assert asyncio.run(scenario()) == 0.01
+    assert time.monotonic() - start < 5
+
+
+def test_jobs_of_a_retired_pool_are_resubmitted():
+    executor = EngineExecutor("process", max_workers=2, timeout=0.5)
+
+    async def scenario():
+        other = asyncio.ensure_future(executor.run(_sleep, 1, timeout=10))
+        await asyncio.sleep(0.2)
+        with pytest.raises(JobTimeout):
+            await executor.run(_sleep, 60)
+        return await other
+
+    try:
+        assert asyncio.run(scenario()) == 1
+    finally:
+        executor.shutdown()
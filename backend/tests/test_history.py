@@ -0,0 +1,124 @@
+"""
+History pages and statistics must agree with the stored executions
+
+Executions go through the history writer into a temporary database; keyset
+pages must list every row exactly once, newest first, and the rollups
+behind /api/stats must add up to the same runs and means as the rows.
+"""
+from collections import defaultdict
+from datetime import datetime, timedelta
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import ensure_schema, get_db
+from database.models import AlgorithmExecution
+from database.writer import HistoryWriter
+from main import app
+
+START = datetime(2026, 1, 1, 10, 0)
+
+
+def _executions():
+    rng = random.Random(0)
+    rows = []
+    for index in range(40):
+        rows.append({
+            "algorithm_type": rng.choice(["bubble", "merge"]),
+            "algorithm_name": "",
+            "category": "sorting",
+            "array_size": rng.randint(1, 500),
+            "comparisons": rng.randint(0, 10 ** 5),
+            "swaps": rng.randint(0, 10 ** 5),
+            # Several rows share a timestamp, so pages must also order by id
+            "timestamp": START + timedelta(minutes=37 * (index // 3))
+        })
+    return rows
+
+
+@pytest.fixture
+def client(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'history.db'}", connect_args={"check_same_thread": False})
+    ensure_schema(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    writer = HistoryWriter(session_factory=session_factory, batch_size=7)
+    rows = _executions()
+    writer.submit_many(AlgorithmExecution, rows[:25])
+    for values in rows[25:]:
+        writer.submit(AlgorithmExecution, **values)
+    writer.stop()
+    assert writer.written == len(rows)
+
+    def get_test_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = get_test_db
+    try:
+        yield TestClient(app), rows
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        engine.dispose()
+
+
+@pytest.mark.parametrize("algorithm_type", [None, "merge"])
+def test_keyset_pages_cover_every_row(client, algorithm_type):
+    client, rows = client
+    params = {"limit": 6}
+    if algorithm_type:
+        params["algorithm_type"] = algorithm_type
+    expected = [row for row in rows if algorithm_type in (None, row["algorithm_type"])]
+
+    entries = []
+    cursor = None
+    while True:
+        page = client.get("/api/history", params={**params, **({"cursor": cursor} if cursor else {})}).json()
+        assert page["total"] == len(expected)
+        entries.extend(page["entries"])
+        cursor = page.get("next_cursor")
+        if cursor is None:
+            break
+
+    keys = [(entry["timestamp"], entry["id"]) for entry in entries]
+    assert keys == sorted(keys, reverse=True)
+    assert len(set(entry["id"] for entry in entries)) == len(expected)
+
+
+def test_invalid_cursor(client):
+    client, _ = client
+    assert client.get("/api/history", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_rollups_match_rows(client):
+    client, rows = client
+    stats = client.get("/api/stats", params={"granularity": "hour"}).json()
+
+    by_algorithm = defaultdict(list)
+    for row in rows:
+        by_algorithm[row["algorithm_type"]].append(row)
+
+    assert {entry["algorithm_type"] for entry in stats["algorithms"]} == set(by_algorithm)
+    for entry in stats["algorithms"]:
+        algorithm_rows = by_algorithm[entry["algorithm_type"]]
+        assert entry["runs"] == len(algorithm_rows)
+        assert entry["mean_comparisons"] == pytest.approx(
+            sum(row["comparisons"] for row in algorithm_rows) / len(algorithm_rows)
+        )
+        assert entry["mean_array_size"] == pytest.approx(
+            sum(row["array_size"] for row in algorithm_rows) / len(algorithm_rows)
+        )
+        assert sum(bin_["count"] for bin_ in entry["array_size_histogram"]) == len(algorithm_rows)
+
+        hours = defaultdict(int)
+        for row in algorithm_rows:
+            hours[row["timestamp"].replace(minute=0)] += 1
+        assert [(bucket["bucket_start"], bucket["runs"]) for bucket in entry["buckets"]] == [
+            (hour.isoformat(), runs) for hour, runs in sorted(hours.items())
+        ]
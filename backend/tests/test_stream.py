@@ -0,0 +1,20 @@
+"""
+The stream endpoint must reject options it cannot honor
+
+It always sends the whole trace, so counters-only and paged requests get a
+400 instead of a full trace they did not ask for.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("options", [{"trace": False}, {"page_size": 10}])
+def test_stream_rejects_unsupported_options(options):
+    response = client.post(
+        "/api/execute-algorithm/stream", json={"algorithm_type": "bubble", "array": [3, 1, 2], **options}
+    )
+    assert response.status_code == 400
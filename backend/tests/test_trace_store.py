@@ -0,0 +1,50 @@
+"""
+Stored traces must page back to the frames they were built from
+
+Traces are kept as keyframes plus deltas, and the store evicts by count
+and by estimated size. The trace formats themselves are tested in
+test_trace.
+"""
+import random
+
+import pytest
+
+from core.algorithm_engine import iter_algorithm_steps
+from core.algorithm_engine.trace import encode_steps
+from core.algorithm_engine.trace_store import StoredTrace, TraceStore
+
+
+def _frames(algorithm_type="quick", n=40):
+    array = [random.Random(n).randint(0, 20) for _ in range(n)]
+    return list(iter_algorithm_steps(algorithm_type, array))
+
+
+@pytest.mark.parametrize("keyframe_interval", [1, 5, 32])
+@pytest.mark.parametrize("start, stop", [(0, 10), (3, 4), (7, 61), (50, 10 ** 6)])
+def test_pages_match_frames(keyframe_interval, start, stop):
+    frames = _frames()
+    trace = StoredTrace(frames, keyframe_interval)
+
+    assert len(trace) == len(frames)
+    assert trace.total_comparisons == frames[-1].comparisons
+    page = trace.get_steps(start, stop)
+    assert list(encode_steps(page, "snapshot")) == list(encode_steps(frames[start:stop], "snapshot"))
+
+
+def test_eviction_by_count_and_bytes():
+    traces = [StoredTrace(_frames(n=n), 8) for n in (30, 40, 50)]
+
+    store = TraceStore(max_traces=2, keyframe_interval=8)
+    ids = [store.add(trace) for trace in traces]
+    assert store.get(ids[0]) is None
+    assert store.get(ids[2]) is traces[2]
+
+    store = TraceStore(max_traces=64, keyframe_interval=8, max_bytes=traces[1].nbytes + traces[2].nbytes)
+    ids = [store.add(trace) for trace in traces]
+    assert store.get(ids[0]) is None
+    assert store.get(ids[1]) is traces[1]
+    assert store.get(ids[2]) is traces[2]
+
+    store = TraceStore(keyframe_interval=8, max_bytes=traces[0].nbytes - 1)
+    with pytest.raises(ValueError):
+        store.add(traces[0])
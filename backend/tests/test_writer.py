@@ -0,0 +1,28 @@
+"""
+The history writer must never block a request
+
+Rows submitted while the queue is full are dropped and counted instead.
+"""
+from database.models import AlgorithmExecution
+from database.writer import HistoryWriter
+
+
+def _row(index):
+    return {
+        "algorithm_type": "bubble", "algorithm_name": "Bubble Sort", "array_size": index,
+        "comparisons": 0, "swaps": 0, "category": "sorting"
+    }
+
+
+def test_full_queue_drops_rows():
+    writer = HistoryWriter(max_queue=2)
+    # Keep the writer thread from draining the queue
+    writer.start = lambda: None
+
+    writer.submit(AlgorithmExecution, **_row(0))
+    writer.submit_many(AlgorithmExecution, [_row(1), _row(2)])
+    writer.submit(AlgorithmExecution, **_row(3))
+    writer.submit_many(AlgorithmExecution, [_row(4), _row(5)])
+
+    assert writer.stats()["pending"] == 2
+    assert writer.dropped == 3
@@ -28,6 +28,47 @@ export interface AlgorithmStep {
   description: string;
 }
 
+export type TraceFormat = 'snapshot' | 'delta' | 'columnar';
+
+/**
+ * Engine options; each algorithm accepts only its own (e.g. pivot and seed for quick sort)
+ */
+export interface EngineOptions {
+  pivot?: 'last' | 'median3' | 'random' | 'ninther';
+  seed?: number;
+  /** bubble: standard | early_exit | cocktail; insertion: linear | binary; quick: lomuto | three_way; merge: top_down | bottom_up; shell: shell | knuth | ciura */
+  variant?: string;
+  /** Decimate the trace to at most this many steps, preferring key events */
+  max_steps?: number;
+}
+
+/**
+ * Step of a delta-encoded trace. The first step carries the full array;
+ * later steps carry only the operations applied to the previous array and
+ * the ranges ([start, stop)) where each flag is set in that step.
+ */
+export interface DeltaStep {
+  array?: AlgorithmStep['array'];
+  ops: Array<['swap', number, number] | ['write', number, number, number]>;
+  marks: Record<string, Array<[number, number]>>;
+  comparisons: number;
+  swaps: number;
+  description: string;
+}
+
+/**
+ * Step of a columnar trace. `values` and `ids` are only present when they
+ * changed since the previous step; flags are [start, stop) ranges.
+ */
+export interface ColumnarStep {
+  values?: number[];
+  ids?: number[];
+  flags: Record<string, Array<[number, number]>>;
+  comparisons: number;
+  swaps: number;
+  description: string;
+}
+
 export interface ComplexityInfo {
   time_best: string;
   time_average: string;
@@ -35,17 +76,22 @@ export interface ComplexityInfo {
   space: string;
   stable: boolean;
   in_place: boolean;
+  variant?: string | null;
 }
 
 export interface ExecuteAlgorithmResponse {
   algorithm_type: string;
   algorithm_name: string;
+  format?: TraceFormat;
   steps: AlgorithmStep[];
   complexity: ComplexityInfo;
   total_comparisons: number;
   total_swaps: number;
+  /** When the result was computed; cached responses keep the time of the original run */
   timestamp: string;
   category: string;
+  /** Steps the engine produced, when the trace was decimated with max_steps */
+  source_steps?: number;
 }
 
 export interface AnalyzeComplexityResponse {
@@ -63,6 +109,7 @@ export interface AnalyzeComplexityResponse {
 export interface AIQueryResponse {
   response: string;
   timestamp: string;
+  cached?: boolean;
 }
 
 export interface HistoryEntry {
@@ -77,15 +124,124 @@ export interface HistoryEntry {
 export interface HistoryResponse {
   entries: HistoryEntry[];
   total: number;
+  next_cursor?: string;
+}
+
+export interface StatsBucket {
+  bucket_start: string;
+  runs: number;
+  mean_comparisons: number;
+  mean_swaps: number;
+  mean_array_size: number;
+}
+
+export interface AlgorithmStats {
+  algorithm_type: string;
+  runs: number;
+  mean_comparisons: number;
+  mean_swaps: number;
+  mean_array_size: number;
+  comparisons_percentiles: Record<string, number>;
+  swaps_percentiles: Record<string, number>;
+  array_size_histogram: { low: number; high: number; count: number }[];
+  buckets: StatsBucket[];
+}
+
+export interface StatsResponse {
+  granularity: 'hour' | 'day';
+  since?: string;
+  until?: string;
+  algorithms: AlgorithmStats[];
+}
+
+/**
+ * Replay a delta-encoded trace into full snapshot steps
+ */
+export function replayDeltaSteps(steps: DeltaStep[]): AlgorithmStep[] {
+  const snapshots: AlgorithmStep[] = [];
+  let state: Array<{ value: number; id: number }> = [];
+
+  for (const step of steps) {
+    if (step.array) {
+      state = step.array.map(({ value, id }) => ({ value, id }));
+      snapshots.push({
+        array: step.array,
+        comparisons: step.comparisons,
+        swaps: step.swaps,
+        description: step.description,
+      });
+      continue;
+    }
+
+    for (const op of step.ops) {
+      if (op[0] === 'swap') {
+        [state[op[1]], state[op[2]]] = [state[op[2]], state[op[1]]];
+      } else {
+        state[op[1]] = { value: op[2], id: op[3] };
+      }
+    }
+
+    const array: AlgorithmStep['array'] = state.map((el) => ({ ...el }));
+    for (const [flag, ranges] of Object.entries(step.marks)) {
+      for (const [start, stop] of ranges) {
+        for (let idx = start; idx < stop; idx++) {
+          (array[idx] as Record<string, unknown>)[flag] = true;
+        }
+      }
+    }
+
+    snapshots.push({
+      array,
+      comparisons: step.comparisons,
+      swaps: step.swaps,
+      description: step.description,
+    });
+  }
+
+  return snapshots;
+}
+
+/**
+ * Expand a columnar trace into full snapshot steps
+ */
+export function replayColumnarSteps(steps: ColumnarStep[]): AlgorithmStep[] {
+  let values: number[] = [];
+  let ids: number[] = [];
+
+  return steps.map((step) => {
+    values = step.values ?? values;
+    ids = step.ids ?? ids;
+
+    const array: AlgorithmStep['array'] = values.map((value, idx) => ({ value, id: ids[idx] }));
+    for (const [flag, ranges] of Object.entries(step.flags)) {
+      for (const [start, stop] of ranges) {
+        for (let idx = start; idx < stop; idx++) {
+          (array[idx] as Record<string, unknown>)[flag] = true;
+        }
+      }
+    }
+
+    return {
+      array,
+      comparisons: step.comparisons,
+      swaps: step.swaps,
+      description: step.description,
+    };
+  });
 }
 
 /**
  * Execute an algorithm on the backend
+ *
+ * Delta and columnar traces are requested from the backend and replayed
+ * locally, so the returned steps are always full snapshots.
  */
 export async function runAlgorithm(
   algorithmType: string,
   array: number[],
-  searchTarget?: number
+  searchTarget?: number,
+  format: TraceFormat = 'snapshot',
+  options: EngineOptions = {}
 ): Promise<ExecuteAlgorithmResponse> {
   try {
     const response = await fetch(`${API_BASE_URL}/execute-algorithm`, {
@@ -97,6 +253,8 @@ export async function runAlgorithm(
         algorithm_type: algorithmType,
         array: array,
         search_target: searchTarget,
+        format: format,
+        ...options,
       }),
     });
 
@@ -105,19 +263,198 @@ export async function runAlgorithm(
       throw new Error(error.detail || 'Failed to execute algorithm');
     }
 
-    return await response.json();
+    const result = await response.json();
+    if (result.format === 'delta') {
+      result.steps = replayDeltaSteps(result.steps as DeltaStep[]);
+    } else if (result.format === 'columnar') {
+      result.steps = replayColumnarSteps(result.steps as ColumnarStep[]);
+    }
+    return result;
   } catch (error) {
     console.error('Error executing algorithm:', error);
     throw error;
   }
 }
 
+/**
+ * Execute an algorithm and receive its steps as they are produced
+ *
+ * Reads the newline-delimited JSON stream from the backend and calls
+ * `onStep` for every step, so playback can start before the run finishes.
+ * Delta and columnar steps are passed through as-is; use `replayDeltaSteps` or
+ * `replayColumnarSteps` to expand them.
+ */
+export async function streamAlgorithm(
+  algorithmType: string,
+  array: number[],
+  onStep: (step: AlgorithmStep | DeltaStep | ColumnarStep, index: number) => void,
+  searchTarget?: number,
+  format: TraceFormat = 'snapshot',
+  options: EngineOptions = {}
+): Promise<{ total_steps: number; total_comparisons: number; total_swaps: number; source_steps?: number }> {
+  const response = await fetch(`${API_BASE_URL}/execute-algorithm/stream`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      Accept: 'application/x-ndjson',
+    },
+    body: JSON.stringify({
+      algorithm_type: algorithmType,
+      array: array,
+      search_target: searchTarget,
+      format: format,
+      ...options,
+    }),
+  });
+
+  if (!response.ok || !response.body) {
+    const error = await response.json().catch(() => ({}));
+    throw new Error(error.detail || 'Failed to execute algorithm');
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let index = 0;
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let newline = buffer.indexOf('\n');
+    while (newline !== -1) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      newline = buffer.indexOf('\n');
+      if (!line) continue;
+
+      const message = JSON.parse(line);
+      if (message.event === 'step') {
+        onStep(message.data, index++);
+      } else if (message.event === 'end') {
+        return message.data;
+      } else if (message.event === 'error') {
+        throw new Error(message.data.detail);
+      }
+    }
+  }
+
+  throw new Error('Stream ended before the algorithm completed');
+}
+
+export interface RaceEntry {
+  algorithm_type: string;
+  algorithm_name: string;
+  rank: number;
+  comparisons: number;
+  swaps: number;
+  seconds: number;
+  total_steps?: number;
+  steps?: (AlgorithmStep | DeltaStep | ColumnarStep)[];
+}
+
+export interface CompareAlgorithmsResponse {
+  array_size: number;
+  format: TraceFormat;
+  timeline?: number[];
+  results: RaceEntry[];
+  timestamp: string;
+}
+
+/**
+ * Run several sorting algorithms on the same array; with frames set every trace is
+ * downsampled to that many steps, aligned on a common step timeline
+ */
+export async function compareAlgorithms(
+  array: number[],
+  algorithms?: string[],
+  frames?: number,
+  format: TraceFormat = 'columnar'
+): Promise<CompareAlgorithmsResponse> {
+  const response = await fetch(`${API_BASE_URL}/compare`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ array, algorithms, frames, format }),
+  });
+
+  if (!response.ok) {
+    const error = await response.json().catch(() => ({}));
+    throw new Error(error.detail || 'Failed to compare algorithms');
+  }
+
+  return await response.json();
+}
+
+export interface BatchJob extends EngineOptions {
+  algorithm_type: string;
+  array: number[];
+  search_target?: number;
+  trace?: boolean;
+}
+
+/**
+ * Execute many algorithm runs in one request; onResult is called as each job finishes
+ */
+export async function executeBatch(
+  jobs: BatchJob[],
+  onResult: (index: number, result: ExecuteAlgorithmResponse) => void,
+  onError?: (index: number, status: number, detail: string) => void,
+  format: TraceFormat = 'snapshot'
+): Promise<{ succeeded: number; failed: number; timestamp: string }> {
+  const response = await fetch(`${API_BASE_URL}/execute-batch`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      Accept: 'application/x-ndjson',
+    },
+    body: JSON.stringify({ jobs, format }),
+  });
+
+  if (!response.ok || !response.body) {
+    const error = await response.json().catch(() => ({}));
+    throw new Error(error.detail || 'Failed to execute batch');
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let newline = buffer.indexOf('\n');
+    while (newline !== -1) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      newline = buffer.indexOf('\n');
+      if (!line) continue;
+
+      const message = JSON.parse(line);
+      if (message.event === 'result') {
+        onResult(message.data.index, message.data.response);
+      } else if (message.event === 'error') {
+        onError?.(message.data.index, message.data.status, message.data.detail);
+      } else if (message.event === 'end') {
+        return message.data;
+      }
+    }
+  }
+
+  throw new Error('Stream ended before the batch completed');
+}
+
 /**
  * Get complexity analysis for an algorithm
  */
 export async function getComplexity(
   algorithmType: string,
-  arraySize: number
+  arraySize: number,
+  variant?: string
 ): Promise<AnalyzeComplexityResponse> {
   try {
     const response = await fetch(`${API_BASE_URL}/analyze-complexity`, {
@@ -128,6 +465,7 @@ export async function getComplexity(
       body: JSON.stringify({
         algorithm_type: algorithmType,
         array_size: arraySize,
+        variant,
       }),
     });
 
@@ -174,12 +512,78 @@ export async function askAI(
   }
 }
 
+/**
+ * Query the AI assistant and receive the answer chunk by chunk as it is generated
+ */
+export async function streamAI(
+  userQuery: string,
+  onToken: (text: string) => void,
+  context?: string
+): Promise<{ cached: boolean; timestamp: string }> {
+  const response = await fetch(`${API_BASE_URL}/ai/query/stream`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      Accept: 'text/event-stream',
+    },
+    body: JSON.stringify({
+      user_query: userQuery,
+      context: context,
+    }),
+  });
+
+  if (!response.ok || !response.body) {
+    const error = await response.json().catch(() => ({}));
+    throw new Error(error.detail || 'Failed to query AI');
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary = buffer.indexOf('\n\n');
+    while (boundary !== -1) {
+      const block = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      boundary = buffer.indexOf('\n\n');
+
+      let event = 'message';
+      let data = '';
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      }
+      if (!data) continue;
+
+      const payload = JSON.parse(data);
+      if (event === 'token') {
+        onToken(payload.text);
+      } else if (event === 'end') {
+        return payload;
+      } else if (event === 'error') {
+        throw new Error(payload.detail);
+      }
+    }
+  }
+
+  throw new Error('Stream ended before the answer completed');
+}
+
 /**
  * Get algorithm execution history
+ * Pass the previous page's next_cursor as cursor to fetch the following page;
+ * set flush to include executions the server has not written yet
  */
 export async function getHistory(
   algorithmType?: string,
-  limit: number = 50
+  limit: number = 50,
+  cursor?: string,
+  flush: boolean = false
 ): Promise<HistoryResponse> {
   try {
     const params = new URLSearchParams();
@@ -187,6 +591,12 @@ export async function getHistory(
       params.append('algorithm_type', algorithmType);
     }
     params.append('limit', limit.toString());
+    if (cursor) {
+      params.append('cursor', cursor);
+    }
+    if (flush) {
+      params.append('flush', 'true');
+    }
 
     const response = await fetch(`${API_BASE_URL}/history?${params.toString()}`, {
       method: 'GET',
@@ -207,6 +617,52 @@ export async function getHistory(
   }
 }
 
+/**
+ * Get aggregate execution statistics per algorithm
+ * Set flush to include executions the server has not written yet
+ */
+export async function getStats(
+  granularity: 'hour' | 'day' = 'day',
+  algorithmType?: string,
+  since?: string,
+  until?: string,
+  flush: boolean = false
+): Promise<StatsResponse> {
+  try {
+    const params = new URLSearchParams();
+    params.append('granularity', granularity);
+    if (algorithmType) {
+      params.append('algorithm_type', algorithmType);
+    }
+    if (since) {
+      params.append('since', since);
+    }
+    if (until) {
+      params.append('until', until);
+    }
+    if (flush) {
+      params.append('flush', 'true');
+    }
+
+    const response = await fetch(`${API_BASE_URL}/stats?${params.toString()}`, {
+      method: 'GET',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+    });
+
+    if (!response.ok) {
+      const error = await response.json();
+      throw new Error(error.detail || 'Failed to fetch stats');
+    }
+
+    return await response.json();
+  } catch (error) {
+    console.error('Error fetching stats:', error);
+    throw error;
+  }
+}
+
 /**
  * Check API health
  */